@@ -0,0 +1,11 @@
+"""Read-only HTTP API over precomputed resort snapshots."""
+
+from .snapshots import build_snapshots, slugify
+from .server import SnapshotStore, serve
+
+__all__ = [
+    "build_snapshots",
+    "slugify",
+    "SnapshotStore",
+    "serve",
+]
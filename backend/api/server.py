@@ -0,0 +1,234 @@
+"""
+Resort conditions HTTP API.
+
+Serves the precomputed snapshots from api/snapshots.py out of memory:
+
+    GET /resorts
+    GET /resorts/{name}/conditions
+    GET /resorts/{name}/forecast
+    GET /health
+
+    python -m api.server --port 8000
+
+``{name}`` is the resort name or its slug ("Sunday River", "sunday-river").
+Every response body is encoded, gzipped and hashed once when the snapshots
+are loaded, so a request is a dictionary lookup. Clients revalidate with
+If-None-Match and get a 304 while the snapshot is unchanged. The store
+reloads when a rebuild replaces manifest.json.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+from urllib.parse import unquote, urlsplit
+
+from .snapshots import SNAPSHOT_ROOT, slugify
+
+# Origin allowed to call the API from a browser (the React app)
+CORS_ORIGIN = os.getenv("API_CORS_ORIGIN", "*")
+
+# Bodies smaller than this aren't worth compressing
+GZIP_MIN_BYTES = 512
+
+
+class Response(NamedTuple):
+    """A pre-encoded response body."""
+    body: bytes
+    gzipped: Optional[bytes]
+    etag: str
+
+
+def _response(body: bytes) -> Response:
+    gzipped = gzip.compress(body, compresslevel=6, mtime=0) if len(body) >= GZIP_MIN_BYTES else None
+    return Response(body, gzipped, '"' + hashlib.sha1(body).hexdigest()[:20] + '"')
+
+
+class SnapshotStore:
+    """
+    In-memory copy of the snapshot directory, keyed by request path.
+
+    Args:
+        root: Snapshot directory
+        check_interval: Seconds between checks for a newer manifest
+    """
+
+    def __init__(self, root: str = SNAPSHOT_ROOT, check_interval: float = 1.0):
+        self.root = Path(root)
+        self.check_interval = check_interval
+
+        self._responses: Dict[str, Response] = {}
+        self._manifest_stat = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+        self.reload()
+
+    def _read(self, path: Path) -> bytes:
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def reload(self):
+        """Load every snapshot listed in resorts.json."""
+        manifest = self.root / "manifest.json"
+        try:
+            stat = manifest.stat()
+        except FileNotFoundError:
+            stat = None
+
+        responses = {}
+        if stat is not None:
+            resorts_body = self._read(self.root / "resorts.json")
+            responses["/resorts"] = _response(resorts_body)
+
+            for resort in json.loads(resorts_body)["resorts"]:
+                for endpoint in ("conditions", "forecast"):
+                    path = self.root / "resorts" / resort["slug"] / f"{endpoint}.json"
+                    responses[f"/resorts/{resort['slug']}/{endpoint}"] = _response(self._read(path))
+
+            responses["/health"] = _response(self._read(manifest))
+
+        with self._lock:
+            self._responses = responses
+            self._manifest_stat = (stat.st_mtime_ns, stat.st_size) if stat else None
+
+    def _maybe_reload(self):
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+
+        try:
+            stat = (self.root / "manifest.json").stat()
+            current = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            current = None
+
+        if current != self._manifest_stat:
+            try:
+                self.reload()
+            except (OSError, ValueError) as e:
+                # Rebuild in progress; keep serving the last good snapshots
+                print(f"  ⚠ Snapshot reload failed: {e}")
+
+    def get(self, path: str) -> Optional[Response]:
+        """
+        Look up the response for a request path.
+
+        Args:
+            path: URL path like "/resorts/Sunday%20River/forecast"
+
+        Returns:
+            Response, or None if there is no such resource
+        """
+        self._maybe_reload()
+
+        parts = [unquote(part) for part in path.strip("/").split("/")]
+        if len(parts) == 3 and parts[0] == "resorts":
+            parts[1] = slugify(parts[1])
+
+        return self._responses.get("/" + "/".join(parts))
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+
+class ResortAPIHandler(BaseHTTPRequestHandler):
+    """Request handler serving a SnapshotStore (set as ``store`` on the class)."""
+
+    store: SnapshotStore = None
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle on, keep-alive
+    # clients wait ~40 ms for the delayed ACK between them
+    disable_nagle_algorithm = True
+    server_version = "ResortAPI/1.0"
+
+    def _send(self, status: int, response: Optional[Response] = None, head: bool = False):
+        self.send_response(status)
+        self.send_header("Access-Control-Allow-Origin", CORS_ORIGIN)
+        self.send_header("Vary", "Accept-Encoding")
+
+        body = b""
+        if response is not None:
+            self.send_header("ETag", response.etag)
+            self.send_header("Cache-Control", "public, max-age=60, must-revalidate")
+            if status == 200:
+                self.send_header("Content-Type", "application/json")
+                body = response.body
+                if response.gzipped and "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = response.gzipped
+                    self.send_header("Content-Encoding", "gzip")
+
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body and not head:
+            self.wfile.write(body)
+
+    def _handle(self, head: bool = False):
+        response = self.store.get(urlsplit(self.path).path)
+        if response is None:
+            self._send(404, head=head)
+            return
+
+        etags = self.headers.get("If-None-Match", "")
+        if response.etag in etags or etags.strip() == "*":
+            self._send(304, response, head=head)
+        else:
+            self._send(200, response, head=head)
+
+    def do_GET(self):
+        self._handle()
+
+    def do_HEAD(self):
+        self._handle(head=True)
+
+    def log_message(self, format, *args):
+        # Per-request logging to stderr costs more than serving the request
+        pass
+
+
+def serve(host: str = "127.0.0.1", port: int = 8000, root: str = SNAPSHOT_ROOT) -> ThreadingHTTPServer:
+    """
+    Create the API server (call serve_forever() on the result).
+
+    Args:
+        host: Interface to bind
+        port: Port to bind
+        root: Snapshot directory
+
+    Returns:
+        ThreadingHTTPServer
+    """
+    handler = type("Handler", (ResortAPIHandler,), {"store": SnapshotStore(root)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve resort conditions from precomputed snapshots")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--snapshots", default=SNAPSHOT_ROOT, help="Snapshot directory")
+    parser.add_argument("--build", action="store_true", help="Rebuild snapshots before serving")
+    args = parser.parse_args()
+
+    if args.build:
+        from .snapshots import build_snapshots
+        build_snapshots(args.snapshots)
+
+    server = serve(args.host, args.port, args.snapshots)
+    print(f"✓ Serving {len(server.RequestHandlerClass.store)} resources on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,125 @@
+"""
+Precomputed JSON snapshots served by the resort API.
+
+After each load the gold tables are read once and written out as one small
+JSON document per endpoint, so serving a request never touches DuckDB:
+
+    {root}/resorts.json
+    {root}/resorts/{slug}/conditions.json
+    {root}/resorts/{slug}/forecast.json
+    {root}/manifest.json            # written last; servers reload when it changes
+
+    python -m api.snapshots         # rebuild from data/weather.duckdb
+"""
+
+import json
+import os
+import re
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+SNAPSHOT_ROOT = os.getenv("API_SNAPSHOT_PATH", "data/snapshots")
+
+# Days of forecast in each forecast snapshot
+FORECAST_DAYS = 7
+
+
+def slugify(name: str) -> str:
+    """URL-safe resort name, e.g. "Sunday River" -> "sunday-river"."""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def _records(con, query: str, params: tuple = ()) -> List[dict]:
+    """Run a query and return JSON-ready rows (ISO timestamps, NaN as null)."""
+    df = con.execute(query, params).df()
+    return json.loads(df.to_json(orient="records", date_format="iso"))
+
+
+def _write_json(path: Path, document):
+    """Write a JSON file atomically so servers never read a partial one."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(document, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def build_snapshots(root: str = SNAPSHOT_ROOT, resorts_path: str = "config/resorts.yaml") -> Dict[str, int]:
+    """
+    Rebuild every API snapshot from the gold tables.
+
+    Args:
+        root: Snapshot directory
+        resorts_path: Path to resorts.yaml
+
+    Returns:
+        Number of resorts and files written
+    """
+    # Imported here so the snapshot server doesn't load pydantic or duckdb
+    from config import load_resort_registry
+    from db import get_session
+    from db.analytics import GOLD_SCHEMA
+
+    root = Path(root)
+    registry = load_resort_registry(resorts_path)
+    generated_at = datetime.now(timezone.utc).isoformat()
+
+    with get_session() as con:
+        conditions = _records(con, f"SELECT * FROM {GOLD_SCHEMA}.gold_resort_conditions")
+        daily = _records(con, f"""
+            SELECT *
+            FROM {GOLD_SCHEMA}.gold_resort_daily
+            WHERE forecast_date >= current_date
+              AND forecast_date < current_date + ?
+            ORDER BY resort_key, forecast_date
+        """, (FORECAST_DAYS,))
+
+    conditions_by_name = {row["resort_name"]: row for row in conditions}
+    days_by_key: Dict[str, list] = {}
+    for row in daily:
+        days_by_key.setdefault(row.pop("resort_key"), []).append(row)
+
+    files = 0
+    index = []
+    for resort in registry:
+        slug = slugify(resort.name)
+        row = conditions_by_name.get(resort.name)
+
+        _write_json(root / "resorts" / slug / "conditions.json", {
+            "resort": resort.name,
+            "generated_at": generated_at,
+            "conditions": row,
+        })
+        _write_json(root / "resorts" / slug / "forecast.json", {
+            "resort": resort.name,
+            "generated_at": generated_at,
+            "days": days_by_key.get(row["resort_key"], []) if row else [],
+        })
+        files += 2
+
+        index.append({
+            "name": resort.name,
+            "slug": slug,
+            "full_name": resort.metadata.full_name,
+            "state": resort.state,
+            "region": resort.metadata.region,
+            "latitude": resort.location.latitude,
+            "longitude": resort.location.longitude,
+            "forecast_updated_at": row["forecast_updated_at"] if row else None,
+        })
+
+    _write_json(root / "resorts.json", {"generated_at": generated_at, "resorts": index})
+    _write_json(root / "manifest.json", {"generated_at": generated_at, "resorts": len(index)})
+
+    return {"resorts": len(index), "files": files + 2}
+
+
+if __name__ == "__main__":
+    result = build_snapshots()
+    print(f"✓ Wrote {result['files']} snapshot files for {result['resorts']} resorts to {SNAPSHOT_ROOT}")
@@ -0,0 +1,425 @@
+"""
+Synthetic weather.gov responses.
+
+Each builder returns a payload shaped like the live API (the input to the
+models in models/api.py), so it can be fed through WeatherClient parsing or
+validated and landed exactly as the collector does. Values are drawn from
+the given random.Random, so a seed reproduces the same payloads.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+from models.api import (
+    GridDataResponse,
+    GridForecastResponse,
+    HourlyForecastResponse,
+    ObservationResponse,
+    PointsResponse,
+)
+
+BASE_URL = "https://api.weather.gov"
+
+# Grid data layers: (unit, hours per value, low, high)
+GRID_LAYERS = {
+    "temperature": ("wmoUnit:degC", 1, -20.0, 5.0),
+    "dewpoint": ("wmoUnit:degC", 1, -25.0, 0.0),
+    "maxTemperature": ("wmoUnit:degC", 24, -10.0, 5.0),
+    "minTemperature": ("wmoUnit:degC", 24, -25.0, -5.0),
+    "relativeHumidity": ("wmoUnit:percent", 1, 40.0, 100.0),
+    "apparentTemperature": ("wmoUnit:degC", 1, -30.0, 2.0),
+    "windChill": ("wmoUnit:degC", 1, -35.0, 0.0),
+    "skyCover": ("wmoUnit:percent", 1, 0.0, 100.0),
+    "windDirection": ("wmoUnit:degree_(angle)", 1, 0.0, 360.0),
+    "windSpeed": ("wmoUnit:km_h-1", 1, 0.0, 50.0),
+    "windGust": ("wmoUnit:km_h-1", 1, 10.0, 110.0),
+    "probabilityOfPrecipitation": ("wmoUnit:percent", 6, 0.0, 100.0),
+    "quantitativePrecipitation": ("wmoUnit:mm", 6, 0.0, 8.0),
+    "iceAccumulation": ("wmoUnit:mm", 6, 0.0, 0.5),
+    "snowfallAmount": ("wmoUnit:mm", 6, 0.0, 60.0),
+    "snowLevel": ("wmoUnit:m", 6, 0.0, 900.0),
+    "ceilingHeight": ("wmoUnit:m", 1, 0.0, 4000.0),
+    "visibility": ("wmoUnit:m", 1, 200.0, 16000.0),
+}
+
+SHORT_FORECASTS = ["Snow", "Snow Showers", "Chance Snow", "Mostly Cloudy", "Partly Sunny", "Sunny"]
+WIND_DIRECTIONS = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
+
+# Categories the collector parses into a model before landing (model_dump());
+# the rest are landed as the raw JSON
+LANDED_MODELS = {
+    "points": PointsResponse,
+    "forecasts": GridForecastResponse,
+    "hourly": HourlyForecastResponse,
+    "grid_data": GridDataResponse,
+    "observations": ObservationResponse,
+}
+
+STATES = ["ME", "NH", "VT", "MA", "NY"]
+
+
+def _iso(value: datetime) -> str:
+    return value.astimezone(timezone.utc).isoformat() if value.tzinfo else value.isoformat() + "+00:00"
+
+
+def _quantity(value, unit: str) -> dict:
+    return {"value": value, "unitCode": unit, "qualityControl": "V"}
+
+
+def _polygon(latitude: float, longitude: float, size: float = 0.02) -> dict:
+    return {
+        "type": "Polygon",
+        "coordinates": [[
+            [longitude - size, latitude - size],
+            [longitude + size, latitude - size],
+            [longitude + size, latitude + size],
+            [longitude - size, latitude + size],
+            [longitude - size, latitude - size],
+        ]],
+    }
+
+
+def grid_location(latitude: float, longitude: float, offices: List[str] = None) -> Tuple[str, int, int, str]:
+    """
+    Derive a stable office, grid cell and forecast zone for a location.
+
+    Returns:
+        Tuple of (office, grid x, grid y, zone ID)
+    """
+    offices = offices or ["GYX", "BTV", "ALY", "BOX", "CAR", "BGM"]
+    office = offices[int(abs(latitude * 7 + longitude * 3)) % len(offices)]
+    grid_x = int((longitude + 180) * 40) % 200
+    grid_y = int((latitude + 90) * 40) % 200
+    zone = f"{office[:2]}Z{(grid_x * 7 + grid_y) % 999:03d}"
+    return office, grid_x, grid_y, zone
+
+
+def synthetic_resorts(count: int, rng: random.Random) -> List[Tuple[str, str, float, float]]:
+    """
+    Made-up resorts spread over the northeast.
+
+    Returns:
+        List of (name, state, latitude, longitude)
+    """
+    return [
+        (f"Resort{index:04d}", rng.choice(STATES), round(rng.uniform(41.5, 47.0), 4), round(rng.uniform(-75.5, -67.5), 4))
+        for index in range(count)
+    ]
+
+
+def points_payload(name: str, latitude: float, longitude: float, state: str = "ME") -> dict:
+    """Response of /points/{lat},{lon}."""
+    office, grid_x, grid_y, zone = grid_location(latitude, longitude)
+    gridpoint = f"{BASE_URL}/gridpoints/{office}/{grid_x},{grid_y}"
+    point_url = f"{BASE_URL}/points/{latitude:.4f},{longitude:.4f}"
+
+    return {
+        "@id": point_url,
+        "@type": "wx:Point",
+        "geometry": {"type": "Point", "coordinates": [longitude, latitude]},
+        "properties": {
+            "@id": point_url,
+            "@type": "wx:Point",
+            "cwa": office,
+            "forecastOffice": f"{BASE_URL}/offices/{office}",
+            "gridId": office,
+            "gridX": grid_x,
+            "gridY": grid_y,
+            "forecast": f"{gridpoint}/forecast",
+            "forecastHourly": f"{gridpoint}/forecast/hourly",
+            "forecastGridData": gridpoint,
+            "observationStations": f"{gridpoint}/stations",
+            "forecastZone": f"{BASE_URL}/zones/forecast/{zone}",
+            "county": f"{BASE_URL}/zones/county/{state}C{grid_x % 30:03d}",
+            "fireWeatherZone": f"{BASE_URL}/zones/fire/{zone}",
+            "timeZone": "America/New_York",
+            "radarStation": f"K{office}",
+            "city": name,
+            "state": state,
+            "relativeLocation": {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [longitude, latitude]},
+                "properties": {"city": name, "state": state},
+            },
+        },
+    }
+
+
+def forecast_payload(
+    rng: random.Random,
+    latitude: float,
+    longitude: float,
+    collected_at: datetime,
+    hourly: bool = False
+) -> dict:
+    """Response of /gridpoints/.../forecast (14 twelve-hour periods) or /forecast/hourly (156 hours)."""
+    step = timedelta(hours=1 if hourly else 12)
+    count = 156 if hourly else 14
+    generated = collected_at - timedelta(minutes=rng.randint(5, 55))
+    start = collected_at.replace(minute=0, second=0, microsecond=0)
+
+    periods = []
+    temperature = rng.randint(5, 30)
+    for number in range(count):
+        period_start = start + step * number
+        is_day = 6 <= period_start.hour < 18
+        temperature = max(-20, min(45, temperature + rng.randint(-3, 3)))
+        gust = rng.randint(10, 45)
+        periods.append({
+            "number": number + 1,
+            "name": "" if hourly else ("Today" if is_day else "Tonight") if number < 2 else period_start.strftime("%A"),
+            "startTime": _iso(period_start),
+            "endTime": _iso(period_start + step),
+            "isDaytime": is_day,
+            "temperature": temperature,
+            "temperatureUnit": "F",
+            "temperatureTrend": None,
+            "probabilityOfPrecipitation": {"unitCode": "wmoUnit:percent", "value": rng.randint(0, 100)},
+            "dewpoint": {"unitCode": "wmoUnit:degC", "value": round(rng.uniform(-20, 0), 1)},
+            "relativeHumidity": {"unitCode": "wmoUnit:percent", "value": rng.randint(40, 100)},
+            "windSpeed": f"{gust // 3} mph" if hourly else f"{gust // 3} to {gust // 2} mph",
+            "windDirection": rng.choice(WIND_DIRECTIONS),
+            "icon": f"{BASE_URL}/icons/land/{'day' if is_day else 'night'}/snow?size=small",
+            "shortForecast": rng.choice(SHORT_FORECASTS),
+            "detailedForecast": "" if hourly else "Snow likely. Cloudy, with a high near 25.",
+        })
+
+    return {
+        "@context": ["https://geojson.org/geojson-ld/geojson-context.jsonld"],
+        "type": "Feature",
+        "geometry": _polygon(latitude, longitude),
+        "properties": {
+            "units": "us",
+            "forecastGenerator": "HourlyForecastGenerator" if hourly else "BaselineForecastGenerator",
+            "generatedAt": _iso(collected_at),
+            "updateTime": _iso(generated),
+            "validTimes": f"{_iso(start)}/P7DT13H",
+            "elevation": {"unitCode": "wmoUnit:m", "value": round(rng.uniform(300, 1200), 1)},
+            "periods": periods,
+        },
+    }
+
+
+def _layer(rng: random.Random, start: datetime, days: int, unit: str, hours: int, low: float, high: float) -> dict:
+    """One grid layer: values over ISO8601 intervals, runs of equal values merged like the API does."""
+    duration = "P1D" if hours == 24 else f"PT{hours}H"
+    values = []
+    value_time = start
+    end = start + timedelta(days=days)
+    while value_time < end:
+        value = round(rng.uniform(low, high), 2)
+        if values and rng.random() < 0.3:
+            # Extend the previous interval instead (e.g. "PT3H")
+            previous = values[-1]
+            previous_start, previous_duration = previous["validTime"].split("/")
+            previous_hours = int(previous_duration[2:-1]) if previous_duration.startswith("PT") else 24
+            previous["validTime"] = f"{previous_start}/PT{previous_hours + hours}H"
+        else:
+            values.append({"validTime": f"{_iso(value_time)}/{duration}", "value": value})
+        value_time += timedelta(hours=hours)
+    return {"uom": unit, "values": values}
+
+
+def grid_data_payload(
+    rng: random.Random,
+    latitude: float,
+    longitude: float,
+    collected_at: datetime,
+    days: int = 7
+) -> dict:
+    """Response of /gridpoints/{office}/{x},{y}: raw forecast layers."""
+    office, grid_x, grid_y, _ = grid_location(latitude, longitude)
+    start = collected_at.replace(minute=0, second=0, microsecond=0)
+    gridpoint = f"{BASE_URL}/gridpoints/{office}/{grid_x},{grid_y}"
+
+    properties = {
+        "@id": gridpoint,
+        "@type": "wx:Gridpoint",
+        "updateTime": _iso(collected_at - timedelta(minutes=rng.randint(5, 55))),
+        "validTimes": f"{_iso(start)}/P{days}DT13H",
+        "elevation": {"unitCode": "wmoUnit:m", "value": round(rng.uniform(300, 1200), 1)},
+        "forecastOffice": f"{BASE_URL}/offices/{office}",
+        "gridId": office,
+        "gridX": grid_x,
+        "gridY": grid_y,
+        "weather": {"values": [{"validTime": f"{_iso(start)}/PT6H", "value": [
+            {"coverage": "likely", "weather": "snow", "intensity": "light", "visibility": {"unitCode": "wmoUnit:km", "value": None}, "attributes": []}
+        ]}]},
+        "hazards": {"values": []},
+    }
+    for name, (unit, hours, low, high) in GRID_LAYERS.items():
+        properties[name] = _layer(rng, start, days, unit, hours, low, high)
+
+    return {
+        "@context": ["https://geojson.org/geojson-ld/geojson-context.jsonld"],
+        "@id": gridpoint,
+        "type": "Feature",
+        "geometry": _polygon(latitude, longitude),
+        "properties": properties,
+    }
+
+
+def station_id(name: str, index: int = 0) -> str:
+    """Stable 4-letter ICAO-style identifier for a resort's nth station."""
+    letters = "".join(c for c in name.upper() if c.isalpha()) or "XXX"
+    return f"K{letters[:2]}{chr(ord('A') + (sum(map(ord, name)) + index) % 26)}"
+
+
+def stations_payload(name: str, latitude: float, longitude: float, count: int = 3) -> dict:
+    """Response of /gridpoints/.../stations."""
+    features = []
+    for index in range(count):
+        identifier = station_id(name, index)
+        url = f"{BASE_URL}/stations/{identifier}"
+        features.append({
+            "id": url,
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [longitude + 0.05 * index, latitude - 0.04 * index]},
+            "properties": {
+                "@id": url,
+                "@type": "wx:ObservationStation",
+                "elevation": {"unitCode": "wmoUnit:m", "value": 150.0 + 100 * index},
+                "stationIdentifier": identifier,
+                "name": f"{name} Station {index + 1}",
+                "timeZone": "America/New_York",
+                "forecast": f"{BASE_URL}/zones/forecast/{grid_location(latitude, longitude)[3]}",
+                "county": f"{BASE_URL}/zones/county/MEC017",
+                "fireWeatherZone": f"{BASE_URL}/zones/fire/MEZ008",
+            },
+        })
+
+    return {
+        "@context": ["https://geojson.org/geojson-ld/geojson-context.jsonld"],
+        "type": "FeatureCollection",
+        "features": features,
+        "observationStations": [feature["id"] for feature in features],
+        "pagination": {"next": f"{BASE_URL}/stations?cursor=next"},
+    }
+
+
+def zone_payload(name: str, latitude: float, longitude: float, state: str = "ME") -> dict:
+    """Response of /zones/forecast/{zone_id}."""
+    office, _, _, zone = grid_location(latitude, longitude)
+    url = f"{BASE_URL}/zones/forecast/{zone}"
+
+    return {
+        "@context": ["https://geojson.org/geojson-ld/geojson-context.jsonld"],
+        "id": url,
+        "type": "Feature",
+        "geometry": _polygon(latitude, longitude, size=0.25),
+        "properties": {
+            "@id": url,
+            "@type": "wx:Zone",
+            "id": zone,
+            "type": "public",
+            "name": f"{name} Mountains",
+            "effectiveDate": "2025-01-01T00:00:00+00:00",
+            "expirationDate": "2200-01-01T00:00:00+00:00",
+            "state": state,
+            "cwa": [office],
+            "forecastOffices": [f"{BASE_URL}/offices/{office}"],
+            "timeZone": ["America/New_York"],
+            "observationStations": [f"{BASE_URL}/stations/{station_id(name)}"],
+            "radarStation": f"K{office}",
+        },
+    }
+
+
+def observation_payload(
+    rng: random.Random,
+    station: str,
+    latitude: float,
+    longitude: float,
+    observed_at: datetime
+) -> dict:
+    """Response of /stations/{id}/observations/latest."""
+    url = f"{BASE_URL}/stations/{station}/observations/{_iso(observed_at)}"
+    temperature = round(rng.uniform(-20, 3), 1)
+
+    return {
+        "@context": ["https://geojson.org/geojson-ld/geojson-context.jsonld"],
+        "@id": url,
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [longitude, latitude]},
+        "properties": {
+            "@id": url,
+            "@type": "wx:ObservationStation",
+            "elevation": _quantity(300.0, "wmoUnit:m"),
+            "station": f"{BASE_URL}/stations/{station}",
+            "timestamp": _iso(observed_at),
+            "rawMessage": f"{station} {observed_at:%d%H%M}Z AUTO",
+            "textDescription": rng.choice(SHORT_FORECASTS),
+            "icon": f"{BASE_URL}/icons/land/day/snow?size=medium",
+            "presentWeather": [],
+            "temperature": _quantity(temperature, "wmoUnit:degC"),
+            "dewpoint": _quantity(round(temperature - rng.uniform(0, 6), 1), "wmoUnit:degC"),
+            "windDirection": _quantity(float(rng.randint(0, 359)), "wmoUnit:degree_(angle)"),
+            "windSpeed": _quantity(round(rng.uniform(0, 40), 1), "wmoUnit:km_h-1"),
+            "windGust": _quantity(round(rng.uniform(20, 90), 1) if rng.random() < 0.6 else None, "wmoUnit:km_h-1"),
+            "barometricPressure": _quantity(float(rng.randint(98000, 103000)), "wmoUnit:Pa"),
+            "seaLevelPressure": _quantity(float(rng.randint(98000, 103000)), "wmoUnit:Pa"),
+            "visibility": _quantity(float(rng.randint(400, 16090)), "wmoUnit:m"),
+            "maxTemperatureLast24Hours": _quantity(None, "wmoUnit:degC"),
+            "minTemperatureLast24Hours": _quantity(None, "wmoUnit:degC"),
+            "precipitationLastHour": _quantity(round(rng.uniform(0, 3), 1), "wmoUnit:mm"),
+            "precipitationLast3Hours": _quantity(round(rng.uniform(0, 6), 1), "wmoUnit:mm"),
+            "precipitationLast6Hours": _quantity(round(rng.uniform(0, 10), 1), "wmoUnit:mm"),
+            "relativeHumidity": _quantity(round(rng.uniform(40, 100), 1), "wmoUnit:percent"),
+            "windChill": _quantity(round(temperature - rng.uniform(2, 12), 1), "wmoUnit:degC"),
+            "heatIndex": _quantity(None, "wmoUnit:degC"),
+            "cloudLayers": [{"base": {"unitCode": "wmoUnit:m", "value": 900}, "amount": "OVC"}],
+        },
+    }
+
+
+# Lake categories, in collection order
+CATEGORIES = ["points", "zones", "stations", "forecasts", "hourly", "grid_data", "observations"]
+
+
+def category_payload(
+    category: str,
+    rng: random.Random,
+    name: str,
+    state: str,
+    latitude: float,
+    longitude: float,
+    collected_at: datetime
+) -> dict:
+    """One category's response for a resort at a collection time."""
+    if category == "points":
+        return points_payload(name, latitude, longitude, state)
+    if category == "zones":
+        return zone_payload(name, latitude, longitude, state)
+    if category == "stations":
+        return stations_payload(name, latitude, longitude)
+    if category in ("forecasts", "hourly"):
+        return forecast_payload(rng, latitude, longitude, collected_at, hourly=category == "hourly")
+    if category == "grid_data":
+        return grid_data_payload(rng, latitude, longitude, collected_at)
+    if category == "observations":
+        # Latest report at collection time: a few minutes old
+        observed_at = (collected_at - timedelta(minutes=rng.randint(0, 9))).replace(second=0, microsecond=0)
+        return observation_payload(rng, station_id(name), latitude, longitude, observed_at)
+    raise ValueError(f"Unknown category: {category}")
+
+
+def resort_payloads(
+    rng: random.Random,
+    name: str,
+    state: str,
+    latitude: float,
+    longitude: float,
+    collected_at: datetime
+) -> Dict[str, dict]:
+    """Every category's response for one resort at one collection time."""
+    return {
+        category: category_payload(category, rng, name, state, latitude, longitude, collected_at)
+        for category in CATEGORIES
+    }
+
+
+def as_landed(category: str, payload: dict) -> dict:
+    """Convert a response to what the collector saves for it (see fetch_resort_category)."""
+    model = LANDED_MODELS.get(category)
+    return model(**payload).model_dump() if model else payload
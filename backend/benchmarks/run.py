@@ -0,0 +1,124 @@
+"""
+Run the offline benchmark suite and emit JSON results.
+
+    python -m benchmarks.run --resorts 20 --cycles 6 --days 2 --output bench.json
+
+Everything runs against synthetic payloads in a scratch directory (the lake,
+the dbt project copy and the database), so no API access is needed and the
+real lake and database are untouched. Compare the JSON between versions to
+spot regressions; ``environment.commit`` records what was measured.
+
+At production scale, generate a lake once with benchmarks.synthetic_lake and
+point the listing, dbt and console stages at it (same --resorts/--seed, so
+lookups hit real resorts):
+
+    python -m benchmarks.synthetic_lake --resorts 1000 --days 120 --root /scratch/lake
+    python -m benchmarks.run --lake /scratch/lake --resorts 1000 --days 120 --cycles 24
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+STAGES = ["startup", "client", "lake", "list", "dbt", "console"]
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description="Offline pipeline benchmarks")
+    parser.add_argument("--resorts", type=int, default=10, help="Synthetic resorts")
+    parser.add_argument("--cycles", type=int, default=4, help="Collections per day")
+    parser.add_argument("--days", type=int, default=2, help="Days of collections")
+    parser.add_argument("--seed", type=int, default=42, help="Payload random seed")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per latency measurement")
+    parser.add_argument("--stages", default=",".join(STAGES), help=f"Comma-separated subset of {STAGES}")
+    parser.add_argument("--workdir", help="Scratch directory (default: a temp dir, removed afterwards)")
+    parser.add_argument("--lake", help="Use an existing lake instead of writing one (skips the lake stage)")
+    parser.add_argument("--profiles-dir", help="dbt profiles.yml directory (default: the project's)")
+    parser.add_argument("--output", help="Write results JSON here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    stages = [stage.strip() for stage in args.stages.split(",") if stage.strip()]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f"Unknown stages: {sorted(unknown)}")
+
+    workdir = Path(args.workdir or tempfile.mkdtemp(prefix="weather-bench-")).resolve()
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    if args.lake:
+        # dbt models read ../../datalake/raw relative to the project copy
+        lake_link = workdir / "datalake" / "raw"
+        lake_link.parent.mkdir(parents=True, exist_ok=True)
+        if not lake_link.exists():
+            lake_link.symlink_to(Path(args.lake).resolve(), target_is_directory=True)
+        stages = [stage for stage in stages if stage != "lake"]
+
+    # Must be set before the pipeline modules are imported
+    os.environ["DATALAKE_PATH"] = str(workdir / "datalake" / "raw")
+    os.environ["DATABASE_URL"] = str(workdir / "data" / "weather.duckdb")
+
+    from . import suite
+    from .payloads import synthetic_resorts
+
+    rng = random.Random(args.seed)
+    resorts = synthetic_resorts(args.resorts, rng)
+    times = suite.collection_times(datetime(2025, 12, 1), args.days, args.cycles)
+
+    report = {
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": suite.environment(),
+        "scale": {
+            "resorts": args.resorts,
+            "cycles_per_day": args.cycles,
+            "days": args.days,
+            "seed": args.seed,
+            "lake": args.lake,
+        },
+        "results": {},
+    }
+
+    stage_runs = {
+        "startup": lambda: suite.bench_startup(args.repeat),
+        "client": lambda: suite.bench_client_parse(resorts, random.Random(args.seed), args.repeat),
+        "lake": lambda: suite.bench_lake_writes(resorts, times, random.Random(args.seed)),
+        "list": lambda: suite.bench_list_raw_files(resorts, times, args.repeat),
+        "dbt": lambda: suite.bench_dbt(workdir, args.profiles_dir),
+        "console": lambda: suite.bench_console(args.repeat),
+    }
+
+    try:
+        for stage in STAGES:
+            if stage not in stages:
+                continue
+            print(f"  … {stage}", file=sys.stderr)
+            started = time.perf_counter()
+            try:
+                report["results"][stage] = stage_runs[stage]()
+            except Exception as e:
+                report["results"][stage] = {"error": f"{type(e).__name__}: {e}"}
+                print(f"  ✗ {stage}: {e}", file=sys.stderr)
+            else:
+                print(f"  ✓ {stage} ({time.perf_counter() - started:.1f}s)", file=sys.stderr)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+        print(f"✓ Results written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+"""
+Benchmarks for each pipeline stage.
+
+Every function returns a JSON-ready dict of measurements. They read and write
+wherever DATALAKE_PATH and DATABASE_URL point, so run them through
+benchmarks/run.py, which points both at a scratch directory first.
+"""
+
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import duckdb
+import requests
+
+from clients import WeatherClient
+from datalake.writer import list_raw_files, save_raw_data
+from db import get_session, query_cache, role_env
+from db.browse import fetch_page, list_tables, table_columns
+
+from .payloads import as_landed, resort_payloads, station_id
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DBT_PROJECT_DIR = BACKEND_DIR / "db" / "data_model"
+
+Resort = Tuple[str, str, float, float]  # (name, state, latitude, longitude)
+
+# Fresh-interpreter commands timed by bench_startup (arguments to python)
+STARTUP_COMMANDS = {
+    "interpreter": ["-c", "pass"],
+    "import config": ["-c", "import config"],
+    "import clients": ["-c", "import clients"],
+    "import datalake": ["-c", "import datalake"],
+    "import db": ["-c", "import db"],
+    "import telemetry": ["-c", "import telemetry"],
+    "collector --help": ["-m", "datalake.writer", "--help"],
+    "scheduler --help": ["-m", "flows.scheduler", "--help"],
+    "api server --help": ["-m", "api.server", "--help"],
+}
+
+
+def _latency(fn: Callable, repeat: int) -> Dict[str, float]:
+    """Call fn repeat times and summarize wall time in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+
+    samples.sort()
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        "min_ms": round(samples[0], 3),
+        "runs": repeat,
+    }
+
+
+def collection_times(start: datetime, days: int, cycles: int) -> List[datetime]:
+    """Collection timestamps: cycles evenly spaced per day, for days days."""
+    step = timedelta(hours=24) / cycles
+    return [start + timedelta(days=day) + step * cycle for day in range(days) for cycle in range(cycles)]
+
+
+def environment() -> dict:
+    """Versions needed to compare results between runs."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "duckdb": duckdb.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+# ============================================================================
+# Client parsing
+# ============================================================================
+
+class _RecordedSession(requests.Session):
+    """Session answering from recorded response bodies instead of the network."""
+
+    def __init__(self, bodies: Dict[str, bytes]):
+        super().__init__()
+        self.bodies = bodies
+
+    def get(self, url, params=None, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.headers["Content-Type"] = "application/geo+json"
+        response._content = self.bodies[self._route(url)]
+        return response
+
+    @staticmethod
+    def _route(url: str) -> str:
+        if "/points/" in url:
+            return "points"
+        if url.endswith("/forecast/hourly"):
+            return "hourly"
+        if url.endswith("/forecast"):
+            return "forecasts"
+        if "/observations/" in url:
+            return "observations"
+        return "grid_data"
+
+
+def bench_client_parse(resorts: List[Resort], rng: random.Random, iterations: int = 20) -> dict:
+    """
+    WeatherClient decode + validation throughput per endpoint.
+
+    Responses are served from memory by a stand-in session, so this measures
+    JSON decoding and pydantic parsing only.
+    """
+    name, state, latitude, longitude = resorts[0]
+    payloads = resort_payloads(rng, name, state, latitude, longitude, datetime(2025, 12, 30, 12))
+    bodies = {category: json.dumps(payload).encode() for category, payload in payloads.items()}
+
+    client = WeatherClient()
+    client.session = _RecordedSession(bodies)
+    points = client.get_points(latitude, longitude)
+
+    calls = {
+        "points": lambda: client.get_points(latitude, longitude),
+        "forecasts": lambda: client.get_forecast_from_points(points),
+        "hourly": lambda: client.get_hourly_forecast_from_points(points),
+        "grid_data": lambda: client.get_grid_data_from_points(points),
+        "observations": lambda: client.get_station_observation(station_id(name)),
+    }
+
+    results = {}
+    for category, call in calls.items():
+        timing = _latency(call, iterations)
+        results[category] = {
+            **timing,
+            "bytes": len(bodies[category]),
+            "parses_per_s": round(1000 / timing["median_ms"], 1),
+            "mb_per_s": round(len(bodies[category]) / 1e6 / (timing["median_ms"] / 1000), 2),
+        }
+    return results
+
+
+# ============================================================================
+# Lake writes and listing
+# ============================================================================
+
+def bench_lake_writes(resorts: List[Resort], times: List[datetime], rng: random.Random) -> dict:
+    """
+    save_raw_data rate over the whole synthetic lake.
+
+    Payloads are generated and converted the way the collector lands them
+    before timing starts; only the writes are timed.
+    """
+    written, payload_bytes, elapsed = 0, 0, 0.0
+    per_category: Dict[str, float] = {}
+
+    for collected_at in times:
+        for name, state, latitude, longitude in resorts:
+            payloads = resort_payloads(rng, name, state, latitude, longitude, collected_at)
+            for category, payload in payloads.items():
+                data = as_landed(category, payload)
+
+                started = time.perf_counter()
+                path = save_raw_data(category, data, name, collected_at)
+                took = time.perf_counter() - started
+
+                elapsed += took
+                per_category[category] = per_category.get(category, 0.0) + took
+                written += 1
+                payload_bytes += path.stat().st_size
+
+    return {
+        "files": written,
+        "bytes": payload_bytes,
+        "seconds": round(elapsed, 3),
+        "files_per_s": round(written / elapsed, 1),
+        "mb_per_s": round(payload_bytes / 1e6 / elapsed, 2),
+        "seconds_by_category": {category: round(seconds, 3) for category, seconds in per_category.items()},
+    }
+
+
+def bench_list_raw_files(resorts: List[Resort], times: List[datetime], repeat: int = 20) -> dict:
+    """list_raw_files latency for the common lookups."""
+    name = resorts[len(resorts) // 2][0]
+    middle = times[len(times) // 2]
+
+    cases = {
+        "category": lambda: list_raw_files("forecasts"),
+        "identifier": lambda: list_raw_files("forecasts", identifier=name),
+        "date_range": lambda: list_raw_files("forecasts", start_date=middle, end_date=middle + timedelta(hours=6)),
+    }
+
+    results = {case: _latency(fn, repeat) for case, fn in cases.items()}
+    results["files_in_category"] = len(list_raw_files("forecasts"))
+    return results
+
+
+# ============================================================================
+# dbt
+# ============================================================================
+
+def _copy_dbt_project(workdir: Path) -> Path:
+    """
+    Copy the dbt project into the scratch tree.
+
+    Models read ../../datalake/raw and profiles.yml writes ../../data, so the
+    copy sits at the same depth as the original.
+    """
+    project_dir = workdir / "db" / "data_model"
+    if project_dir.exists():
+        shutil.rmtree(project_dir)
+    shutil.copytree(DBT_PROJECT_DIR, project_dir, ignore=shutil.ignore_patterns("target", "logs", "dbt_packages"))
+    (workdir / "data").mkdir(parents=True, exist_ok=True)
+    return project_dir
+
+
+def bench_dbt(workdir: Path, profiles_dir: str = None) -> dict:
+    """
+    Wall time of dbt run per layer over the synthetic lake.
+
+    Args:
+        workdir: Scratch tree holding datalake/raw
+        profiles_dir: profiles.yml directory (defaults to the copied project's)
+    """
+    project_dir = _copy_dbt_project(workdir)
+    profiles_dir = str(Path(profiles_dir).resolve()) if profiles_dir else "."
+
+    results = {}
+    for layer in ("bronze", "silver", "gold"):
+        started = time.perf_counter()
+        try:
+            completed = subprocess.run(
+                ["dbt", "run", "--profiles-dir", profiles_dir, "--select", layer],
+                cwd=project_dir, env={**os.environ, **role_env("transform")}, capture_output=True, text=True
+            )
+        except FileNotFoundError:
+            return {"error": "dbt is not installed"}
+
+        results[layer] = {"seconds": round(time.perf_counter() - started, 3), "ok": completed.returncode == 0}
+        if completed.returncode != 0:
+            results[layer]["error"] = completed.stdout[-2000:]
+            break
+
+    return results
+
+
+# ============================================================================
+# Console queries
+# ============================================================================
+
+def bench_console(repeat: int = 20) -> dict:
+    """Latency of the console's metadata listing and page reads."""
+    tables = [table for table in list_tables() if table["estimated_rows"]]
+    if not tables:
+        return {"error": "no tables built"}
+
+    largest = max(tables, key=lambda table: table["estimated_rows"])
+    schema, name = largest["schema"], largest["name"]
+
+    with get_session() as con:
+        columns = [column for column, _ in table_columns(con, schema, name)]
+
+        def sorted_page():
+            fetch_page(con, schema, name, order_by=columns[-1], descending=True, limit=100, offset=1000)
+
+        results = {
+            "table": f"{schema}.{name}",
+            "rows": largest["estimated_rows"],
+            "list_tables": _latency(lambda: list_tables(con), repeat),
+            "first_page": _latency(lambda: fetch_page(con, schema, name, limit=100), repeat),
+            "sorted_page": _latency(sorted_page, repeat),
+        }
+
+        query_cache.clear()
+        fetch_page(con, schema, name, limit=100, cache=query_cache)
+        results["cached_page"] = _latency(
+            lambda: fetch_page(con, schema, name, limit=100, cache=query_cache), repeat
+        )
+
+    return results
+
+
+# ============================================================================
+# Startup
+# ============================================================================
+
+def _import_times(args: List[str], top: int) -> List[dict]:
+    """Modules costing the most to import (self time), from -X importtime."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=BACKEND_DIR, capture_output=True, text=True
+    ).stderr
+
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        modules.append({
+            "module": module.strip(),
+            "self_ms": round(int(self_us) / 1000, 1),
+            "cumulative_ms": round(int(cumulative_us) / 1000, 1),
+        })
+    return sorted(modules, key=lambda module: module["self_ms"], reverse=True)[:top]
+
+
+def bench_startup(repeat: int = 10, top: int = 5) -> dict:
+    """
+    Cold start time of the entry points, each in a fresh interpreter.
+
+    ``over_interpreter_ms`` subtracts the median of a bare ``python -c pass``,
+    leaving what our imports cost; ``slowest_imports`` lists the modules
+    ``-X importtime`` blames most.
+    """
+    results = {}
+    for name, args in STARTUP_COMMANDS.items():
+        def run():
+            subprocess.run([sys.executable, *args], cwd=BACKEND_DIR, capture_output=True, check=True)
+
+        results[name] = _latency(run, repeat)
+
+    baseline = results["interpreter"]["median_ms"]
+    for name, args in STARTUP_COMMANDS.items():
+        if name == "interpreter":
+            continue
+        results[name]["over_interpreter_ms"] = round(results[name]["median_ms"] - baseline, 3)
+        results[name]["slowest_imports"] = _import_times(args, top)
+
+    return results
+
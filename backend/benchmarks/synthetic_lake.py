@@ -0,0 +1,179 @@
+"""
+Synthetic raw data lake for scale testing.
+
+Writes schema-faithful files for all seven categories, for any number of
+made-up resorts, on the collection cadence of config/schedule.yaml:
+
+    python -m benchmarks.synthetic_lake --resorts 1000 --days 120 --root /scratch/datalake/raw
+    python -m benchmarks.synthetic_lake --resorts 50 --days 7 --every observations=60
+
+Payloads come from benchmarks/payloads.py and are landed the way the
+collector lands them: validated through models/api.py, dumped, wrapped with
+raw_record() and written with write_raw_file(). Every file's content is
+seeded from (seed, resort, category, time), so the same arguments give
+byte-identical files however the work is split across processes. Rerunning
+over an existing lake is a no-op.
+
+At full scale this is a lot of data. 1,000 resorts for a 120-day season at
+the default cadence is about 8.6M files (observations every 10 minutes are
+most of them). Hourly forecasts and grid data run about 90 KB each.
+"""
+
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from config import load_schedule_config
+from datalake.writer import DATALAKE_ROOT, raw_file_path, raw_record, write_raw_file
+
+from .payloads import CATEGORIES, as_landed, category_payload, synthetic_resorts
+
+DEFAULT_START = datetime(2025, 12, 1)
+
+
+def collection_times(start: datetime, days: int, every_minutes: float) -> List[datetime]:
+    """Collection times from start, every every_minutes, for days days."""
+    step = timedelta(minutes=every_minutes)
+    end = start + timedelta(days=days)
+    times = []
+    collected_at = start
+    while collected_at < end:
+        times.append(collected_at)
+        collected_at += step
+    return times
+
+
+def default_cadence(schedule_path: str = "config/schedule.yaml") -> Dict[str, float]:
+    """Minutes between collections per category, from the scheduler config."""
+    schedule = load_schedule_config(schedule_path)
+    return {category: schedule.resources[category].every_minutes for category in CATEGORIES}
+
+
+def _write_resort(task: tuple) -> Tuple[int, int]:
+    """Write every file of one resort. Runs in a worker process."""
+    root, seed, resort, cadence, start, days, fsync = task
+    name, state, latitude, longitude = resort
+
+    files, size = 0, 0
+    for category, every_minutes in cadence.items():
+        for collected_at in collection_times(start, days, every_minutes):
+            rng = random.Random(f"{seed}:{name}:{category}:{collected_at.isoformat()}")
+            payload = category_payload(category, rng, name, state, latitude, longitude, collected_at)
+
+            record = raw_record(category, as_landed(category, payload), name, collected_at)
+            # Deterministic content: saved "when collected" rather than now
+            record["metadata"]["saved_at"] = collected_at.isoformat()
+
+            path = write_raw_file(raw_file_path(category, name, collected_at, root), record, fsync=fsync)
+            files += 1
+            size += path.stat().st_size
+
+    return files, size
+
+
+def generate_lake(
+    resorts: int,
+    days: int,
+    root: str = None,
+    seed: int = 42,
+    start: datetime = DEFAULT_START,
+    cadence: Dict[str, float] = None,
+    workers: int = None,
+    fsync: bool = False
+) -> dict:
+    """
+    Write a synthetic lake.
+
+    Args:
+        resorts: Number of made-up resorts
+        days: Days of collections from start
+        root: Lake root (defaults to DATALAKE_ROOT)
+        seed: Random seed; the same seed writes the same files
+        start: First collection time
+        cadence: Minutes between collections per category (defaults to
+            config/schedule.yaml); categories left out aren't written
+        workers: Writer processes (defaults to the CPU count)
+        fsync: fsync each file (slower; only needed to measure durable writes)
+
+    Returns:
+        Files and bytes written, elapsed seconds and files per second
+    """
+    root = str(root or DATALAKE_ROOT)
+    cadence = cadence or default_cadence()
+    unknown = set(cadence) - set(CATEGORIES)
+    if unknown:
+        raise ValueError(f"Unknown categories: {sorted(unknown)}")
+
+    for category in cadence:
+        Path(root, category).mkdir(parents=True, exist_ok=True)
+
+    # Resort names and locations come from their own stream, so they don't
+    # depend on how many files each resort gets
+    resort_list = synthetic_resorts(resorts, random.Random(seed))
+    tasks = [(root, seed, resort, cadence, start, days, fsync) for resort in resort_list]
+
+    planned = resorts * sum(len(collection_times(start, days, every)) for every in cadence.values())
+    print(f"Writing ~{planned:,} files for {resorts} resorts × {days} days to {root}...")
+
+    started = time.perf_counter()
+    files, size = 0, 0
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        for done, (resort_files, resort_bytes) in enumerate(executor.map(_write_resort, tasks), start=1):
+            files += resort_files
+            size += resort_bytes
+            if done % max(1, resorts // 20) == 0 or done == resorts:
+                print(f"  ✓ {done}/{resorts} resorts, {files:,} files, {size / 1e9:.2f} GB")
+
+    elapsed = time.perf_counter() - started
+    return {
+        "files": files,
+        "bytes": size,
+        "seconds": round(elapsed, 2),
+        "files_per_s": round(files / elapsed, 1) if elapsed else None,
+    }
+
+
+def _parse_every(values: List[str]) -> Dict[str, float]:
+    overrides = {}
+    for value in values or []:
+        category, _, minutes = value.partition("=")
+        overrides[category] = float(minutes)
+    return overrides
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Write a synthetic raw data lake")
+    parser.add_argument("--resorts", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=120, help="Days of collections (a season is ~120)")
+    parser.add_argument("--start", type=datetime.fromisoformat, default=DEFAULT_START, help="First collection time")
+    parser.add_argument("--root", help="Lake root (default: DATALAKE_PATH)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, help="Writer processes (default: CPU count)")
+    parser.add_argument("--categories", help="Comma-separated subset of categories")
+    parser.add_argument("--every", action="append", metavar="CATEGORY=MINUTES", help="Override a cadence")
+    parser.add_argument("--fsync", action="store_true", help="fsync every file")
+    args = parser.parse_args()
+
+    cadence = default_cadence()
+    cadence.update(_parse_every(args.every))
+    if args.categories:
+        cadence = {category: cadence[category] for category in args.categories.split(",")}
+
+    result = generate_lake(
+        args.resorts,
+        args.days,
+        root=args.root,
+        seed=args.seed,
+        start=args.start,
+        cadence=cadence,
+        workers=args.workers,
+        fsync=args.fsync,
+    )
+    print(f"\n✓ Wrote {result['files']:,} files ({result['bytes'] / 1e9:.2f} GB) "
+          f"in {result['seconds']}s ({result['files_per_s']} files/s)")
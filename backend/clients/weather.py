@@ -4,18 +4,25 @@ NOAA weather.gov API client.
 Provides clean interface to weather.gov API with Pydantic model validation.
 """
 
-import requests
-from typing import List, Optional
-from models.api import (
-    PointsResponse,
-    ZonesResponse,
-    StationsResponse,
-    GridForecastResponse,
-    HourlyForecastResponse,
-    GridDataResponse,
-    ObservationResponse,
-    ZoneForecastResponse,
-)
+from __future__ import annotations
+
+import importlib
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Iterator, List, Optional
+from telemetry import endpoint_label, metrics
+
+if TYPE_CHECKING:
+    from models.api import (
+        PointsResponse,
+        ZonesResponse,
+        StationsResponse,
+        GridForecastResponse,
+        HourlyForecastResponse,
+        GridDataResponse,
+        ObservationResponse,
+        ZoneForecastResponse,
+    )
 
 
 class WeatherAPIError(Exception):
@@ -23,6 +30,13 @@ class WeatherAPIError(Exception):
     pass
 
 
+def _iso_utc(value: datetime) -> str:
+    """Format a datetime for API query parameters (naive values are UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 class WeatherClient:
     """
     Client for NOAA weather.gov API.
@@ -42,11 +56,34 @@ class WeatherClient:
         Args:
             user_agent: User-Agent header (required by weather.gov API)
         """
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': user_agent,
-            'Accept': 'application/geo+json'
-        })
+        self.user_agent = user_agent
+        self._session = None
+
+        # Headers of the most recent response (Expires, Last-Modified, ...);
+        # like the session, a client isn't meant to be shared between threads
+        self.last_response_headers = {}
+
+    @property
+    def session(self):
+        """
+        HTTP session, created on first use.
+
+        requests takes longer to import than the rest of the collector, so
+        it's only loaded once a request is actually made.
+        """
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+            self._session.headers.update({
+                'User-Agent': self.user_agent,
+                'Accept': 'application/geo+json'
+            })
+        return self._session
+
+    @session.setter
+    def session(self, session):
+        self._session = session
 
     def _get(self, endpoint: str, params: Optional[dict] = None) -> dict:
         """
@@ -62,15 +99,47 @@ class WeatherClient:
         Raises:
             WeatherAPIError: If request fails
         """
+        from requests.exceptions import RequestException
+
         url = f"{self.BASE_URL}{endpoint}"
+        label = endpoint_label(endpoint)
 
+        response = None
+        started = time.perf_counter()
         try:
             response = self.session.get(url, params=params)
+            metrics.observe("weather_api_request_seconds", time.perf_counter() - started, endpoint=label)
+            metrics.inc("weather_api_requests_total", endpoint=label, status=response.status_code)
+            metrics.inc("weather_api_response_bytes_total", len(response.content), endpoint=label)
+
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            self.last_response_headers = response.headers
+            with metrics.timer("weather_api_decode_seconds", endpoint=label):
+                return response.json()
+        except RequestException as e:
+            if response is None:
+                metrics.observe("weather_api_request_seconds", time.perf_counter() - started, endpoint=label)
+                metrics.inc("weather_api_requests_total", endpoint=label, status="error")
             raise WeatherAPIError(f"API request failed: {e}") from e
 
+    @staticmethod
+    def _validate(model_name: str, data: dict):
+        """
+        Build a response model from decoded JSON, timing the validation.
+
+        The models are imported on first use: building them costs more at
+        startup than anything else the client needs.
+        """
+        from pydantic import ValidationError
+
+        model = getattr(importlib.import_module("models.api"), model_name)
+        with metrics.timer("weather_api_validate_seconds", model=model_name):
+            try:
+                return model(**data)
+            except ValidationError:
+                metrics.inc("weather_api_validation_failures_total", model=model_name)
+                raise
+
     # ========================================================================
     # Points API
     # ========================================================================
@@ -91,7 +160,7 @@ class WeatherClient:
         """
         endpoint = f"/points/{latitude},{longitude}"
         data = self._get(endpoint)
-        return PointsResponse(**data)
+        return self._validate("PointsResponse", data)
 
     # ========================================================================
     # Zones API
@@ -121,7 +190,7 @@ class WeatherClient:
             params["region"] = region
 
         data = self._get("/zones", params=params)
-        return ZonesResponse(**data)
+        return self._validate("ZonesResponse", data)
 
     def get_zone_forecast(self, zone_id: str) -> ZoneForecastResponse:
         """
@@ -135,7 +204,7 @@ class WeatherClient:
         """
         endpoint = f"/zones/forecast/{zone_id}/forecast"
         data = self._get(endpoint)
-        return ZoneForecastResponse(**data)
+        return self._validate("ZoneForecastResponse", data)
 
     # ========================================================================
     # Stations API
@@ -161,7 +230,7 @@ class WeatherClient:
             params["state"] = state
 
         data = self._get("/stations", params=params)
-        return StationsResponse(**data)
+        return self._validate("StationsResponse", data)
 
     def get_station_observation(self, station_id: str) -> ObservationResponse:
         """
@@ -175,7 +244,49 @@ class WeatherClient:
         """
         endpoint = f"/stations/{station_id}/observations/latest"
         data = self._get(endpoint)
-        return ObservationResponse(**data)
+        return self._validate("ObservationResponse", data)
+
+    def iter_station_observations(
+        self,
+        station_id: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = 500
+    ) -> Iterator[dict]:
+        """
+        Page through a station's observation history.
+
+        Follows the cursor in ``pagination.next`` until a page comes back
+        empty. Pages are yielded as raw GeoJSON FeatureCollections (newest
+        observations first) so callers can write them out one at a time.
+
+        Args:
+            station_id: Station identifier (e.g., "KPWM")
+            start: Earliest observation time (naive datetimes are UTC)
+            end: Latest observation time (naive datetimes are UTC)
+            limit: Observations per page (API maximum is 500)
+
+        Yields:
+            One FeatureCollection dict per page
+        """
+        params = {"limit": limit}
+        if start:
+            params["start"] = _iso_utc(start)
+        if end:
+            params["end"] = _iso_utc(end)
+
+        endpoint = f"/stations/{station_id}/observations"
+        while endpoint:
+            page = self._get(endpoint, params=params)
+            if not page.get("features"):
+                return
+
+            yield page
+
+            # The cursor URL already carries every query parameter
+            next_url = (page.get("pagination") or {}).get("next")
+            endpoint = next_url.replace(self.BASE_URL, "") if next_url else None
+            params = None
 
     def get_stations_for_point(self, latitude: float, longitude: float) -> List[str]:
         """
@@ -227,8 +338,7 @@ class WeatherClient:
         """
         endpoint = f"/gridpoints/{office}/{grid_x},{grid_y}/forecast"
         data = self._get(endpoint)
-        print(data["properties"].keys())
-        return GridForecastResponse(**data)
+        return self._validate("GridForecastResponse", data)
 
     def get_forecast_from_points(self, points: PointsResponse) -> GridForecastResponse:
         """
@@ -265,7 +375,7 @@ class WeatherClient:
         """
         endpoint = f"/gridpoints/{office}/{grid_x},{grid_y}/forecast/hourly"
         data = self._get(endpoint)
-        return HourlyForecastResponse(**data)
+        return self._validate("HourlyForecastResponse", data)
 
     def get_hourly_forecast_from_points(
         self,
@@ -308,7 +418,7 @@ class WeatherClient:
         """
         endpoint = f"/gridpoints/{office}/{grid_x},{grid_y}"
         data = self._get(endpoint)
-        return GridDataResponse(**data)
+        return self._validate("GridDataResponse", data)
 
     def get_grid_data_from_points(self, points: PointsResponse) -> GridDataResponse:
         """
@@ -1,48 +1,297 @@
 """
 Configuration loader for ski resort data pipeline.
+
+The resort registry and the collection schedule are read into plain records,
+so the collector starts without importing pydantic. The registry is
+validated in full by the pydantic models in models/config.py on first use of
+ResortRegistry.config; the retention and DuckDB configs are validated as
+they load. The models can still be imported from here.
 """
 
+import hashlib
+import importlib
+import os
+import threading
 import yaml
 from pathlib import Path
-from typing import List, Dict, Any
-from pydantic import BaseModel
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from models.config import DuckDBConfig, ResortsConfig, RetentionConfig
+
+# Pydantic models (models/config.py), imported on first use
+_MODELS = {
+    "Location",
+    "ResortMetadata",
+    "ResortConfig",
+    "ResortsConfig",
+    "RawRetention",
+    "TableRetention",
+    "RetentionConfig",
+    "DuckDBRole",
+    "DuckDBConfig",
+}
+
+
+def __getattr__(name):
+    if name not in _MODELS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module("models.config"), name)
+    globals()[name] = value
+    return value
+
 
+def _number(entry: Any, key: str, where: str, default: Any = ...) -> float:
+    """Read a numeric field (ints, floats or numeric strings, like pydantic's lax mode)."""
+    value = entry.get(key, default) if isinstance(entry, dict) else default
+    if value is ...:
+        raise ValueError(f"{where}: missing {key}")
+    if value is None and default is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"{where}: {key} must be a number, got {value!r}")
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"{where}: {key} must be a number, got {value!r}") from None
 
-class Location(BaseModel):
-    """Geographic location."""
+
+def _text(entry: Any, key: str, where: str) -> str:
+    """Read a required string field."""
+    value = entry.get(key) if isinstance(entry, dict) else None
+    if not isinstance(value, str):
+        raise ValueError(f"{where}: {key} must be a string, got {value!r}")
+    return value
+
+
+class ResortLocation(NamedTuple):
+    """Geographic location of a registry resort."""
     latitude: float
     longitude: float
 
 
-class ResortMetadata(BaseModel):
-    """Additional resort metadata."""
+class ResortInfo(NamedTuple):
+    """Additional metadata of a registry resort."""
     full_name: str
     region: str
 
 
-class ResortConfig(BaseModel):
-    """Single resort configuration."""
+class Resort(NamedTuple):
+    """A resort from resorts.yaml, with the same fields as ResortConfig."""
     name: str
     state: str
-    location: Location
-    metadata: ResortMetadata
+    location: ResortLocation
+    metadata: ResortInfo
 
+    @classmethod
+    def from_dict(cls, entry: dict, where: str = "resort") -> "Resort":
+        """
+        Read one resorts.yaml entry.
 
-class ResortsConfig(BaseModel):
-    """Complete resorts configuration."""
-    resorts: List[ResortConfig]
+        Raises:
+            ValueError: If a field is missing or has the wrong type
+        """
+        location = entry.get("location") if isinstance(entry, dict) else None
+        metadata = entry.get("metadata") if isinstance(entry, dict) else None
+        return cls(
+            name=_text(entry, "name", where),
+            state=_text(entry, "state", where),
+            location=ResortLocation(
+                latitude=_number(location, "latitude", f"{where}.location"),
+                longitude=_number(location, "longitude", f"{where}.location"),
+            ),
+            metadata=ResortInfo(
+                full_name=_text(metadata, "full_name", f"{where}.metadata"),
+                region=_text(metadata, "region", f"{where}.metadata"),
+            ),
+        )
 
 
-def load_resorts_config(config_path: str = "config/resorts.yaml") -> ResortsConfig:
+class ResortRegistry:
+    """
+    Resort snapshot with constant-time lookups.
+
+    Names are matched case-insensitively; states and regions map to the
+    resorts in config order.
+
+    Args:
+        resorts: Resorts in config order (Resort records or ResortConfig models)
+        data: Parsed resorts.yaml, validated into config on first use
+        config: Validated ResortsConfig, if already built
+    """
+
+    def __init__(self, resorts: Sequence, data: dict = None, config: "ResortsConfig" = None):
+        self.resorts = list(resorts)
+        self._data = data
+        self._config = config
+
+        self._by_name: Dict[str, int] = {}  # lowercase name -> position
+        self._by_state: Dict[str, List[Resort]] = {}
+        self._by_region: Dict[str, List[Resort]] = {}
+
+        for position, resort in enumerate(self.resorts):
+            key = resort.name.lower()
+            if key in self._by_name:
+                raise ValueError(f"Duplicate resort name: {resort.name}")
+            self._by_name[key] = position
+            self._by_state.setdefault(resort.state.upper(), []).append(resort)
+            self._by_region.setdefault(resort.metadata.region.lower(), []).append(resort)
+
+    @classmethod
+    def from_data(cls, data: dict) -> "ResortRegistry":
+        """
+        Build a registry from parsed resorts.yaml, without pydantic.
+
+        Raises:
+            ValueError: If an entry is malformed or a name is repeated
+        """
+        entries = data.get("resorts") if isinstance(data, dict) else None
+        if not isinstance(entries, list):
+            raise ValueError("resorts.yaml: expected a list under 'resorts'")
+        return cls([Resort.from_dict(entry, f"resorts[{i}]") for i, entry in enumerate(entries)], data=data)
+
+    @property
+    def config(self) -> "ResortsConfig":
+        """
+        The registry validated in full as a ResortsConfig.
+
+        Built on first use, which imports pydantic.
+        """
+        if self._config is None:
+            from models.config import ResortsConfig
+
+            self._config = ResortsConfig(**self._data)
+        return self._config
+
+    def __len__(self) -> int:
+        return len(self.resorts)
+
+    def __iter__(self):
+        return iter(self.resorts)
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._by_name
+
+    def get(self, name: str) -> Resort:
+        """
+        Get a resort by name.
+
+        Raises:
+            ValueError: If no resort has that name
+        """
+        return self.resorts[self._position(name)]
+
+    def _position(self, name: str) -> int:
+        try:
+            return self._by_name[name.lower()]
+        except KeyError:
+            raise ValueError(f"Resort not found: {name}") from None
+
+    def by_state(self, state: str) -> List[Resort]:
+        """Get the resorts in a state (e.g. "ME")."""
+        return list(self._by_state.get(state.upper(), []))
+
+    def by_region(self, region: str) -> List[Resort]:
+        """Get the resorts in a region (e.g. "White Mountains")."""
+        return list(self._by_region.get(region.lower(), []))
+
+    @property
+    def states(self) -> List[str]:
+        return sorted(self._by_state)
+
+    @property
+    def regions(self) -> List[str]:
+        return sorted(resorts[0].metadata.region for resorts in self._by_region.values())
+
+
+# Absolute path -> (mtime_ns, size, sha256, registry)
+_registry_cache: Dict[str, Tuple[int, int, str, ResortRegistry]] = {}
+_registry_lock = threading.Lock()
+
+
+def load_resort_registry(config_path: str = "config/resorts.yaml") -> ResortRegistry:
+    """
+    Get the resort registry for a config file.
+
+    The file is parsed once, without pydantic. Later calls only stat it: the
+    cached snapshot is reused while its mtime and size are unchanged, and
+    after a change it is rebuilt only if the content hash differs. Edits
+    are picked up on the next call, without a restart.
+
+    Args:
+        config_path: Path to resorts.yaml file
+
+    Returns:
+        ResortRegistry (registry.config validates it in full)
+
+    Raises:
+        ValueError: If an entry is malformed or a name is repeated
+    """
+    path = os.path.abspath(config_path)
+
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+    with _registry_lock:
+        cached = _registry_cache.get(path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[3]
+
+        content = Path(path).read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+
+        if cached and cached[2] == digest:
+            # Touched but unchanged
+            registry = cached[3]
+        else:
+            registry = ResortRegistry.from_data(yaml.safe_load(content))
+
+        _registry_cache[path] = (stat.st_mtime_ns, stat.st_size, digest, registry)
+        return registry
+
+
+def load_resorts_config(config_path: str = "config/resorts.yaml") -> "ResortsConfig":
     """
     Load resort configuration from YAML file.
 
+    Served from the resort registry cache, so repeated calls don't re-read
+    the file unless it changed. Imports pydantic on first use.
+
     Args:
         config_path: Path to resorts.yaml file
 
     Returns:
         ResortsConfig with validated data
     """
+    return load_resort_registry(config_path).config
+
+
+def get_resort_by_name(config: "ResortsConfig", name: str):
+    """
+    Get a specific resort by name.
+
+    Uses the registry index when config came from load_resorts_config();
+    other configs are indexed on the fly.
+    """
+    for *_, registry in list(_registry_cache.values()):
+        if registry._config is config:
+            return config.resorts[registry._position(name)]
+    return ResortRegistry(config.resorts, config=config).get(name)
+
+
+def load_retention_config(config_path: str = "config/retention.yaml") -> "RetentionConfig":
+    """
+    Load retention policies from YAML file.
+
+    Args:
+        config_path: Path to retention.yaml file
+
+    Returns:
+        RetentionConfig with validated data
+    """
     path = Path(config_path)
 
     if not path.exists():
@@ -51,24 +300,128 @@ def load_resorts_config(config_path: str = "config/resorts.yaml") -> ResortsConf
     with open(path, 'r') as f:
         data = yaml.safe_load(f)
 
-    return ResortsConfig(**data)
+    from models.config import RetentionConfig
+
+    return RetentionConfig(**data)
+
+
+class ResourceSchedule(NamedTuple):
+    """Collection cadence for one lake category."""
+    every_minutes: float
+    min_minutes: float = 1
+    max_minutes: Optional[float] = None
+
+    @classmethod
+    def from_dict(cls, entry: dict, where: str = "resource") -> "ResourceSchedule":
+        """
+        Read one resource of schedule.yaml (max_minutes defaults to every_minutes).
+
+        Raises:
+            ValueError: If a field isn't a number or the bounds are out of order
+        """
+        every = _number(entry, "every_minutes", where)
+        schedule = cls(
+            every_minutes=every,
+            min_minutes=_number(entry, "min_minutes", where, 1),
+            max_minutes=_number(entry, "max_minutes", where, None),
+        )
+        if schedule.max_minutes is None:
+            schedule = schedule._replace(max_minutes=every)
+        if not 0 < schedule.min_minutes <= schedule.every_minutes <= schedule.max_minutes:
+            raise ValueError(f"{where}: require 0 < min_minutes <= every_minutes <= max_minutes")
+        return schedule
+
+
+class ScheduleConfig(NamedTuple):
+    """Complete collection schedule."""
+    resources: Dict[str, ResourceSchedule]
+    workers: int = 4
+    grace_seconds: float = 60
+    retry_minutes: float = 2
+    max_retry_minutes: float = 60
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScheduleConfig":
+        """
+        Read parsed schedule.yaml.
+
+        Raises:
+            ValueError: If a field is missing or invalid
+        """
+        resources = data.get("resources") if isinstance(data, dict) else None
+        if not isinstance(resources, dict):
+            raise ValueError("schedule.yaml: expected a mapping under 'resources'")
+
+        workers = _number(data, "workers", "schedule", 4)
+        if workers != int(workers) or workers < 1:
+            raise ValueError(f"schedule: workers must be a positive integer, got {data['workers']!r}")
+
+        return cls(
+            resources={
+                name: ResourceSchedule.from_dict(entry, f"resources.{name}")
+                for name, entry in resources.items()
+            },
+            workers=int(workers),
+            grace_seconds=_number(data, "grace_seconds", "schedule", 60),
+            retry_minutes=_number(data, "retry_minutes", "schedule", 2),
+            max_retry_minutes=_number(data, "max_retry_minutes", "schedule", 60),
+        )
+
+
+def load_schedule_config(config_path: str = "config/schedule.yaml") -> ScheduleConfig:
+    """
+    Load the collection schedule from YAML file.
+
+    Args:
+        config_path: Path to schedule.yaml file
+
+    Returns:
+        ScheduleConfig with validated data
+
+    Raises:
+        ValueError: If a field is missing or invalid
+    """
+    path = Path(config_path)
+
+    if not path.exists():
+        raise FileNotFoundError(f"Config file not found: {config_path}")
+
+    with open(path, 'r') as f:
+        data = yaml.safe_load(f)
+
+    return ScheduleConfig.from_dict(data)
+
+
+def load_duckdb_config(config_path: str = "config/duckdb.yaml") -> "DuckDBConfig":
+    """
+    Load DuckDB resource limits from YAML file.
+
+    Args:
+        config_path: Path to duckdb.yaml file
+
+    Returns:
+        DuckDBConfig with validated data
+    """
+    path = Path(config_path)
+
+    if not path.exists():
+        raise FileNotFoundError(f"Config file not found: {config_path}")
+
+    with open(path, 'r') as f:
+        data = yaml.safe_load(f)
 
+    from models.config import DuckDBConfig
 
-def get_resort_by_name(config: ResortsConfig, name: str) -> ResortConfig:
-    """Get a specific resort by name."""
-    for resort in config.resorts:
-        if resort.name.lower() == name.lower():
-            return resort
-    raise ValueError(f"Resort not found: {name}")
+    return DuckDBConfig(**data)
 
 
 if __name__ == "__main__":
     # Example usage
-    config = load_resorts_config()
+    registry = load_resort_registry()
 
-    print(f"Loaded {len(config.resorts)} resorts:\n")
+    print(f"Loaded {len(registry)} resorts in {', '.join(registry.states)}:\n")
 
-    for resort in config.resorts:
+    for resort in registry:
         print(f"{resort.name}, {resort.state}")
         print(f"  Location: {resort.location.latitude}, {resort.location.longitude}")
         print(f"  Region: {resort.metadata.region}")
@@ -5,7 +5,12 @@ Run with: streamlit run console.py
 """
 
 import streamlit as st
-from db import get_session, get_tables, execute_query_df
+from db import get_session, query_cache
+from db.profiling import profiler
+from db.browse import FILTER_OPERATORS, count_rows, fetch_page, list_tables, table_columns
+
+PAGE_SIZES = [25, 100, 500]
+MAX_FILTERS = 3
 
 
 # Page config
@@ -17,40 +22,36 @@ st.set_page_config(
 
 st.title("🌤️ Weather Data Vault Console")
 
-# Get all tables across all schemas
-try:
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_tables() -> list:
+    """Tables and their sizes from catalog metadata (no table scans)."""
+    return list_tables()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_columns(schema: str, table: str) -> list:
     with get_session() as con:
-        result = con.execute("""
-            SELECT table_schema, table_name
-            FROM information_schema.tables
-            WHERE table_schema IN ('main', 'bronze', 'silver', 'gold')
-            ORDER BY table_schema, table_name
-        """).fetchall()
-
-        # Create fully qualified table names
-        all_tables = []
-        table_map = {}
-        for schema, table in result:
-            if schema == 'main':
-                full_name = table
-            else:
-                full_name = f"{schema}.{table}"
-            all_tables.append(full_name)
-            table_map[full_name] = (schema, table)
+        return table_columns(con, schema, table)
+
 
+# Get all tables across all schemas
+try:
+    all_tables = cached_tables()
 except Exception as e:
     st.error(f"Error connecting to database: {e}")
     st.info("Make sure to run `dbt run` first to create the tables.")
     st.stop()
 
 # Organize tables by type (check base table name, not schema)
-bronze = [t for t in all_tables if 'bronze_' in t]
-hubs = [t for t in all_tables if 'hub_' in t]
-links = [t for t in all_tables if 'link_' in t]
-sats = [t for t in all_tables if 'sat_' in t]
+bronze = [t for t in all_tables if t["name"].startswith('bronze_')]
+hubs = [t for t in all_tables if t["name"].startswith('hub_')]
+links = [t for t in all_tables if t["name"].startswith('link_')]
+sats = [t for t in all_tables if t["name"].startswith('sat_')]
+gold = [t for t in all_tables if t["name"].startswith('gold_')]
 
 # Display stats
-col1, col2, col3, col4, col5 = st.columns(5)
+col1, col2, col3, col4, col5, col6 = st.columns(6)
 with col1:
     st.metric("Total Tables", len(all_tables))
 with col2:
@@ -61,86 +62,169 @@ with col4:
     st.metric("Links", len(links))
 with col5:
     st.metric("Satellites", len(sats))
+with col6:
+    st.metric("Gold", len(gold))
 
 st.divider()
 
 
-def display_table(table_name: str):
-    """Display a table with row count and data."""
+def full_name(table: dict) -> str:
+    return table["name"] if table["schema"] == "main" else f"{table['schema']}.{table['name']}"
+
+
+def display_table(table: dict):
+    """Display one page of a table, with projection, filters and sorting pushed down."""
+    schema, name = table["schema"], table["name"]
+    key = f"{schema}.{name}"
+
     try:
-        # Get row count
-        with get_session() as con:
-            count = con.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+        columns = [column for column, _ in cached_columns(schema, name)]
 
         # Display header
         col1, col2 = st.columns([3, 1])
         with col1:
-            st.subheader(f"📊 {table_name}")
+            st.subheader(f"📊 {full_name(table)}")
         with col2:
-            st.metric("Rows", count)
+            if table["estimated_rows"] is not None:
+                st.metric("Rows (approx.)", f"{table['estimated_rows']:,}")
+            else:
+                st.metric("Rows", "view")
+
+        with st.expander("Columns, filters and sorting"):
+            selected = st.multiselect("Columns", columns, default=columns, key=f"{key}:columns")
+
+            filters = []
+            for i in range(MAX_FILTERS):
+                fcol1, fcol2, fcol3 = st.columns([2, 1, 2])
+                with fcol1:
+                    column = st.selectbox("Filter column", [""] + columns, key=f"{key}:fcol{i}")
+                with fcol2:
+                    operator = st.selectbox("Operator", list(FILTER_OPERATORS), key=f"{key}:fop{i}")
+                with fcol3:
+                    value = st.text_input("Value", key=f"{key}:fval{i}")
+                if column and (value or operator in ("is null", "is not null")):
+                    filters.append((column, operator, value))
+
+            scol1, scol2 = st.columns([3, 1])
+            with scol1:
+                order_by = st.selectbox("Sort by", [""] + columns, key=f"{key}:order")
+            with scol2:
+                descending = st.checkbox("Descending", key=f"{key}:desc")
+
+        pcol1, pcol2, pcol3 = st.columns([1, 1, 2])
+        with pcol1:
+            page_size = st.selectbox("Rows per page", PAGE_SIZES, key=f"{key}:size")
+        with pcol2:
+            page = st.number_input("Page", min_value=1, value=1, step=1, key=f"{key}:page")
+        with pcol3:
+            exact = st.button("Count matching rows", key=f"{key}:count")
 
-        # Get data
-        if count > 0:
-            df = execute_query_df(f"SELECT * FROM {table_name}")
+        with get_session() as con:
+            df = fetch_page(
+                con, schema, name,
+                columns=selected or None,
+                filters=filters,
+                order_by=order_by or None,
+                descending=descending,
+                limit=page_size,
+                offset=(page - 1) * page_size,
+                cache=query_cache,
+            )
+            if exact:
+                st.caption(f"{count_rows(con, schema, name, filters, cache=query_cache):,} matching rows")
+
+        if len(df):
             st.dataframe(df, use_container_width=True, hide_index=True)
+        elif page > 1:
+            st.info("No rows on this page.")
         else:
             st.info("No data in this table yet.")
 
-        st.divider()
-
     except Exception as e:
-        st.error(f"Error loading {table_name}: {e}")
+        st.error(f"Error loading {full_name(table)}: {e}")
+
+
+def display_layer(tables: list, caption: str, empty_message: str, key: str):
+    """List a layer's tables from metadata and render only the selected one."""
+    if not tables:
+        st.info(empty_message)
+        return
+
+    st.caption(caption)
+    st.dataframe(
+        [
+            {
+                "table": full_name(t),
+                "kind": t["kind"],
+                "rows (approx.)": t["estimated_rows"],
+            }
+            for t in tables
+        ],
+        use_container_width=True,
+        hide_index=True,
+    )
+
+    names = [full_name(t) for t in tables]
+    choice = st.selectbox("Table", names, key=f"{key}:table")
+    display_table(tables[names.index(choice)])
 
 
 # Add refresh button
 if st.button("🔄 Refresh Data", type="primary"):
+    st.cache_data.clear()
     st.rerun()
 
-# Display Bronze Layer
-if bronze:
-    st.header("🥉 Bronze Layer (Flattened Raw Data)")
-    st.caption("Flattened tables loaded from JSON files in datalake/raw/")
-
-    for table in sorted(bronze):
-        display_table(table)
-else:
-    st.warning("No bronze tables found. Run `dbt run --select bronze.*` to create bronze tables.")
-
-# Display Hubs
-if hubs:
-    st.header("🎯 Hubs (Business Keys)")
-    st.caption("Core business entities with immutable keys")
-
-    for table in sorted(hubs):
-        display_table(table)
-else:
-    st.warning("No hub tables found. Run `dbt run --select silver.hubs.*` to create hubs.")
-
-# Display Links
-if links:
-    st.header("🔗 Links (Relationships)")
-    st.caption("Relationships between hubs")
-
-    for table in sorted(links):
-        display_table(table)
-else:
-    st.info("No link tables found. Run `dbt run --select silver.links.*` to create links.")
-
-# Display Satellites
-if sats:
-    st.header("🛰️ Satellites (Descriptive Data)")
-    st.caption("Time-variant descriptive attributes and facts")
-
-    for table in sorted(sats):
-        display_table(table)
-else:
-    st.info("No satellite tables found. Run `dbt run --select silver.satellites.*` to create satellites.")
+# Each tab queries only its selected table, one page at a time
+bronze_tab, hubs_tab, links_tab, sats_tab, gold_tab = st.tabs([
+    "🥉 Bronze", "🎯 Hubs", "🔗 Links", "🛰️ Satellites", "🥇 Gold"
+])
+
+with bronze_tab:
+    display_layer(
+        bronze,
+        "Flattened tables loaded from JSON files in datalake/raw/",
+        "No bronze tables found. Run `dbt run --select bronze.*` to create bronze tables.",
+        "bronze",
+    )
+
+with hubs_tab:
+    display_layer(
+        hubs,
+        "Core business entities with immutable keys",
+        "No hub tables found. Run `dbt run --select silver.hubs.*` to create hubs.",
+        "hubs",
+    )
+
+with links_tab:
+    display_layer(
+        links,
+        "Relationships between hubs",
+        "No link tables found. Run `dbt run --select silver.links.*` to create links.",
+        "links",
+    )
+
+with sats_tab:
+    display_layer(
+        sats,
+        "Time-variant descriptive attributes and facts",
+        "No satellite tables found. Run `dbt run --select silver.satellites.*` to create satellites.",
+        "sats",
+    )
+
+with gold_tab:
+    display_layer(
+        gold,
+        "Pre-aggregated analytics built by dbt",
+        "No gold tables found. Run `dbt run --select gold.*` to create gold tables.",
+        "gold",
+    )
 
 # Sidebar with info
 with st.sidebar:
     st.header("About")
     st.markdown("""
-    This console displays the Bronze and Silver layers for weather data.
+    This console displays the Bronze, Silver and Gold layers for weather data.
+    Tables are paged; sizes come from catalog metadata.
 
     **Bronze Layer (Flattened Raw):**
     - Raw data loaded from JSON files
@@ -180,4 +264,24 @@ dbt docs serve
 
     st.divider()
 
+    st.header("Query Profiling")
+    profiler.enabled = st.toggle("Profile queries", value=profiler.enabled)
+    if profiler.enabled:
+        st.caption(f"Queries over {profiler.slow_ms:g} ms are logged with their DuckDB profile.")
+        slowest = profiler.slowest(10)
+        if slowest:
+            st.dataframe(
+                [{"query": q["query"], "runs": q["count"], "total ms": q["total_ms"], "max ms": q["max_ms"]}
+                 for q in slowest],
+                use_container_width=True,
+                hide_index=True,
+            )
+        for entry in reversed(list(profiler.slow_queries)):
+            with st.expander(f"{entry['elapsed_ms']:.0f} ms · {entry['query'][:60]}"):
+                st.code(entry["sql"], language="sql")
+                if entry["plan"]:
+                    st.code(entry["plan"])
+
+    st.divider()
+
     st.caption("Built with Streamlit + DuckDB")
@@ -8,6 +8,9 @@ from .writer import (
     save_resort_data,
     collect_all_resorts,
 )
+from .buffer import BufferedLakeWriter
+from .recovery import recover_lake
+from .sharding import HashRing, LeaseTable
 
 __all__ = [
     "save_raw_data",
@@ -16,4 +19,8 @@ __all__ = [
     "get_latest_raw_file",
     "save_resort_data",
     "collect_all_resorts",
+    "BufferedLakeWriter",
+    "recover_lake",
+    "HashRing",
+    "LeaseTable",
 ]
@@ -0,0 +1,301 @@
+"""
+Historical observation backfill.
+
+The collection cycle only fetches ``/observations/latest``, so any gap in
+collection is otherwise lost. This pages through
+``/stations/{id}/observations?start=&end=`` for every station linked to a
+resort and lands each page in the lake as soon as it arrives:
+
+    datalake/raw/observation_history/KPWM-0001_2025-12-30T12-00-00.json
+
+Stations are fetched concurrently. A per-station watermark records the time
+range already landed, so reruns only fetch what is missing:
+
+    python -m datalake.backfill --days 7
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .writer import save_raw_data
+
+CATEGORY = "observation_history"
+
+# Time range already landed per station
+WATERMARKS_PATH = os.getenv(
+    "BACKFILL_WATERMARKS_PATH",
+    "datalake/state/observation_watermarks.json"
+)
+
+# Recent observations can still be published late; the default end stays
+# this far behind now so they aren't marked as covered too early
+PUBLISH_LAG = timedelta(hours=1)
+
+_watermarks_lock = threading.Lock()
+
+
+def _utc_naive(value: datetime) -> datetime:
+    """Normalize to a naive UTC datetime (naive input is assumed UTC)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def load_watermarks(path: str = WATERMARKS_PATH) -> Dict[str, Tuple[datetime, datetime]]:
+    """
+    Load per-station covered ranges.
+
+    Args:
+        path: Watermark file
+
+    Returns:
+        Dictionary mapping station ID to (start, end) in UTC
+    """
+    path = Path(path)
+    if not path.exists():
+        return {}
+
+    with open(path, 'r') as f:
+        data = json.load(f)
+
+    return {
+        station: (datetime.fromisoformat(r["start"]), datetime.fromisoformat(r["end"]))
+        for station, r in data.items()
+    }
+
+
+def save_watermarks(watermarks: Dict[str, Tuple[datetime, datetime]], path: str = WATERMARKS_PATH):
+    """
+    Save per-station covered ranges.
+
+    Written to a temp file and renamed so a crash never leaves a truncated
+    watermark file behind.
+
+    Args:
+        watermarks: Dictionary mapping station ID to (start, end) in UTC
+        path: Watermark file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    data = {
+        station: {"start": start.isoformat(), "end": end.isoformat()}
+        for station, (start, end) in sorted(watermarks.items())
+    }
+
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def missing_windows(
+    covered: Optional[Tuple[datetime, datetime]],
+    start: datetime,
+    end: datetime
+) -> List[Tuple[datetime, datetime]]:
+    """
+    Get the parts of [start, end] not yet covered.
+
+    Windows always extend to the covered range so it stays one contiguous
+    range (a request entirely before it also fills the gap in between).
+
+    Args:
+        covered: Range already landed, or None
+        start: Requested start
+        end: Requested end
+
+    Returns:
+        Windows to fetch (at most one before and one after the covered range)
+    """
+    if covered is None:
+        return [(start, end)] if start < end else []
+
+    covered_start, covered_end = covered
+    windows = []
+    if start < covered_start:
+        windows.append((start, covered_start))
+    if end > covered_end:
+        windows.append((covered_end, end))
+
+    return windows
+
+
+def get_linked_stations() -> List[str]:
+    """
+    Get the IDs of every station linked to a resort.
+
+    Returns:
+        Sorted station IDs from the silver link_resort_station table
+    """
+    from db.session import execute_query
+
+    rows = execute_query("""
+        SELECT DISTINCT s.station_id
+        FROM main_silver.link_resort_station l
+        INNER JOIN main_silver.hub_station s
+            ON l.station_key = s.station_key
+        ORDER BY s.station_id
+    """)
+    return [row[0] for row in rows]
+
+
+def backfill_station(
+    client,
+    station_id: str,
+    windows: List[Tuple[datetime, datetime]],
+    watermarks: Dict[str, Tuple[datetime, datetime]],
+    watermarks_path: str = WATERMARKS_PATH,
+    page_limit: int = 500
+) -> dict:
+    """
+    Fetch and land a station's observations for the given windows.
+
+    Each page is written before the next one is requested. The station's
+    watermark is extended after each completed window, so an interrupted
+    run resumes from the last finished window.
+
+    Args:
+        client: WeatherClient instance (not shared between threads)
+        station_id: Station identifier
+        windows: Windows from missing_windows()
+        watermarks: Shared watermark dictionary (updated in place)
+        watermarks_path: Watermark file
+        page_limit: Observations per page
+
+    Returns:
+        Report with windows, pages and observations landed
+    """
+    fetched_at = datetime.now()
+    report = {"windows": 0, "pages": 0, "observations": 0}
+
+    for window_start, window_end in windows:
+        for page in client.iter_station_observations(
+            station_id, start=window_start, end=window_end, limit=page_limit
+        ):
+            report["pages"] += 1
+            report["observations"] += len(page["features"])
+
+            # Pages of one run share the fetch timestamp; the page number
+            # keeps their file names apart
+            save_raw_data(
+                CATEGORY,
+                {"type": page.get("type"), "features": page["features"]},
+                f"{station_id}-{report['pages']:04d}",
+                fetched_at
+            )
+
+        with _watermarks_lock:
+            covered = watermarks.get(station_id)
+            if covered:
+                window_start = min(window_start, covered[0])
+                window_end = max(window_end, covered[1])
+            watermarks[station_id] = (window_start, window_end)
+            save_watermarks(watermarks, watermarks_path)
+
+        report["windows"] += 1
+
+    return report
+
+
+def backfill_observations(
+    start: datetime,
+    end: datetime = None,
+    stations: List[str] = None,
+    max_workers: int = 4,
+    page_limit: int = 500,
+    client_factory: Callable = None,
+    watermarks_path: str = WATERMARKS_PATH
+) -> Dict[str, dict]:
+    """
+    Backfill observation history for resort stations.
+
+    Args:
+        start: Earliest observation time to cover (naive datetimes are UTC)
+        end: Latest observation time to cover (defaults to now - PUBLISH_LAG)
+        stations: Station IDs (defaults to every station in link_resort_station)
+        max_workers: Stations fetched concurrently
+        page_limit: Observations per page
+        client_factory: Callable returning a WeatherClient (one per station)
+        watermarks_path: Watermark file
+
+    Returns:
+        Report per station (or {"error": ...} for stations that failed)
+    """
+    if client_factory is None:
+        from clients import WeatherClient
+        client_factory = WeatherClient
+
+    start = _utc_naive(start)
+    end = _utc_naive(end or datetime.now(timezone.utc) - PUBLISH_LAG)
+
+    if stations is None:
+        stations = get_linked_stations()
+
+    watermarks = load_watermarks(watermarks_path)
+    work = {
+        station_id: missing_windows(watermarks.get(station_id), start, end)
+        for station_id in stations
+    }
+
+    results = {}
+    for station_id, windows in work.items():
+        if not windows:
+            results[station_id] = {"windows": 0, "pages": 0, "observations": 0}
+            print(f"  - {station_id}: already covered")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                backfill_station,
+                client_factory(),
+                station_id,
+                windows,
+                watermarks,
+                watermarks_path,
+                page_limit,
+            ): station_id
+            for station_id, windows in work.items()
+            if windows
+        }
+
+        for future in as_completed(futures):
+            station_id = futures[future]
+            try:
+                results[station_id] = future.result()
+                print(f"  ✓ {station_id}: {results[station_id]['observations']} observations "
+                      f"in {results[station_id]['pages']} pages")
+            except Exception as e:
+                results[station_id] = {"error": str(e)}
+                print(f"  ✗ {station_id}: {e}")
+
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Backfill station observation history")
+    parser.add_argument("--days", type=int, default=7, help="How far back to cover")
+    parser.add_argument("--station", action="append", help="Station ID (repeatable)")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"Backfilling {args.days} days of observations...\n")
+    results = backfill_observations(
+        start=datetime.now(timezone.utc) - timedelta(days=args.days),
+        stations=args.station,
+        max_workers=args.workers,
+    )
+
+    total = sum(r.get("observations", 0) for r in results.values())
+    failed = sum(1 for r in results.values() if "error" in r)
+    print(f"\n✓ Landed {total} observations from {len(results) - failed} stations"
+          + (f" ({failed} failed)" if failed else ""))
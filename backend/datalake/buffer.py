@@ -0,0 +1,243 @@
+"""
+Buffered data lake writer.
+
+Fetch workers hand records to a bounded in-memory queue and carry on; a few
+background threads serialize them into temp files. flush() makes the temp
+files durable as a group and only then moves them into place, so files
+appear in the lake complete and durable:
+
+    with BufferedLakeWriter() as writer:
+        writer.save_raw_data('forecasts', forecast, 'Sugarloaf', timestamp)
+        ...
+        writer.flush()      # everything submitted so far has landed
+
+On Linux a flush costs two syncfs(2) calls per filesystem (one for the temp
+files, one for the renames), however many files it lands; elsewhere each
+file and directory is fsynced. flush_async() runs the flush on a background
+thread, so fetch loops never wait on the disk for it.
+
+When the queue is full, save_raw_data blocks until a writer thread catches
+up, so a slow disk slows fetching down instead of growing memory.
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+from telemetry import metrics
+
+from .writer import commit_temp_file, fsync_path, raw_file_path, raw_record, syncfs_path, write_temp_file
+
+_STOP = object()
+
+
+class BufferedLakeWriter:
+    """
+    Background writer for raw lake files.
+
+    Args:
+        max_queue: Records held in memory before save_raw_data blocks
+        writer_threads: Background threads writing files
+    """
+
+    def __init__(self, max_queue: int = 256, writer_threads: int = 2):
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._dirs: Set[Path] = set()
+        self._unsynced: List[Tuple[Path, Path]] = []  # (temp file, destination)
+        self._errors: List[tuple] = []
+        self._closed = False
+
+        self.stats = {"written": 0, "failed": 0, "fsyncs": 0}
+
+        # One flush at a time, in submission order
+        self._flusher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lake-flush")
+
+        self._threads = [
+            threading.Thread(target=self._run, name=f"lake-writer-{i}", daemon=True)
+            for i in range(writer_threads)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def save_raw_data(
+        self,
+        category: str,
+        data: Dict[str, Any],
+        identifier: str,
+        timestamp: datetime = None
+    ) -> Path:
+        """
+        Queue a record for the data lake (same arguments as writer.save_raw_data).
+
+        Returns:
+            Path the file will be written to (a sequence suffix is added at
+            flush if the name is taken by a different record)
+
+        Raises:
+            RuntimeError: If the writer is closed
+        """
+        if self._closed:
+            raise RuntimeError("BufferedLakeWriter is closed")
+
+        if timestamp is None:
+            timestamp = datetime.now()
+
+        filepath = raw_file_path(category, identifier, timestamp)
+        self._queue.put((filepath, raw_record(category, data, identifier, timestamp)))
+        return filepath
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+
+                filepath, record = item
+                try:
+                    self._ensure_dir(filepath.parent)
+                    tmp_path = write_temp_file(filepath, record, fsync=False)
+                except Exception as e:
+                    with self._lock:
+                        self._errors.append((filepath, e))
+                        self.stats["failed"] += 1
+                else:
+                    with self._lock:
+                        self._unsynced.append((tmp_path, filepath))
+            finally:
+                self._queue.task_done()
+
+    def _ensure_dir(self, directory: Path):
+        if directory not in self._dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                self._dirs.add(directory)
+
+    @staticmethod
+    def _sync(paths: List[Path]) -> Tuple[List[Path], List[tuple], int]:
+        """
+        Make writes to paths durable, with one syncfs per filesystem.
+
+        Falls back to one fsync per path where syncfs isn't available.
+
+        Returns:
+            (synced paths, [(path, error)], sync calls made)
+        """
+        by_device: Dict[int, List[Path]] = {}
+        errors = []
+        for path in paths:
+            try:
+                by_device.setdefault(os.stat(path).st_dev, []).append(path)
+            except OSError as e:
+                errors.append((path, e))
+
+        synced, calls = [], 0
+        for group in by_device.values():
+            calls += 1
+            try:
+                if syncfs_path(group[0]):
+                    synced.extend(group)
+                    continue
+            except OSError as e:
+                # No way to tell which files were hit
+                errors.extend((path, e) for path in group)
+                continue
+
+            calls -= 1
+            for path in group:
+                calls += 1
+                try:
+                    fsync_path(path)
+                    synced.append(path)
+                except OSError as e:
+                    errors.append((path, e))
+
+        return synced, errors, calls
+
+    def flush(self) -> int:
+        """
+        Wait for queued records and land them durably.
+
+        Temp files written since the last flush are synced, moved into
+        place, and then their directories are synced so the new entries
+        survive a crash too.
+
+        Returns:
+            Number of records landed
+
+        Raises:
+            OSError: If any queued record failed to write (the rest are
+                still flushed)
+        """
+        self._queue.join()
+
+        with self._lock:
+            unsynced, self._unsynced = self._unsynced, []
+            errors, self._errors = self._errors, []
+
+        started = time.perf_counter()
+        destinations = dict(unsynced)
+        synced, sync_errors, calls = self._sync([tmp_path for tmp_path, _ in unsynced])
+        errors.extend((destinations[tmp_path], e) for tmp_path, e in sync_errors)
+
+        landed = []
+        for tmp_path in synced:
+            try:
+                commit_temp_file(tmp_path, destinations[tmp_path])
+                landed.append(destinations[tmp_path])
+            except OSError as e:
+                errors.append((destinations[tmp_path], e))
+
+        _, directory_errors, directory_calls = self._sync(sorted({filepath.parent for filepath in landed}))
+        errors.extend(directory_errors)
+        metrics.observe("lake_flush_seconds", time.perf_counter() - started)
+
+        with self._lock:
+            self.stats["written"] += len(landed)
+            self.stats["failed"] += len(unsynced) - len(landed)
+            self.stats["fsyncs"] += calls + directory_calls
+
+        if errors:
+            filepath, error = errors[0]
+            raise OSError(f"{len(errors)} lake writes failed (first: {filepath}: {error})")
+
+        return len(landed)
+
+    def flush_async(self) -> Future:
+        """
+        Flush on the background flush thread.
+
+        Flushes run one at a time, in order. Each lands at least the records
+        submitted before it was requested.
+
+        Returns:
+            Future with flush()'s result (or its OSError)
+        """
+        return self._flusher.submit(self.flush)
+
+    def close(self):
+        """Flush, then stop the writer threads."""
+        if self._closed:
+            return
+
+        try:
+            self._flusher.shutdown(wait=True)
+            self.flush()
+        finally:
+            self._closed = True
+            for _ in self._threads:
+                self._queue.put(_STOP)
+            for thread in self._threads:
+                thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,196 @@
+"""
+Recovery scan for the raw data lake.
+
+Writes are atomic (see writer.py), but files landed by older writers,
+copied in by hand, or cut short by a full disk can still be partial. One bad
+file makes a bronze ``read_json(... auto_detect=true)`` fail or mis-infer
+its schema, so this moves unreadable files out of the lake before dbt reads
+it:
+
+    python -m datalake.recovery           # files landed since the last scan
+    python -m datalake.recovery --full    # every file
+
+Unreadable files go to ``datalake/quarantine/{category}/`` for inspection.
+Temp files left behind by a crashed writer are deleted once they are old
+and the process that wrote them has exited; a buffered writer keeps its
+temp files until it flushes, however long the cycle takes.
+"""
+
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Optional
+
+from .writer import DATALAKE_ROOT
+
+QUARANTINE_ROOT = os.getenv("DATALAKE_QUARANTINE_PATH", "datalake/quarantine")
+
+# Time of the last completed scan
+RECOVERY_STATE_PATH = os.getenv("DATALAKE_RECOVERY_STATE_PATH", "datalake/state/recovery.json")
+
+# Files modified shortly before the last scan are checked again (clock skew,
+# writes still in flight while it ran)
+RESCAN_MARGIN_SECONDS = 300
+
+
+def is_valid_raw_file(filepath: Path) -> bool:
+    """
+    Check that a raw file is a complete lake record.
+
+    Args:
+        filepath: Path to JSON file
+
+    Returns:
+        True if it parses as JSON with "metadata" and "data" keys
+    """
+    try:
+        with open(filepath, 'r') as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    return isinstance(record, dict) and "metadata" in record and "data" in record
+
+
+def _writer_alive(temp_name: str) -> bool:
+    """
+    Check whether the process that wrote a temp file is still running.
+
+    Temp names end in ``.{pid}.{random}.tmp``. Names without a pid (older
+    writers) count as abandoned.
+    """
+    parts = temp_name.split(".")
+    if len(parts) < 4 or not parts[-3].isdigit():
+        return False
+
+    pid = int(parts[-3])
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # exists, owned by another user
+    return True
+
+
+def _quarantine(filepath: Path, category: str, quarantine_root: str) -> Path:
+    destination_dir = Path(quarantine_root) / category
+    destination_dir.mkdir(parents=True, exist_ok=True)
+
+    destination = destination_dir / filepath.name
+    sequence = 0
+    while destination.exists():
+        sequence += 1
+        destination = destination_dir / f"{filepath.name}.{sequence}"
+
+    shutil.move(str(filepath), destination)
+    return destination
+
+
+def _load_last_scan(path: str) -> Optional[float]:
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)["last_scan"]
+    except (FileNotFoundError, KeyError, ValueError):
+        return None
+
+
+def _save_last_scan(scan_started: float, path: str):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump({"last_scan": scan_started}, f)
+    os.replace(tmp_path, path)
+
+
+def recover_lake(
+    root: str = None,
+    quarantine_root: str = QUARANTINE_ROOT,
+    full: bool = False,
+    temp_max_age_seconds: float = 3600,
+    dry_run: bool = False,
+    state_path: str = RECOVERY_STATE_PATH
+) -> dict:
+    """
+    Quarantine partial raw files and delete stale temp files.
+
+    Args:
+        root: Raw data lake root (defaults to DATALAKE_ROOT)
+        quarantine_root: Where unreadable files are moved
+        full: Check every file, not just those modified since the last scan
+        temp_max_age_seconds: Age after which a temp file whose writer has
+            exited is abandoned
+        dry_run: Only report what would be moved or deleted
+        state_path: Last-scan state file
+
+    Returns:
+        Report with files checked, quarantined paths and temp files removed
+    """
+    root = Path(root or DATALAKE_ROOT)
+    scan_started = time.time()
+
+    last_scan = None if full else _load_last_scan(state_path)
+    since = last_scan - RESCAN_MARGIN_SECONDS if last_scan else None
+
+    report = {"checked": 0, "quarantined": [], "temp_removed": 0}
+    if not root.exists():
+        return report
+
+    for category_dir in sorted(root.iterdir()):
+        if not category_dir.is_dir():
+            continue
+
+        with os.scandir(category_dir) as entries:
+            entries = list(entries)
+
+        for entry in entries:
+            mtime = entry.stat().st_mtime
+
+            # Hidden temp files from write_temp_file()
+            if entry.name.startswith(".") and entry.name.endswith(".tmp"):
+                if mtime < scan_started - temp_max_age_seconds and not _writer_alive(entry.name):
+                    report["temp_removed"] += 1
+                    if not dry_run:
+                        os.unlink(entry.path)
+                continue
+
+            if not entry.name.endswith(".json"):
+                continue
+            if since is not None and mtime < since:
+                continue
+
+            report["checked"] += 1
+            filepath = Path(entry.path)
+            if is_valid_raw_file(filepath):
+                continue
+
+            if dry_run:
+                report["quarantined"].append(str(filepath))
+            else:
+                destination = _quarantine(filepath, category_dir.name, quarantine_root)
+                report["quarantined"].append(str(destination))
+            print(f"  ⚠ Quarantined {category_dir.name}/{filepath.name}")
+
+    if not dry_run:
+        _save_last_scan(scan_started, state_path)
+
+    return report
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Quarantine partial raw lake files")
+    parser.add_argument("--full", action="store_true", help="Check every file")
+    parser.add_argument("--dry-run", action="store_true", help="Report without moving files")
+    args = parser.parse_args()
+
+    report = recover_lake(full=args.full, dry_run=args.dry_run)
+    print(f"✓ Checked {report['checked']} files: {len(report['quarantined'])} quarantined, "
+          f"{report['temp_removed']} stale temp files removed")
@@ -0,0 +1,247 @@
+"""
+Raw file archiving for the data lake.
+
+Files older than their category's retention are compacted into one gzipped
+JSON Lines file per category and month, then removed from datalake/raw so
+bronze models stop reading them:
+
+    datalake/archive/forecasts/forecasts_2025-12.jsonl.gz
+
+The newest file of each identifier is never archived, so a category can't
+be emptied by a collection pause (bronze models fail on an empty category)
+and the collector still finds each resort's latest points and stations.
+
+Each line is the original document (metadata + data), so archived data can
+be replayed with DuckDB:
+
+    SELECT * FROM read_json('datalake/archive/forecasts/*.jsonl.gz',
+                            format='newline_delimited')
+"""
+
+import gzip
+import json
+import os
+import zlib
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .writer import _split_name, fsync_path, get_file_timestamp, list_raw_files
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Overrides the archive_path in config/retention.yaml
+ARCHIVE_ROOT = os.getenv("DATALAKE_ARCHIVE_PATH")
+
+
+def archive_root_for(archive_path: str) -> Path:
+    """Resolve an archive path; relative paths are taken from the backend directory, not the CWD."""
+    path = Path(ARCHIVE_ROOT or archive_path)
+    return path if path.is_absolute() else BACKEND_DIR / path
+
+
+def _document_key(document: dict) -> tuple:
+    """Identity of a lake record: identifier, collection time and save time."""
+    metadata = document.get("metadata") or {}
+    return (metadata.get("identifier"), str(metadata.get("timestamp")), str(metadata.get("saved_at")))
+
+
+def _index_path(archive_path: Path) -> Path:
+    """Sidecar index of an archive (hidden, so archive globs don't match it)."""
+    return archive_path.with_name(f".{archive_path.name}.index.json")
+
+
+def _read_index(archive_path: Path) -> Tuple[int, set]:
+    """
+    Committed size and record keys of an archive.
+
+    Bytes past the committed size were appended by a run that crashed before
+    updating the index, and are truncated away. Archives without an index
+    (written before it existed, or index lost) are read once to rebuild it.
+
+    Args:
+        archive_path: Monthly archive file
+
+    Returns:
+        (committed size in bytes, set of record keys)
+    """
+    if not archive_path.exists():
+        return 0, set()
+
+    try:
+        index = json.loads(_index_path(archive_path).read_text())
+        size, keys = index["size"], {tuple(key) for key in index["keys"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        size, keys = None, set()
+        with gzip.open(archive_path, "rt") as archive:
+            for line in archive:
+                keys.add(_document_key(json.loads(line)))
+
+    actual = archive_path.stat().st_size
+    if size is None:
+        size = actual
+    elif actual > size:
+        os.truncate(archive_path, size)
+    elif actual < size:
+        raise RuntimeError(f"Archive {archive_path} is shorter than its index ({actual} < {size} bytes)")
+    return size, keys
+
+
+def _write_index(archive_path: Path, size: int, keys: set) -> None:
+    """Atomically replace an archive's index."""
+    index_path = _index_path(archive_path)
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({"size": size, "keys": list(keys)}, f, separators=(",", ":"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, index_path)
+
+
+def _compressed_size(lines: List[bytes]) -> int:
+    """Size of a gzip member holding lines, without writing it."""
+    compressor = zlib.compressobj(9, zlib.DEFLATED, 31)
+    size = sum(len(compressor.compress(line)) for line in lines)
+    return size + len(compressor.flush())
+
+
+def _load_document(filepath: Path) -> Optional[dict]:
+    try:
+        with open(filepath, 'r') as f:
+            document = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return document if isinstance(document, dict) else None
+
+
+def archive_files(
+    category: str,
+    files: List[Path],
+    archive_root: Path,
+    dry_run: bool = False
+) -> dict:
+    """
+    Compact raw files into monthly archives and delete the originals.
+
+    New records are appended to the month's archive as one gzip member
+    (readers treat members as one stream) and fsynced before any original
+    is deleted. A sidecar index holds the archive's committed size and
+    record keys, so a run costs the size of its new records, not of the
+    archive: bytes left by a run that crashed mid-append are truncated, and
+    records archived by a run that crashed before deleting the originals
+    are not written again.
+    Files that can't be parsed are left in place and counted as skipped.
+
+    Args:
+        category: Data category the files belong to
+        files: Raw files to archive
+        archive_root: Root directory for archives
+        dry_run: Only report what would be archived; bytes_written is
+            the estimated archive growth
+
+    Returns:
+        Report with files archived/skipped and bytes removed/written
+    """
+    by_month = defaultdict(list)
+    for filepath in files:
+        timestamp = get_file_timestamp(filepath)
+        if timestamp is not None:
+            by_month[timestamp.strftime("%Y-%m")].append(filepath)
+
+    report = {"files": 0, "skipped": 0, "bytes_removed": 0, "bytes_written": 0}
+    category_dir = archive_root / category
+
+    for month, month_files in sorted(by_month.items()):
+        archive_path = category_dir / f"{category}_{month}.jsonl.gz"
+        if dry_run:
+            lines = []
+            for filepath in month_files:
+                document = _load_document(filepath)
+                if document is None:
+                    report["skipped"] += 1
+                    continue
+                report["files"] += 1
+                report["bytes_removed"] += filepath.stat().st_size
+                lines.append(json.dumps(document, separators=(",", ":"), default=str).encode() + b"\n")
+            report["bytes_written"] += _compressed_size(lines) if lines else 0
+            continue
+
+        category_dir.mkdir(parents=True, exist_ok=True)
+        size, keys = _read_index(archive_path)
+
+        archived = []
+        with open(archive_path, "ab") as out:
+            with gzip.GzipFile(fileobj=out, mode="wb") as member:
+                for filepath in month_files:
+                    document = _load_document(filepath)
+                    if document is None:
+                        report["skipped"] += 1
+                        continue
+
+                    archived.append(filepath)
+                    key = _document_key(document)
+                    if key in keys:
+                        continue
+                    keys.add(key)
+                    line = json.dumps(document, separators=(",", ":"), default=str) + "\n"
+                    member.write(line.encode())
+            out.flush()
+            os.fsync(out.fileno())
+            new_size = out.tell()
+
+        # The index commits the member; originals go only after it is durable
+        _write_index(archive_path, new_size, keys)
+        fsync_path(category_dir)
+
+        for filepath in archived:
+            report["bytes_removed"] += filepath.stat().st_size
+            filepath.unlink()
+
+        report["files"] += len(archived)
+        report["bytes_written"] += new_size - size
+
+    return report
+
+
+def apply_raw_retention(config, now: datetime = None, dry_run: bool = False) -> dict:
+    """
+    Archive raw files older than each category's retention.
+
+    Args:
+        config: RetentionConfig from config.load_retention_config()
+        now: Reference time for cutoffs (defaults to now)
+        dry_run: Only report what would be archived
+
+    Returns:
+        Report per category plus total bytes reclaimed
+    """
+    if now is None:
+        now = datetime.now()
+
+    archive_root = archive_root_for(config.raw.archive_path)
+    report = {"categories": {}, "bytes_reclaimed": 0}
+
+    for category, days in config.raw.archive_after_days.items():
+        cutoff = now - timedelta(days=days)
+
+        # Newest first: the first file seen per identifier is kept
+        files, seen = [], set()
+        for filepath in list_raw_files(category):
+            identifier = _split_name(filepath)[0]
+            if identifier not in seen:
+                seen.add(identifier)
+                continue
+            timestamp = get_file_timestamp(filepath)
+            if timestamp is not None and timestamp <= cutoff:
+                files.append(filepath)
+
+        result = archive_files(category, files, archive_root, dry_run=dry_run)
+        result["cutoff"] = cutoff.isoformat()
+        report["categories"][category] = result
+        report["bytes_reclaimed"] += result["bytes_removed"] - result["bytes_written"]
+
+        print(f"  ✓ {category}: {result['files']} files before {cutoff:%Y-%m-%d} "
+              f"({result['bytes_removed'] / 1e6:.1f} MB → {result['bytes_written'] / 1e6:.1f} MB)")
+
+    return report
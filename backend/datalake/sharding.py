@@ -0,0 +1,236 @@
+"""
+Split resort collection across several worker processes.
+
+Two modes, both used through collect_all_resorts():
+
+Static: each worker owns the resorts that hash to its shard on a consistent
+hash ring. No coordination is needed, and changing the shard count only
+moves about 1/N of the resorts:
+
+    python -m datalake.writer --shard 0/4     # on each of 4 workers: 0/4 .. 3/4
+
+Dynamic: workers claim resorts from a shared SQLite lease table, one lease
+per (resort, cycle). A worker renews the leases it holds until their files
+are durable, then completes them; finished resorts stay claimed for the
+cycle. A crashed worker stops renewing, so its leases expire after the TTL
+and are reclaimed by the others:
+
+    python -m datalake.writer --leases datalake/state/leases.db
+"""
+
+import bisect
+import hashlib
+import os
+import socket
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+# Default lease file for dynamic mode
+LEASES_PATH = os.getenv("COLLECTION_LEASES_PATH", "datalake/state/leases.db")
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.md5(value.encode("utf-8")).digest()[:8], "big")
+
+
+class HashRing:
+    """
+    Consistent hash ring of shard indexes.
+
+    Args:
+        shard_count: Number of shards
+        replicas: Virtual nodes per shard (more gives a more even split)
+    """
+
+    def __init__(self, shard_count: int, replicas: int = 128):
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1")
+
+        self.shard_count = shard_count
+        ring = sorted(
+            (_hash(f"shard-{shard}-{replica}"), shard)
+            for shard in range(shard_count)
+            for replica in range(replicas)
+        )
+        self._points = [point for point, _ in ring]
+        self._shards = [shard for _, shard in ring]
+
+    def shard_for(self, key: str) -> int:
+        """Get the shard owning a key."""
+        position = bisect.bisect(self._points, _hash(key)) % len(self._points)
+        return self._shards[position]
+
+    def select(self, keys: List[str], shard: int) -> List[str]:
+        """Get the keys owned by a shard, in their original order."""
+        return [key for key in keys if self.shard_for(key) == shard]
+
+
+def parse_shard(value: str) -> tuple:
+    """
+    Parse a shard spec like "2/8".
+
+    Returns:
+        Tuple of (shard index, shard count)
+    """
+    index, count = (int(part) for part in value.split("/"))
+    if not 0 <= index < count:
+        raise ValueError(f"Invalid shard {value}: index must be in [0, {count})")
+    return index, count
+
+
+def current_cycle(minutes: int = 60, now: datetime = None) -> str:
+    """
+    Get the collection cycle a time falls in.
+
+    Workers started for the same run agree on the cycle without talking to
+    each other.
+
+    Args:
+        minutes: Cycle length
+        now: Time to bucket (defaults to now)
+
+    Returns:
+        Cycle start like "2025-12-30T12:00"
+    """
+    now = now or datetime.now()
+    minute_of_day = (now.hour * 60 + now.minute) // minutes * minutes
+    start = now.replace(hour=minute_of_day // 60, minute=minute_of_day % 60, second=0, microsecond=0)
+    return start.strftime("%Y-%m-%dT%H:%M")
+
+
+class LeaseTable:
+    """
+    Per-(resource, cycle) leases in a SQLite file shared by local workers.
+
+    Args:
+        path: SQLite file
+        worker_id: Lease owner (defaults to host:pid)
+        ttl_seconds: How long a lease survives without being completed or renewed
+    """
+
+    def __init__(self, path: str = LEASES_PATH, worker_id: str = None, ttl_seconds: float = 300):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.path = str(path)
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.ttl_seconds = ttl_seconds
+
+        # Autocommit; writes take the lock up front with BEGIN IMMEDIATE
+        self._con = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self._con.execute("PRAGMA journal_mode=WAL")
+        # A lease lost to power failure just gets fetched again
+        self._con.execute("PRAGMA synchronous=NORMAL")
+        self._con.execute("""
+            CREATE TABLE IF NOT EXISTS leases (
+                resource TEXT NOT NULL,
+                cycle TEXT NOT NULL,
+                owner TEXT NOT NULL,
+                status TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (resource, cycle)
+            )
+        """)
+
+    def _write(self, sql: str, params: tuple) -> int:
+        """Run one write in its own transaction and return the rows changed."""
+        self._con.execute("BEGIN IMMEDIATE")
+        try:
+            changed = self._con.execute(sql, params).rowcount
+            self._con.execute("COMMIT")
+        except Exception:
+            self._con.execute("ROLLBACK")
+            raise
+        return changed
+
+    def acquire(self, resource: str, cycle: str) -> bool:
+        """
+        Claim a resource for a cycle.
+
+        Succeeds if nobody holds it, the holder's lease expired, or this
+        worker already holds it. Completed resources can't be claimed.
+
+        Returns:
+            True if this worker now holds the lease
+        """
+        now = time.time()
+        changed = self._write("""
+            INSERT INTO leases (resource, cycle, owner, status, expires_at)
+            VALUES (?, ?, ?, 'leased', ?)
+            ON CONFLICT (resource, cycle) DO UPDATE SET
+                owner = excluded.owner,
+                expires_at = excluded.expires_at
+            WHERE leases.status = 'leased'
+              AND (leases.expires_at < ? OR leases.owner = excluded.owner)
+        """, (resource, cycle, self.worker_id, now + self.ttl_seconds, now))
+        return changed == 1
+
+    def renew(self, resource: str, cycle: str) -> bool:
+        """
+        Extend a held lease by the TTL.
+
+        Holders waiting on a buffered flush call this well before the TTL
+        runs out (collect_all_resorts renews at half of it).
+
+        Returns:
+            False if the lease was lost (expired and reclaimed, or released)
+        """
+        changed = self._write("""
+            UPDATE leases SET expires_at = ?
+            WHERE resource = ? AND cycle = ? AND owner = ? AND status = 'leased'
+        """, (time.time() + self.ttl_seconds, resource, cycle, self.worker_id))
+        return changed == 1
+
+    def complete(self, resource: str, cycle: str) -> bool:
+        """Mark a held resource done for the cycle (False if the lease was lost)."""
+        changed = self._write("""
+            UPDATE leases SET status = 'done'
+            WHERE resource = ? AND cycle = ? AND owner = ? AND status = 'leased'
+        """, (resource, cycle, self.worker_id))
+        return changed == 1
+
+    def release(self, resource: str, cycle: str):
+        """Give up a held lease so another worker can retry it."""
+        self._write("""
+            DELETE FROM leases
+            WHERE resource = ? AND cycle = ? AND owner = ? AND status = 'leased'
+        """, (resource, cycle, self.worker_id))
+
+    def purge(self, max_age_seconds: float = 86400) -> int:
+        """Delete leases that expired more than max_age_seconds ago."""
+        return self._write(
+            "DELETE FROM leases WHERE expires_at < ?",
+            (time.time() - max_age_seconds,)
+        )
+
+    def status(self, cycle: str) -> dict:
+        """Count leases by status for a cycle."""
+        rows = self._con.execute(
+            "SELECT status, COUNT(*) FROM leases WHERE cycle = ? GROUP BY status",
+            (cycle,)
+        ).fetchall()
+        return dict(rows)
+
+    def close(self):
+        self._con.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def rotate_for_worker(items: List[str], worker_id: str) -> List[str]:
+    """
+    Start each worker at a different point of the list.
+
+    Workers walking the same list from the top would contend for the same
+    leases; rotating by worker spreads their first claims out.
+    """
+    if not items:
+        return items
+    offset = _hash(worker_id) % len(items)
+    return items[offset:] + items[:offset]
@@ -2,13 +2,25 @@
 Data lake writer for landing raw API data.
 
 Saves API responses as JSON files in organized directory structure.
+
+Files are written to a hidden temp file, fsynced, then linked into place, so
+a crash never leaves a truncated ``.json`` file for the bronze models to
+read. A second record for the same identifier and second gets a sequence
+suffix (``Sugarloaf_2025-12-30T12-00-00.1.json``) instead of overwriting;
+writing an identical record again is a no-op.
 """
 
+import errno
 import json
 import os
+import time
+import uuid
+from concurrent import futures
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+from telemetry import CycleLog, metrics
 
 
 # Get data lake root from environment or use default
@@ -44,17 +56,48 @@ def save_raw_data(
     if timestamp is None:
         timestamp = datetime.now()
 
-    # Create category directory
-    category_dir = Path(DATALAKE_ROOT) / category
-    category_dir.mkdir(parents=True, exist_ok=True)
+    filepath = raw_file_path(category, identifier, timestamp)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    return write_raw_file(filepath, raw_record(category, data, identifier, timestamp))
 
-    # Generate filename with timestamp
+
+def raw_file_path(category: str, identifier: str, timestamp: datetime, root: str = None) -> Path:
+    """
+    Get the lake path for a record.
+
+    Args:
+        category: Data category
+        identifier: Unique identifier
+        timestamp: Collection timestamp
+        root: Lake root (defaults to DATALAKE_ROOT)
+
+    Returns:
+        Path like datalake/raw/forecasts/Sugarloaf_2025-12-30T12-00-00.json
+    """
     timestamp_str = timestamp.strftime("%Y-%m-%dT%H-%M-%S")
-    filename = f"{identifier}_{timestamp_str}.json"
-    filepath = category_dir / filename
+    return Path(root or DATALAKE_ROOT) / category / f"{identifier}_{timestamp_str}.json"
 
-    # Add metadata
-    data_with_metadata = {
+
+def raw_record(
+    category: str,
+    data: Dict[str, Any],
+    identifier: str,
+    timestamp: datetime
+) -> Dict[str, Any]:
+    """
+    Wrap an API response with lake metadata.
+
+    Args:
+        category: Data category
+        data: Dictionary to save
+        identifier: Unique identifier
+        timestamp: Collection timestamp
+
+    Returns:
+        Dictionary with "metadata" and "data" keys
+    """
+    return {
         "metadata": {
             "saved_at": datetime.now().isoformat(),
             "category": category,
@@ -64,11 +107,168 @@ def save_raw_data(
         "data": data
     }
 
-    # Save JSON
-    with open(filepath, 'w') as f:
-        json.dump(data_with_metadata, f, indent=2, default=str)
 
-    return filepath
+def fsync_path(path: Path):
+    """fsync a file or directory by path."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+# libc syncfs(2), resolved on first use; False where unavailable
+_syncfs = None
+
+
+def syncfs_path(path: Path) -> bool:
+    """
+    Flush every pending write on the filesystem holding path, in one call.
+
+    Uses Linux syncfs(2), which also reports writeback errors of files
+    written through other descriptors (Linux 5.8+).
+
+    Args:
+        path: Any file or directory on the filesystem
+
+    Returns:
+        False if syncfs isn't available (fsync each path instead)
+
+    Raises:
+        OSError: If the filesystem reported a write error
+    """
+    global _syncfs
+    if _syncfs is None:
+        import ctypes
+        try:
+            _syncfs = ctypes.CDLL(None, use_errno=True).syncfs
+        except (AttributeError, OSError):
+            _syncfs = False
+    if _syncfs is False:
+        return False
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if _syncfs(fd) != 0:
+            import ctypes
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error), str(path))
+    finally:
+        os.close(fd)
+    return True
+
+
+def write_temp_file(filepath: Path, record: Dict[str, Any], fsync: bool = True) -> Path:
+    """
+    Write a wrapped record to a hidden temp file next to its destination.
+
+    Temp names don't end in .json, so bronze models never read them, and
+    carry the writer's pid so recovery can tell a live writer's files from
+    abandoned ones.
+
+    Args:
+        filepath: Destination (its directory must exist)
+        record: Record from raw_record()
+        fsync: fsync the temp file before returning
+
+    Returns:
+        Path to the temp file
+    """
+    tmp_path = filepath.with_name(f".{filepath.name}.{os.getpid()}.{uuid.uuid4().hex[:12]}.tmp")
+    category = filepath.parent.name
+
+    # Compact, in one call: indent (and json.dump's chunked writes) bypass
+    # the C encoder, which made serialization most of the cost of a write
+    with metrics.timer("lake_serialize_seconds", category=category):
+        text = json.dumps(record, separators=(",", ":"), default=str)
+
+    with metrics.timer("lake_write_seconds", category=category):
+        with open(tmp_path, 'w') as f:
+            f.write(text)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    # ensure_ascii: characters are bytes
+    metrics.inc("lake_written_bytes_total", len(text), category=category)
+    return tmp_path
+
+
+def _same_data(path_a: Path, path_b: Path) -> bool:
+    """Check whether two raw files hold the same response (metadata ignored)."""
+    try:
+        with open(path_a, 'r') as a, open(path_b, 'r') as b:
+            return json.load(a).get('data') == json.load(b).get('data')
+    except (OSError, ValueError, AttributeError):
+        return False
+
+
+def commit_temp_file(tmp_path: Path, filepath: Path) -> Path:
+    """
+    Move a written temp file into place without overwriting anything.
+
+    The temp file is hard-linked to the destination, which fails atomically
+    if the name is taken. A taken name holding the same response means the
+    record already landed, so the temp file is dropped; otherwise the next
+    free sequence suffix is used.
+
+    Args:
+        tmp_path: Path from write_temp_file()
+        filepath: Intended destination
+
+    Returns:
+        Path the record landed at
+    """
+    candidate = filepath
+    sequence = 0
+    outcome = "landed"
+
+    while True:
+        try:
+            os.link(tmp_path, candidate)
+        except FileExistsError:
+            if _same_data(candidate, tmp_path):
+                outcome = "duplicate"
+                break
+            sequence += 1
+            candidate = filepath.with_name(f"{filepath.stem}.{sequence}{filepath.suffix}")
+            continue
+        except OSError as e:
+            # Filesystems without hard links: check-then-rename instead
+            if e.errno not in (errno.EPERM, errno.ENOTSUP, errno.EOPNOTSUPP):
+                raise
+            if candidate.exists():
+                sequence += 1
+                candidate = filepath.with_name(f"{filepath.stem}.{sequence}{filepath.suffix}")
+                continue
+            os.replace(tmp_path, candidate)
+            metrics.inc("lake_files_total", category=filepath.parent.name, outcome=outcome)
+            return candidate
+        break
+
+    os.unlink(tmp_path)
+    metrics.inc("lake_files_total", category=filepath.parent.name, outcome=outcome)
+    return candidate
+
+
+def write_raw_file(filepath: Path, record: Dict[str, Any], fsync: bool = True) -> Path:
+    """
+    Write a wrapped record as JSON, atomically.
+
+    Args:
+        filepath: Intended destination (its directory must exist)
+        record: Record from raw_record()
+        fsync: Make the file and its directory entry durable before returning
+
+    Returns:
+        Path the record landed at (may carry a sequence suffix)
+    """
+    tmp_path = write_temp_file(filepath, record, fsync)
+    with metrics.timer("lake_commit_seconds", category=filepath.parent.name):
+        landed = commit_temp_file(tmp_path, filepath)
+        if fsync:
+            fsync_path(filepath.parent)
+    return landed
 
 
 def load_raw_data(filepath: Path) -> Dict[str, Any]:
@@ -87,6 +287,40 @@ def load_raw_data(filepath: Path) -> Dict[str, Any]:
     return full_data.get('data', full_data)
 
 
+def _saver(writer=None):
+    """Get the save function: queued through a BufferedLakeWriter, or direct."""
+    return writer.save_raw_data if writer is not None else save_raw_data
+
+
+def get_file_timestamp(filepath: Path) -> Optional[datetime]:
+    """
+    Extract the collection timestamp from a raw file name.
+
+    Args:
+        filepath: Path like identifier_2025-12-30T12-00-00.json (or with a
+            sequence suffix, identifier_2025-12-30T12-00-00.1.json)
+
+    Returns:
+        Timestamp, or None if the name doesn't match the expected format
+    """
+    try:
+        timestamp_part = _split_name(filepath)[1]
+        return datetime.strptime(timestamp_part, "%Y-%m-%dT%H-%M-%S")
+    except (ValueError, IndexError):
+        return None
+
+
+def _split_name(filepath: Path) -> Tuple[str, str, int]:
+    """
+    Split a raw file name into (identifier, timestamp, sequence).
+
+    Identifiers may contain underscores; the timestamp never does.
+    """
+    identifier, _, rest = filepath.name[:-len(".json")].rpartition('_')
+    timestamp_part, _, sequence = rest.partition('.')
+    return identifier, timestamp_part, int(sequence) if sequence.isdigit() else 0
+
+
 def list_raw_files(
     category: str,
     identifier: str = None,
@@ -122,33 +356,30 @@ def list_raw_files(
 
     # Filter by identifier if specified
     if identifier:
-        all_files = [f for f in all_files if f.name.startswith(f"{identifier}_")]
+        all_files = [f for f in all_files if _split_name(f)[0] == identifier]
 
     # Filter by date range if specified
     if start_date or end_date:
         filtered_files = []
         for filepath in all_files:
-            try:
-                # Extract timestamp from filename
-                # Format: identifier_2025-12-30T12-00-00.json
-                timestamp_part = filepath.stem.split('_', 1)[1]
-                file_timestamp = datetime.strptime(timestamp_part, "%Y-%m-%dT%H-%M-%S")
-
-                # Check date range
-                if start_date and file_timestamp < start_date:
-                    continue
-                if end_date and file_timestamp > end_date:
-                    continue
+            file_timestamp = get_file_timestamp(filepath)
+
+            # Skip files that don't match expected format
+            if file_timestamp is None:
+                continue
 
-                filtered_files.append(filepath)
-            except (ValueError, IndexError):
-                # Skip files that don't match expected format
+            # Check date range
+            if start_date and file_timestamp < start_date:
+                continue
+            if end_date and file_timestamp > end_date:
                 continue
 
+            filtered_files.append(filepath)
+
         all_files = filtered_files
 
-    # Sort by timestamp (newest first)
-    all_files.sort(reverse=True)
+    # Sort by timestamp, then sequence (newest first)
+    all_files.sort(key=lambda f: (*_split_name(f)[1:], f.name), reverse=True)
 
     return all_files
 
@@ -168,166 +399,530 @@ def get_latest_raw_file(category: str, identifier: str) -> Path:
     return files[0] if files else None
 
 
-def save_resort_data(resort_name: str, lat: float, lon: float, client) -> dict:
+# Categories collected per resort; everything after points is derived from
+# the resort's points metadata
+RESORT_CATEGORIES = [
+    "points",
+    "forecasts",
+    "hourly",
+    "grid_data",
+    "stations",
+    "observations",
+    "zones",
+]
+
+
+def get_resort_points(resort_name: str, lat: float, lon: float, client, writer=None):
     """
-    Fetch and save all data for a resort.
+    Get a resort's points metadata, from the lake when already landed.
+
+    Points almost never change, so they are only fetched (and saved) when
+    the resort has no points file yet.
 
     Args:
         resort_name: Resort identifier
         lat: Latitude
         lon: Longitude
         client: WeatherClient instance
+        writer: Optional BufferedLakeWriter for the saved file
 
     Returns:
-        Dictionary of saved file paths by category
+        PointsResponse
     """
-    timestamp = datetime.now()
-    saved_files = {}
+    from models.api import PointsResponse
+
+    filepath = get_latest_raw_file('points', resort_name)
+    if filepath:
+        metrics.inc("collection_cache_hits_total", category="points", source="lake")
+        return PointsResponse(**load_raw_data(filepath))
 
-    # 1. Get points (grid metadata)
-    print(f"  → Fetching points...")
     points = client.get_points(lat, lon)
-    saved_files['points'] = save_raw_data(
-        'points',
-        points.model_dump(),
-        resort_name,
-        timestamp
-    )
-
-    # 2. Get forecasts (12-hour periods)
-    print(f"  → Fetching 12-hour forecast...")
-    forecast = client.get_forecast_from_points(points)
-    saved_files['forecasts'] = save_raw_data(
-        'forecasts',
-        forecast.model_dump(),
-        resort_name,
-        timestamp
-    )
-
-    # 3. Get hourly forecast
-    print(f"  → Fetching hourly forecast...")
-    hourly = client.get_hourly_forecast_from_points(points)
-    saved_files['hourly'] = save_raw_data(
-        'hourly',
-        hourly.model_dump(),
-        resort_name,
-        timestamp
-    )
-
-    # 4. Get grid data (raw numerical forecasts)
-    print(f"  → Fetching grid data...")
+    _saver(writer)('points', _dump(points, 'points'), resort_name)
+    return points
+
+
+# Landed stations this close to a resort are used without asking the API
+STATION_RADIUS_KM = 50
+
+
+def get_resort_station_ids(resort_name: str, lat: float, lon: float, points, client, writer=None) -> List[str]:
+    """
+    Get a resort's observation station IDs, without the API when possible.
+
+    Tried in order: NWS stations within STATION_RADIUS_KM in the index of
+    landed stations data (any resort's), the resort's own landed stations
+    file, then the /stations API.
+
+    Args:
+        resort_name: Resort identifier
+        lat: Latitude
+        lon: Longitude
+        points: PointsResponse for the resort
+        client: WeatherClient instance
+        writer: Optional BufferedLakeWriter for the saved file
+
+    Returns:
+        Station IDs, nearest first
+    """
+    from spatial import load_lake_station_index
+
+    nearby = load_lake_station_index().within_radius(lat, lon, radius_km=STATION_RADIUS_KM)
+    if nearby:
+        metrics.inc("collection_cache_hits_total", category="stations", source="index")
+        return [station.station_id for station in nearby]
+
+    filepath = get_latest_raw_file('stations', resort_name)
+    if filepath:
+        metrics.inc("collection_cache_hits_total", category="stations", source="lake")
+        stations_data = load_raw_data(filepath)
+    else:
+        stations_url = points.properties.observationStations
+        stations_data = client._get(stations_url.replace(client.BASE_URL, ""))
+        _saver(writer)('stations', stations_data, resort_name)
+
+    return station_ids_from(stations_data)
+
+
+def _dump(response, category: str) -> Dict[str, Any]:
+    """model_dump a response for the lake, timing it."""
+    with metrics.timer("lake_dump_seconds", category=category):
+        return response.model_dump()
+
+
+def station_ids_from(stations_data: Dict[str, Any]) -> List[str]:
+    """Get station IDs from an observation stations response."""
+    return [
+        feature["properties"]["stationIdentifier"]
+        for feature in stations_data.get("features", [])
+    ]
+
+
+def fetch_resort_category(
+    category: str,
+    resort_name: str,
+    lat: float,
+    lon: float,
+    client,
+    timestamp: datetime = None,
+    points=None,
+    station_ids: Optional[List[str]] = None,
+    writer=None
+) -> Tuple[Path, Dict[str, Any]]:
+    """
+    Fetch and save one category of data for a resort.
+
+    Points and zones are served from the lake, without a request, while the
+    zone index of landed zones resolves the resort to a current zone (see
+    _landed_points and _landed_zone); the landed file is returned.
+    Response headers are left on ``client.last_response_headers``.
+
+    Args:
+        category: One of RESORT_CATEGORIES
+        resort_name: Resort identifier
+        lat: Latitude
+        lon: Longitude
+        client: WeatherClient instance
+        timestamp: Optional timestamp (defaults to now)
+        points: Optional PointsResponse (loaded via get_resort_points if omitted)
+        station_ids: Optional station IDs for observations (loaded via
+            get_resort_station_ids if omitted)
+        writer: Optional BufferedLakeWriter; the file is queued instead of
+            written before returning
+
+    Returns:
+        Tuple of (saved file path, saved data)
+
+    Raises:
+        ValueError: If category is unknown or the resort has no stations
+    """
+    if category not in RESORT_CATEGORIES:
+        raise ValueError(f"Unknown category: {category}")
+
+    started = time.perf_counter()
+    outcome = "failed"
     try:
-        grid_data = client.get_grid_data_from_points(points)
-        saved_files['grid_data'] = save_raw_data(
-            'grid_data',
-            grid_data.model_dump(),
-            resort_name,
-            timestamp
+        result = _fetch_category(
+            category, resort_name, lat, lon, client, timestamp, points, station_ids, writer
         )
-    except Exception as e:
-        print(f"    ⚠ Grid data failed: {e}")
+        outcome = "ok"
+        return result
+    finally:
+        metrics.observe("collection_fetch_seconds", time.perf_counter() - started, category=category)
+        metrics.inc("collection_fetches_total", category=category, outcome=outcome)
 
-    # 5. Get nearest observation stations
-    print(f"  → Fetching observation stations...")
-    try:
-        # Get stations from the observationStations endpoint
+
+def _current_zone_id(lat: float, lon: float) -> Optional[str]:
+    """Landed forecast zone containing a point, if its geometry is current."""
+    from spatial import load_zone_index
+
+    zones = load_zone_index()
+    zone_id = zones.resolve(lat, lon)
+    return zone_id if zone_id and zones.is_current(zone_id) else None
+
+
+def _landed_points(resort_name: str, lat: float, lon: float) -> Optional[Tuple[Path, Dict[str, Any]]]:
+    """
+    A resort's landed points, if still current.
+
+    Points are current while the landed zone index still puts the resort in
+    the forecastZone they name.
+
+    Returns:
+        (file path, data), or None when /points should be called
+    """
+    filepath = get_latest_raw_file('points', resort_name)
+    if filepath is None:
+        return None
+
+    data = load_raw_data(filepath)
+    zone_url = (data.get("properties") or {}).get("forecastZone") or ""
+    if not zone_url or _current_zone_id(lat, lon) != zone_url.split('/')[-1]:
+        return None
+
+    metrics.inc("collection_cache_hits_total", category="points", source="index")
+    return filepath, data
+
+
+def _landed_zone(resort_name: str, lat: float, lon: float, save, timestamp) -> Optional[Tuple[Path, Dict[str, Any]]]:
+    """
+    A resort's zone from landed zones data, if current.
+
+    The zone is resolved from the resort's location with the zone index,
+    so neither /points nor /zones/forecast/{id} is called. A zone landed
+    by another resort is saved for this one.
+
+    Returns:
+        (file path, data), or None when /zones/forecast/{id} should be called
+    """
+    from spatial import load_zone_index
+
+    zone_id = _current_zone_id(lat, lon)
+    if zone_id is None:
+        return None
+
+    metrics.inc("collection_cache_hits_total", category="zones", source="index")
+    filepath = get_latest_raw_file('zones', resort_name)
+    if filepath:
+        data = load_raw_data(filepath)
+        if (data.get("properties") or {}).get("id") == zone_id:
+            return filepath, data
+
+    data = load_zone_index().features[zone_id]
+    return save('zones', data, resort_name, timestamp), data
+
+
+def _fetch_category(category, resort_name, lat, lon, client, timestamp, points, station_ids, writer):
+    """fetch_resort_category without the metrics."""
+    save = _saver(writer)
+
+    if category == 'points':
+        landed = _landed_points(resort_name, lat, lon)
+        if landed:
+            return landed
+        data = _dump(client.get_points(lat, lon), category)
+        return save(category, data, resort_name, timestamp), data
+
+    if category == 'zones':
+        landed = _landed_zone(resort_name, lat, lon, save, timestamp)
+        if landed:
+            return landed
+
+    if points is None:
+        points = get_resort_points(resort_name, lat, lon, client, writer)
+
+    if category == 'forecasts':
+        data = _dump(client.get_forecast_from_points(points), category)
+
+    elif category == 'hourly':
+        data = _dump(client.get_hourly_forecast_from_points(points), category)
+
+    elif category == 'grid_data':
+        data = _dump(client.get_grid_data_from_points(points), category)
+
+    elif category == 'stations':
         stations_url = points.properties.observationStations
-        endpoint = stations_url.replace(client.BASE_URL, "")
-        stations_data = client._get(endpoint)
-
-        saved_files['stations'] = save_raw_data(
-            'stations',
-            stations_data,
-            resort_name,
-            timestamp
-        )
+        data = client._get(stations_url.replace(client.BASE_URL, ""))
+
+    elif category == 'observations':
+        if station_ids is None:
+            station_ids = get_resort_station_ids(resort_name, lat, lon, points, client, writer)
+        if not station_ids:
+            raise ValueError(f"No observation stations for {resort_name}")
+        data = _dump(client.get_station_observation(station_ids[0]), category)
+
+    else:  # zones, not landed yet
+        zone_id = points.properties.forecastZone.split('/')[-1]  # e.g., "MEZ008"
+        data = client._get(f"/zones/forecast/{zone_id}")
+
+    return save(category, data, resort_name, timestamp), data
+
+
+def save_resort_data(resort_name: str, lat: float, lon: float, client, writer=None) -> dict:
+    """
+    Fetch and save all data for a resort.
+
+    Args:
+        resort_name: Resort identifier
+        lat: Latitude
+        lon: Longitude
+        client: WeatherClient instance
+        writer: Optional BufferedLakeWriter (files are queued, not yet durable)
 
-        # Extract station IDs for getting observations
-        station_ids = [
-            feature["properties"]["stationIdentifier"]
-            for feature in stations_data.get("features", [])
-        ]
+    Returns:
+        Dictionary of saved file paths by category
+    """
+    from models.api import PointsResponse
 
-    except Exception as e:
-        print(f"    ⚠ Stations failed: {e}")
-        station_ids = []
+    timestamp = datetime.now()
+    saved_files = {}
+    points = None
+    station_ids = None
 
-    # 6. Get current observation from nearest station
-    if station_ids:
-        print(f"  → Fetching observation from {station_ids[0]}...")
+    for category in RESORT_CATEGORIES:
+        print(f"  → Fetching {category}...")
         try:
-            observation = client.get_station_observation(station_ids[0])
-            saved_files['observations'] = save_raw_data(
-                'observations',
-                observation.model_dump(),
-                resort_name,
-                timestamp
+            saved_files[category], data = fetch_resort_category(
+                category, resort_name, lat, lon, client, timestamp,
+                points=points, station_ids=station_ids, writer=writer
             )
         except Exception as e:
-            print(f"    ⚠ Observation failed: {e}")
+            # Everything else depends on points; forecasts are the core data
+            if category in ('points', 'forecasts', 'hourly'):
+                raise
+            print(f"    ⚠ {category} failed: {e}")
+            continue
 
-    # 7. Get zone data (forecast zone)
-    print(f"  → Fetching zone data...")
-    try:
-        # Extract zone ID from forecastZone URL
-        zone_url = points.properties.forecastZone
-        zone_id = zone_url.split('/')[-1]  # e.g., "MEZ008"
-
-        # Get zone details by fetching the specific zone
-        zone_data = client._get(f"/zones/forecast/{zone_id}")
-        saved_files['zones'] = save_raw_data(
-            'zones',
-            zone_data,
-            resort_name,
-            timestamp
-        )
-    except Exception as e:
-        print(f"    ⚠ Zone data failed: {e}")
+        if category == 'points':
+            points = PointsResponse(**data)
+        elif category == 'stations':
+            station_ids = station_ids_from(data)
 
     return saved_files
 
 
-def collect_all_resorts(client) -> dict:
+# Resorts collected between flushes of a buffered writer. Leases are only
+# completed once their files are durable, so this bounds how long they wait.
+FLUSH_EVERY_RESORTS = 10
+
+
+def _complete_leases(leases, pending: Dict[str, float], cycle: str):
+    """Mark claimed resorts done, emptying pending."""
+    while pending:
+        name, _ = pending.popitem()
+        if not leases.complete(name, cycle):
+            print(f"  ⚠ Lease on {name} expired before completion")
+
+
+def _release_leases(leases, pending: Dict[str, float], cycle: str):
+    """Give up claimed resorts so another worker retries them, emptying pending."""
+    while pending:
+        name, _ = pending.popitem()
+        leases.release(name, cycle)
+
+
+def _renew_leases(leases, pending: Dict[str, float], cycle: str):
+    """Renew pending leases older than half their TTL, so they outlive the next flush."""
+    now = time.monotonic()
+    for name, renewed_at in list(pending.items()):
+        if now - renewed_at < leases.ttl_seconds / 2:
+            continue
+        if leases.renew(name, cycle):
+            pending[name] = now
+        else:
+            print(f"  ⚠ Lease on {name} expired before completion")
+            del pending[name]
+
+
+def _settle_flushes(leases, flushing: list, cycle: str, wait: bool = False) -> int:
+    """
+    Complete the leases of finished background flushes.
+
+    Leases of a failed flush are released instead, so another worker
+    retries those resorts (files that did land are deduplicated). Flushes
+    finish in order, so only the oldest is checked.
+
+    Args:
+        leases: LeaseTable, or None
+        flushing: (flush future, pending leases) pairs, oldest first;
+            settled pairs are removed
+        cycle: Lease cycle
+        wait: Wait for every flush, renewing its leases meanwhile
+
+    Returns:
+        Number of flushes that failed
+    """
+    failed = 0
+    while flushing:
+        future, pending = flushing[0]
+        if not future.done():
+            if not wait:
+                break
+            if leases is not None:
+                for _, waiting in flushing:
+                    _renew_leases(leases, waiting, cycle)
+            futures.wait([future], timeout=leases.ttl_seconds / 4 if leases is not None else None)
+            continue
+
+        flushing.pop(0)
+        try:
+            future.result()
+        except OSError as e:
+            print(f"  ✗ Flush failed: {e}")
+            failed += 1
+            if leases is not None:
+                _release_leases(leases, pending, cycle)
+            continue
+        except BaseException:
+            if leases is not None:
+                _release_leases(leases, pending, cycle)
+            raise
+
+        if leases is not None:
+            _complete_leases(leases, pending, cycle)
+    return failed
+
+
+def collect_all_resorts(
+    client,
+    shard: Optional[Tuple[int, int]] = None,
+    leases=None,
+    cycle: str = None,
+    writer=None
+) -> dict:
     """
     Collect data for all resorts in config.
 
+    Several workers can split the resorts between them, either statically
+    by shard or dynamically through a shared lease table (see
+    datalake.sharding). Each call is recorded as one cycle in the metrics
+    log (see telemetry.cycle).
+
     Args:
         client: WeatherClient instance
+        shard: Optional (shard index, shard count); only resorts hashing to
+            this shard are collected
+        leases: Optional LeaseTable; only resorts this worker claims for the
+            cycle are collected
+        cycle: Lease cycle (defaults to the current hour)
+        writer: Optional BufferedLakeWriter; flushed in the background
+            every FLUSH_EVERY_RESORTS resorts, and before returning. Leases
+            are only completed once their files are durable, and renewed
+            while they wait.
 
     Returns:
         Dictionary mapping resort name to saved files
     """
-    from config import load_resorts_config
+    from config import load_resort_registry
+    from .sharding import HashRing, current_cycle, rotate_for_worker
+
+    # Cached; only re-read when resorts.yaml changes
+    registry = load_resort_registry()
+    names = [resort.name for resort in registry]
+
+    if shard is not None:
+        index, count = shard
+        names = HashRing(count).select(names, index)
+
+    if leases is not None:
+        cycle = cycle or current_cycle()
+        names = rotate_for_worker(names, leases.worker_id)
 
-    config = load_resorts_config()
-    results = {}
+    shard_label = f"{shard[0]}/{shard[1]}" if shard is not None else None
+    with CycleLog("collect", shard=shard_label, lease_cycle=cycle) as cycle_log:
+        results = {}
+        pending = {}  # claimed resort -> last renewal, files not yet being flushed
+        flushing = []  # (background flush, its resorts' pending leases), oldest first
+        buffered = 0  # resorts collected since the last flush
+        failed_flushes = 0
 
-    for resort in config.resorts:
-        print(f"Collecting {resort.name}...")
         try:
-            saved = save_resort_data(
-                resort.name,
-                resort.location.latitude,
-                resort.location.longitude,
-                client
-            )
-            results[resort.name] = saved
-            print(f"  ✓ Saved {len(saved)} files")
-        except Exception as e:
-            print(f"  ✗ Failed: {e}")
-            results[resort.name] = {}
+            for name in names:
+                failed_flushes += _settle_flushes(leases, flushing, cycle)
+                if leases is not None:
+                    for waiting in [pending] + [batch for _, batch in flushing]:
+                        _renew_leases(leases, waiting, cycle)
+                    if not leases.acquire(name, cycle):
+                        continue
+                    acquired_at = time.monotonic()
+
+                resort = registry.get(name)
+                print(f"Collecting {resort.name}...")
+                started = time.perf_counter()
+                try:
+                    saved = save_resort_data(
+                        resort.name,
+                        resort.location.latitude,
+                        resort.location.longitude,
+                        client,
+                        writer
+                    )
+                    results[resort.name] = saved
+                    print(f"  ✓ Saved {len(saved)} files ({time.perf_counter() - started:.1f}s)")
+                except Exception as e:
+                    print(f"  ✗ Failed: {e}")
+                    results[resort.name] = {}
+                    if leases is not None:
+                        # Let another worker retry it this cycle
+                        leases.release(name, cycle)
+                    continue
 
+                if leases is not None:
+                    pending[name] = acquired_at
+
+                if writer is None:
+                    # Written directly, the files are already in place
+                    if leases is not None:
+                        _complete_leases(leases, pending, cycle)
+                    continue
+
+                buffered += 1
+                if buffered >= FLUSH_EVERY_RESORTS:
+                    # Fetching carries on while the flusher waits on the disk
+                    flushing.append((writer.flush_async(), pending))
+                    pending = {}
+                    buffered = 0
+        finally:
+            if writer is not None:
+                flushing.append((writer.flush_async(), pending))
+                failed_flushes += _settle_flushes(leases, flushing, cycle, wait=True)
+            elif leases is not None:
+                _release_leases(leases, pending, cycle)
+
+        cycle_log.fields["resorts"] = len(results)
+        cycle_log.fields["failed_resorts"] = sum(1 for saved in results.values() if not saved)
+        cycle_log.fields["files"] = sum(len(saved) for saved in results.values())
+        cycle_log.fields["failed_flushes"] = failed_flushes
+
+    print(f"✓ Cycle took {cycle_log.summary()}")
     return results
 
 
 if __name__ == "__main__":
-    # Test by collecting data for all resorts
+    import argparse
+
+    from .buffer import BufferedLakeWriter
+    from .sharding import LEASES_PATH, LeaseTable, parse_shard
+
+    parser = argparse.ArgumentParser(description="Collect data for all resorts")
+    parser.add_argument("--shard", type=parse_shard, help="Static shard, e.g. 0/4")
+    parser.add_argument("--leases", nargs="?", const=LEASES_PATH,
+                        help="Claim resorts from a shared lease file")
+    parser.add_argument("--cycle", help="Lease cycle (defaults to the current hour)")
+    args = parser.parse_args()
+
+    # After parsing, so --help doesn't wait for requests to import
     from clients import WeatherClient
 
     print("Collecting data for all resorts...\n")
 
     client = WeatherClient()
-    results = collect_all_resorts(client)
+    leases = LeaseTable(args.leases) if args.leases else None
+    with BufferedLakeWriter() as writer:
+        results = collect_all_resorts(
+            client, shard=args.shard, leases=leases, cycle=args.cycle, writer=writer
+        )
+    if leases is not None:
+        leases.purge()
 
     total = sum(len(files) for files in results.values())
     print(f"\n✓ Saved {total} files total")
@@ -1,23 +1,59 @@
-"""Database connection and session management."""
-
-from .session import (
-    get_connection,
-    get_session,
-    init_db,
-    drop_all_tables,
-    get_tables,
-    execute_query,
-    execute_query_df,
-)
-from .utils import generate_hash_key
-
-__all__ = [
-    "get_connection",
-    "get_session",
-    "init_db",
-    "drop_all_tables",
-    "get_tables",
-    "execute_query",
-    "execute_query_df",
-    "generate_hash_key",
-]
+"""Database connection and session management.
+
+Exports are imported on first use, so ``import db`` doesn't load duckdb,
+pyarrow or pandas until something from them is needed.
+"""
+
+import importlib
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "get_connection": "session",
+    "get_session": "session",
+    "role_settings": "session",
+    "role_env": "session",
+    "init_db": "session",
+    "drop_all_tables": "session",
+    "get_tables": "session",
+    "execute_query": "session",
+    "execute_query_df": "session",
+    "QueryCache": "session",
+    "query_cache": "session",
+    "bump_table_versions": "session",
+    "get_table_versions": "session",
+    "QueryProfiler": "profiling",
+    "profiler": "profiling",
+    "generate_hash_key": "utils",
+    "generate_hash_keys": "utils",
+    "VaultBatch": "loader",
+    "load_batch": "loader",
+    "backfill_from_lake": "loader",
+    "list_tables": "browse",
+    "table_columns": "browse",
+    "fetch_page": "browse",
+    "count_rows": "browse",
+    "QueryService": "query_service",
+    "QueryRejected": "query_service",
+    "QueryTimeout": "query_service",
+    "get_resort_conditions": "analytics",
+    "get_resort_daily_forecast": "analytics",
+    "get_forecast_run_history": "analytics",
+    "get_forecast_skill": "analytics",
+    "get_forecast_revisions": "analytics",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
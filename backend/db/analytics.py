@@ -0,0 +1,173 @@
+"""
+Query helpers for the Gold analytics layer.
+
+Gold tables are built by dbt (db/data_model/models/gold) into the
+``main_gold`` schema. They are pre-aggregated, so each helper here is a
+keyed lookup rather than an aggregation over the satellites.
+"""
+
+from datetime import datetime
+
+from .session import execute_query_df
+from .utils import generate_hash_key
+
+# dbt prefixes custom schemas with the target schema ("main")
+GOLD_SCHEMA = "main_gold"
+
+
+def get_resort_conditions(resort_name: str = None):
+    """
+    Get latest forecast rollups and current conditions.
+
+    Args:
+        resort_name: Resort to look up (optional, defaults to all resorts)
+
+    Returns:
+        pandas DataFrame with one row per resort
+    """
+    query = f"SELECT * FROM {GOLD_SCHEMA}.gold_resort_conditions"
+
+    if resort_name:
+        return execute_query_df(
+            f"{query} WHERE resort_key = ?",
+            (generate_hash_key(resort_name),)
+        )
+
+    return execute_query_df(f"{query} ORDER BY resort_name")
+
+
+def get_resort_daily_forecast(resort_name: str, days: int = 7):
+    """
+    Get the day-by-day forecast for a resort.
+
+    Args:
+        resort_name: Resort to look up
+        days: Number of days to return, starting today
+
+    Returns:
+        pandas DataFrame with one row per local calendar day
+    """
+    return execute_query_df(f"""
+        SELECT *
+        FROM {GOLD_SCHEMA}.gold_resort_daily
+        WHERE resort_key = ?
+          AND forecast_date >= current_date
+        ORDER BY forecast_date
+        LIMIT ?
+    """, (generate_hash_key(resort_name), days))
+
+
+def get_forecast_run_history(resort_name: str, runs: int = 10):
+    """
+    Get rollups for the most recent forecast runs of a resort.
+
+    Useful for "has the 72h snowfall forecast been trending up?" questions.
+
+    Args:
+        resort_name: Resort to look up
+        runs: Number of runs to return (newest first)
+
+    Returns:
+        pandas DataFrame with one row per forecast run
+    """
+    return execute_query_df(f"""
+        SELECT *
+        FROM {GOLD_SCHEMA}.gold_forecast_run_summary
+        WHERE resort_key = ?
+        ORDER BY update_time DESC
+        LIMIT ?
+    """, (generate_hash_key(resort_name), runs))
+
+
+def get_forecast_skill(
+    resort_name: str,
+    variable: str = "temperature",
+    forecast_source: str = "grid"
+):
+    """
+    Get forecast skill by lead hour for a resort.
+
+    Args:
+        resort_name: Resort to look up
+        variable: temperature, dewpoint, relative_humidity, wind_speed or wind_gust
+        forecast_source: 'grid' or 'hourly'
+
+    Returns:
+        pandas DataFrame with pair_count, bias, mae and rmse per lead hour
+    """
+    return execute_query_df(f"""
+        SELECT lead_hour, pair_count, bias, mae, rmse
+        FROM {GOLD_SCHEMA}.gold_forecast_skill
+        WHERE resort_key = ?
+          AND variable = ?
+          AND forecast_source = ?
+        ORDER BY lead_hour
+    """, (generate_hash_key(resort_name), variable, forecast_source))
+
+
+def get_forecast_revisions(
+    resort_name: str,
+    valid_start: datetime,
+    valid_end: datetime,
+    variable: str = "snowfall_mm",
+    runs: int = 5
+):
+    """
+    Get how a forecast window changed over the most recent runs.
+
+    Rebuilds each run's forecast for the window from the change log in
+    gold_forecast_revisions (as-of each run) and totals it, e.g. "how much
+    did Saturday's snowfall forecast change over the last 5 runs".
+
+    Args:
+        resort_name: Resort to look up
+        valid_start: Start of the valid-time window (UTC, inclusive)
+        valid_end: End of the valid-time window (UTC, exclusive)
+        variable: Column from gold_grid_hourly (e.g. snowfall_mm, temperature_c)
+        runs: Number of most recent runs to compare
+
+    Returns:
+        pandas DataFrame with one row per run: total/min/max of the variable
+        over the window and the change in total from the previous run
+    """
+    resort_key = generate_hash_key(resort_name)
+
+    return execute_query_df(f"""
+        WITH revisions AS (
+            SELECT valid_hour, update_time, value
+            FROM {GOLD_SCHEMA}.gold_forecast_revisions
+            WHERE resort_key = ?
+              AND variable = ?
+              AND valid_hour >= ?
+              AND valid_hour < ?
+        ),
+        recent_runs AS (
+            SELECT update_time
+            FROM {GOLD_SCHEMA}.gold_forecast_run_summary
+            WHERE resort_key = ?
+            ORDER BY update_time DESC
+            LIMIT ?
+        ),
+        run_hours AS (
+            SELECT r.update_time, h.valid_hour
+            FROM recent_runs r
+            CROSS JOIN (SELECT DISTINCT valid_hour FROM revisions) h
+        ),
+        as_of_run AS (
+            SELECT g.update_time, g.valid_hour, v.value
+            FROM run_hours g
+            ASOF JOIN revisions v
+                ON g.valid_hour = v.valid_hour
+               AND g.update_time >= v.update_time
+        )
+        SELECT
+            update_time,
+            COUNT(*) as hours,
+            SUM(value) as total,
+            MIN(value) as minimum,
+            MAX(value) as maximum,
+            SUM(value) - LAG(SUM(value)) OVER (ORDER BY update_time) as change_in_total
+        FROM as_of_run
+        GROUP BY update_time
+        ORDER BY update_time
+    """, (resort_key, variable, valid_start, valid_end, resort_key, runs))
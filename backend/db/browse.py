@@ -0,0 +1,224 @@
+"""
+Paged table browsing for the console.
+
+Everything here is pushed down to DuckDB: table sizes come from catalog
+metadata (no COUNT(*) scans), and pages are fetched with column projection,
+filters and LIMIT/OFFSET, so a page costs the same however large the table.
+
+Identifiers are checked against the catalog and quoted; filter values are
+always bound as parameters. Pass a QueryCache to serve repeat pages from
+memory until the table is reloaded.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+from .profiling import profiler
+from .session import get_session
+
+# Schemas shown in the console: Python-side vault tables and the dbt layers
+# (dbt prefixes custom schemas with the target schema, "main")
+BROWSE_SCHEMAS = ("main", "main_bronze", "main_silver", "main_gold")
+
+# Filter operators offered by the console, mapped to SQL
+FILTER_OPERATORS = {
+    "=": "=",
+    "!=": "<>",
+    ">": ">",
+    ">=": ">=",
+    "<": "<",
+    "<=": "<=",
+    "contains": "ILIKE",
+    "is null": "IS NULL",
+    "is not null": "IS NOT NULL",
+}
+
+Filter = Tuple[str, str, Optional[str]]  # (column, operator, value)
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def list_tables(con=None) -> List[dict]:
+    """
+    List browsable tables and views with their size from catalog metadata.
+
+    Args:
+        con: Optional open connection
+
+    Returns:
+        Dictionaries with schema, name, kind ("table" or "view") and
+        estimated_rows (None for views, which have no stored size)
+    """
+    query = f"""
+        SELECT schema_name, table_name, 'table' AS kind, estimated_size
+        FROM duckdb_tables()
+        WHERE schema_name IN ({", ".join("?" for _ in BROWSE_SCHEMAS)})
+        UNION ALL
+        SELECT schema_name, view_name, 'view', NULL
+        FROM duckdb_views()
+        WHERE NOT internal
+          AND schema_name IN ({", ".join("?" for _ in BROWSE_SCHEMAS)})
+        ORDER BY 1, 2
+    """
+    params = BROWSE_SCHEMAS * 2
+
+    if con is None:
+        with get_session() as con:
+            rows = con.execute(query, params).fetchall()
+    else:
+        rows = con.execute(query, params).fetchall()
+
+    return [
+        {"schema": schema, "name": name, "kind": kind, "estimated_rows": size}
+        for schema, name, kind, size in rows
+    ]
+
+
+def table_columns(con, schema: str, table: str) -> List[Tuple[str, str]]:
+    """
+    Get a table's columns.
+
+    Args:
+        con: Open connection
+        schema: Schema name
+        table: Table or view name
+
+    Returns:
+        List of (column name, data type) in table order
+
+    Raises:
+        ValueError: If the table isn't in a browsable schema
+    """
+    if schema not in BROWSE_SCHEMAS:
+        raise ValueError(f"Schema not browsable: {schema}")
+
+    rows = con.execute("""
+        SELECT column_name, data_type
+        FROM information_schema.columns
+        WHERE table_schema = ? AND table_name = ?
+        ORDER BY ordinal_position
+    """, (schema, table)).fetchall()
+
+    if not rows:
+        raise ValueError(f"Table not found: {schema}.{table}")
+    return rows
+
+
+def _where_clause(filters: Sequence[Filter], known: dict) -> Tuple[str, list]:
+    conditions, params = [], []
+
+    for column, operator, value in filters or []:
+        if column not in known:
+            raise ValueError(f"Unknown column: {column}")
+        if operator not in FILTER_OPERATORS:
+            raise ValueError(f"Unknown filter operator: {operator}")
+
+        sql_operator = FILTER_OPERATORS[operator]
+        if operator in ("is null", "is not null"):
+            conditions.append(f"{_quote(column)} {sql_operator}")
+        elif operator == "contains":
+            conditions.append(f"CAST({_quote(column)} AS VARCHAR) ILIKE ?")
+            params.append(f"%{value}%")
+        elif known[column].endswith("]") or known[column].startswith(("STRUCT", "MAP", "UNION")):
+            # Nested types: compare their text form
+            conditions.append(f"CAST({_quote(column)} AS VARCHAR) {sql_operator} ?")
+            params.append(str(value))
+        else:
+            # Cast the value, not the column, so DuckDB can still use zone
+            # maps and numbers compare as numbers
+            conditions.append(f"{_quote(column)} {sql_operator} CAST(? AS {known[column]})")
+            params.append(str(value))
+
+    if not conditions:
+        return "", params
+    return "WHERE " + " AND ".join(conditions), params
+
+
+def fetch_page(
+    con,
+    schema: str,
+    table: str,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Sequence[Filter]] = None,
+    order_by: Optional[str] = None,
+    descending: bool = False,
+    limit: int = 100,
+    offset: int = 0,
+    cache=None
+):
+    """
+    Fetch one page of a table.
+
+    Args:
+        con: Open connection
+        schema: Schema name
+        table: Table or view name
+        columns: Columns to fetch (defaults to all)
+        filters: (column, operator, value) conditions, ANDed together
+        order_by: Column to sort by (defaults to table order)
+        descending: Sort descending
+        limit: Page size
+        offset: Rows to skip
+        cache: Optional QueryCache to read through
+
+    Returns:
+        pandas DataFrame with at most limit rows
+
+    Raises:
+        ValueError: If the table, a column or an operator is unknown
+    """
+    known = dict(table_columns(con, schema, table))
+
+    columns = list(columns) if columns else list(known)
+    unknown = [column for column in columns if column not in known]
+    if unknown:
+        raise ValueError(f"Unknown columns: {unknown}")
+
+    where, params = _where_clause(filters, known)
+
+    order = ""
+    if order_by:
+        if order_by not in known:
+            raise ValueError(f"Unknown column: {order_by}")
+        order = f"ORDER BY {_quote(order_by)} {'DESC' if descending else 'ASC'} NULLS LAST"
+
+    query = f"""
+        SELECT {", ".join(_quote(column) for column in columns)}
+        FROM {_quote(schema)}.{_quote(table)}
+        {where}
+        {order}
+        LIMIT ? OFFSET ?
+    """
+    params = params + [int(limit), int(offset)]
+    if cache is not None:
+        return cache.fetch_df(con, query, params)
+    return profiler.fetch_df(con, query, params)
+
+
+def count_rows(
+    con,
+    schema: str,
+    table: str,
+    filters: Optional[Sequence[Filter]] = None,
+    cache=None
+) -> int:
+    """
+    Count matching rows exactly (scans the table; only run on request).
+
+    Args:
+        con: Open connection
+        schema: Schema name
+        table: Table or view name
+        filters: (column, operator, value) conditions
+        cache: Optional QueryCache to read through
+
+    Returns:
+        Row count
+    """
+    where, params = _where_clause(filters, dict(table_columns(con, schema, table)))
+    query = f"SELECT COUNT(*) AS n FROM {_quote(schema)}.{_quote(table)} {where}"
+
+    if cache is not None:
+        return int(cache.fetch_df(con, query, params)["n"].iloc[0])
+    return profiler.fetchall(con, query, params)[0][0]
@@ -0,0 +1,33 @@
+{#
+  Helpers for the NWS gridpoint layers stored in sat_grid_data.
+
+  Each layer is a struct of {uom, values: [{validTime, value}]} where
+  validTime is an ISO8601 interval such as "2025-12-30T12:00:00+00:00/PT6H".
+#}
+
+{% macro iso8601_duration_hours(duration) -%}
+    GREATEST(
+        COALESCE(TRY_CAST(REGEXP_EXTRACT({{ duration }}, 'P(\d+)D', 1) AS INTEGER), 0) * 24
+        + COALESCE(TRY_CAST(REGEXP_EXTRACT({{ duration }}, 'T(\d+)H', 1) AS INTEGER), 0),
+        1
+    )
+{%- endmacro %}
+
+
+{% macro grid_layer_values(relation, layer) -%}
+    SELECT
+        resort_key,
+        update_time,
+        '{{ layer }}' as layer,
+        timezone('UTC', SPLIT_PART(v.validTime, '/', 1)::TIMESTAMPTZ) as valid_start,
+        {{ iso8601_duration_hours("SPLIT_PART(v.validTime, '/', 2)") }} as duration_hours,
+        v.value
+    FROM {{ relation }}, UNNEST({{ relation }}.{{ layer }}."values") AS t(v)
+    WHERE v.value IS NOT NULL
+{%- endmacro %}
+
+
+{% macro wind_speed_mph(wind_speed) -%}
+    {#- "10 mph" or "5 to 15 mph" from the text forecasts; takes the upper bound -#}
+    TRY_CAST(REGEXP_EXTRACT({{ wind_speed }}, '(\d+)\s*mph', 1) AS DOUBLE)
+{%- endmacro %}
@@ -0,0 +1,12 @@
+{#
+  Data Vault hash key: MD5 of the values joined with '|'.
+
+  Same convention as db.utils.generate_hash_key / generate_hash_keys in
+  Python, so keys computed on either side always match.
+    {{ hash_key(['resort_key', 'station_key']) }}
+    -> MD5(resort_key || '|' || station_key)
+#}
+
+{% macro hash_key(columns) -%}
+    MD5({{ columns | join(" || '|' || ") }})
+{%- endmacro %}
@@ -0,0 +1,16 @@
+{#
+  Helpers for reading the raw data lake.
+
+  lake_has_files() lets bronze models over optional categories (only filled
+  by backfills) build empty instead of failing read_json on an empty glob.
+#}
+
+{% macro lake_has_files(category) -%}
+    {%- if not execute -%}
+        {{ return(false) }}
+    {%- endif -%}
+    {%- set result = run_query(
+        "SELECT COUNT(*) FROM glob('../../datalake/raw/" ~ category ~ "/*.json')"
+    ) -%}
+    {{ return(result.columns[0].values()[0] > 0) }}
+{%- endmacro %}
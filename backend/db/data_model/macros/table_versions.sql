@@ -0,0 +1,41 @@
+{#
+  Bump main.table_versions for every model a run built, so cached reads of
+  those tables (db.session.QueryCache) are invalidated. Keys match
+  db.session.bump_table_versions: "table" in main, else "schema.table".
+#}
+
+{% macro bump_table_versions(results) -%}
+    {%- if not execute -%}
+        {{ return("") }}
+    {%- endif -%}
+
+    {%- set keys = [] -%}
+    {%- for result in results
+        if result.node.resource_type in ("model", "seed", "snapshot")
+        and result.status == "success" -%}
+        {%- set name = result.node.alias or result.node.name -%}
+        {%- if result.node.schema == "main" -%}
+            {%- do keys.append(name | lower) -%}
+        {%- else -%}
+            {%- do keys.append((result.node.schema ~ "." ~ name) | lower) -%}
+        {%- endif -%}
+    {%- endfor -%}
+
+    {%- if not keys -%}
+        {{ return("") }}
+    {%- endif -%}
+
+    CREATE TABLE IF NOT EXISTS main.table_versions (
+        table_name VARCHAR PRIMARY KEY,
+        version BIGINT NOT NULL,
+        updated_at TIMESTAMP NOT NULL
+    );
+    INSERT INTO main.table_versions (table_name, version, updated_at)
+    VALUES
+    {%- for key in keys %}
+        ('{{ key }}', 1, now()){{ "," if not loop.last }}
+    {%- endfor %}
+    ON CONFLICT (table_name) DO UPDATE SET
+        version = table_versions.version + 1,
+        updated_at = excluded.updated_at
+{%- endmacro %}
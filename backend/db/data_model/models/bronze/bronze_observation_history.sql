@@ -0,0 +1,78 @@
+{{
+  config(
+    materialized='table'
+  )
+}}
+
+-- Station observation history landed by datalake/backfill.py: one file per
+-- API page, each a FeatureCollection of observations. Same columns as
+-- bronze_observations (only those sat_observation uses).
+--
+-- The schema is declared rather than auto-detected so pages where a
+-- measurement is always missing still line up, and the model builds empty
+-- until a backfill has landed its first page.
+
+{% set quantity = "STRUCT(value DOUBLE, unitCode VARCHAR)" %}
+{% set metadata_type = 'STRUCT(saved_at TIMESTAMP, category VARCHAR, identifier VARCHAR, "timestamp" TIMESTAMP)' %}
+{% set measurements = [
+    "temperature", "dewpoint", "heatIndex", "windChill", "windDirection", "windSpeed",
+    "windGust", "barometricPressure", "seaLevelPressure", "visibility", "relativeHumidity",
+    "precipitationLastHour", "precipitationLast3Hours", "precipitationLast6Hours",
+] %}
+{% set data_type -%}
+    STRUCT(features STRUCT(properties STRUCT(
+        station VARCHAR,
+        "timestamp" TIMESTAMPTZ,
+        rawMessage VARCHAR,
+        textDescription VARCHAR,
+        icon VARCHAR,
+        {%- for measurement in measurements %}
+        {{ measurement }} {{ quantity }}{{ "," if not loop.last }}
+        {%- endfor %}
+    ))[])
+{%- endset %}
+
+WITH pages AS (
+{% if lake_has_files('observation_history') %}
+    SELECT metadata, data
+    FROM read_json(
+        '../../datalake/raw/observation_history/*.json',
+        columns={'metadata': '{{ metadata_type }}', 'data': '{{ data_type }}'}
+    )
+{% else %}
+    SELECT
+        NULL::{{ metadata_type }} as metadata,
+        NULL::{{ data_type }} as data
+    WHERE FALSE
+{% endif %}
+)
+
+SELECT
+    metadata.saved_at as saved_at,
+    metadata.category as load_category,
+    metadata.identifier,
+    metadata.timestamp as load_timestamp,
+    feature.properties.station as station_url,
+    REGEXP_EXTRACT(feature.properties.station, '[^/]+$') as station_id,
+    timezone('UTC', feature.properties.timestamp) as observation_time,
+    feature.properties.rawMessage as raw_message,
+    feature.properties.textDescription as text_description,
+    feature.properties.icon as icon_url,
+    feature.properties.temperature.value as temperature_value,
+    feature.properties.temperature.unitCode as temperature_unit,
+    feature.properties.dewpoint.value as dewpoint_value,
+    feature.properties.dewpoint.unitCode as dewpoint_unit,
+    feature.properties.heatIndex.value as heat_index_value,
+    feature.properties.windChill.value as wind_chill_value,
+    feature.properties.windDirection.value as wind_direction_value,
+    feature.properties.windSpeed.value as wind_speed_value,
+    feature.properties.windSpeed.unitCode as wind_speed_unit,
+    feature.properties.windGust.value as wind_gust_value,
+    feature.properties.barometricPressure.value as barometric_pressure_value,
+    feature.properties.seaLevelPressure.value as sea_level_pressure_value,
+    feature.properties.visibility.value as visibility_value,
+    feature.properties.relativeHumidity.value as relative_humidity_value,
+    feature.properties.precipitationLastHour.value as precipitation_last_hour_value,
+    feature.properties.precipitationLast3Hours.value as precipitation_last_3hours_value,
+    feature.properties.precipitationLast6Hours.value as precipitation_last_6hours_value
+FROM pages, UNNEST(pages.data.features) AS t(feature)
@@ -0,0 +1,90 @@
+{{
+  config(
+    materialized='incremental',
+    unique_key=['resort_key', 'valid_hour', 'variable', 'update_time']
+  )
+}}
+
+-- Change log of grid forecast values between consecutive runs.
+-- A row is stored only when a run introduces a value for a valid hour or
+-- changes it from the previous run (to NULL when the run dropped it), so the value any run forecast for an hour
+-- is the latest row at or before that run (see db.analytics.get_forecast_revisions).
+
+WITH
+{% if is_incremental() %}
+new_runs AS (
+    SELECT DISTINCT resort_key, update_time
+    FROM {{ ref('gold_grid_hourly') }}
+    WHERE load_date > (SELECT MAX(source_load_date) FROM {{ this }})
+),
+
+touched_hours AS (
+    SELECT DISTINCT h.resort_key, h.valid_hour
+    FROM {{ ref('gold_grid_hourly') }} h
+    INNER JOIN new_runs n
+        ON h.resort_key = n.resort_key
+       AND h.update_time = n.update_time
+),
+{% endif %}
+
+hourly AS (
+    SELECT
+        h.resort_key,
+        h.update_time,
+        h.valid_hour,
+        h.lead_hour,
+        h.load_date,
+        h.temperature_c,
+        h.wind_speed_kmh,
+        h.wind_gust_kmh,
+        h.probability_of_precipitation_pct,
+        h.precipitation_mm,
+        h.snowfall_mm
+    FROM {{ ref('gold_grid_hourly') }} h
+
+    {% if is_incremental() %}
+      INNER JOIN touched_hours t
+          ON h.resort_key = t.resort_key
+         AND h.valid_hour = t.valid_hour
+    {% endif %}
+),
+
+-- INCLUDE NULLS: a run that clears a value (e.g. no more gusts) is a change
+-- too; UNPIVOT drops NULLs by default, which kept the old value current
+long AS (
+    SELECT *
+    FROM hourly
+    UNPIVOT INCLUDE NULLS (
+        value FOR variable IN (
+            temperature_c, wind_speed_kmh, wind_gust_kmh, probability_of_precipitation_pct,
+            precipitation_mm, snowfall_mm
+        )
+    )
+),
+
+sequenced AS (
+    SELECT
+        *,
+        LAG(update_time) OVER w as previous_update_time,
+        LAG(value) OVER w as previous_value
+    FROM long
+    WINDOW w AS (PARTITION BY resort_key, valid_hour, variable ORDER BY update_time)
+)
+
+SELECT
+    resort_key,
+    valid_hour,
+    variable,
+    update_time,
+    previous_update_time,
+    lead_hour,
+    value,
+    previous_value,
+    value - previous_value as delta,
+    load_date as source_load_date
+FROM sequenced
+WHERE value IS DISTINCT FROM previous_value
+
+{% if is_incremental() %}
+  AND (resort_key, update_time) IN (SELECT resort_key, update_time FROM new_runs)
+{% endif %}
@@ -0,0 +1,62 @@
+{{
+  config(
+    materialized='incremental',
+    unique_key=['resort_key', 'update_time']
+  )
+}}
+
+-- One row per resort and grid forecast run with the rollups the demo asks
+-- for most: 24h / 72h / 7-day snowfall, temperature range and wind-hold risk.
+-- Windows are measured from the hour the run was issued.
+
+WITH hourly AS (
+    SELECT *
+    FROM {{ ref('gold_grid_hourly') }}
+
+    {% if is_incremental() %}
+      WHERE (resort_key, update_time) NOT IN (
+        SELECT resort_key, update_time FROM {{ this }}
+      )
+    {% endif %}
+)
+
+SELECT
+    resort_key,
+    update_time,
+    MIN(valid_hour) as first_valid_hour,
+    MAX(valid_hour) as last_valid_hour,
+    COUNT(*) as hours_covered,
+
+    -- Snowfall and liquid precipitation (inches)
+    COALESCE(SUM(snowfall_mm) FILTER (WHERE lead_hour < 24), 0) / 25.4 as snowfall_24h_in,
+    COALESCE(SUM(snowfall_mm) FILTER (WHERE lead_hour < 72), 0) / 25.4 as snowfall_72h_in,
+    COALESCE(SUM(snowfall_mm) FILTER (WHERE lead_hour < 168), 0) / 25.4 as snowfall_7d_in,
+    COALESCE(SUM(precipitation_mm) FILTER (WHERE lead_hour < 24), 0) / 25.4 as precipitation_24h_in,
+    COALESCE(SUM(precipitation_mm) FILTER (WHERE lead_hour < 72), 0) / 25.4 as precipitation_72h_in,
+    COALESCE(SUM(precipitation_mm) FILTER (WHERE lead_hour < 168), 0) / 25.4 as precipitation_7d_in,
+
+    -- Temperature range (Fahrenheit)
+    MIN(temperature_c) FILTER (WHERE lead_hour < 24) * 9 / 5 + 32 as min_temperature_24h_f,
+    MAX(temperature_c) FILTER (WHERE lead_hour < 24) * 9 / 5 + 32 as max_temperature_24h_f,
+    MIN(temperature_c) FILTER (WHERE lead_hour < 72) * 9 / 5 + 32 as min_temperature_72h_f,
+    MAX(temperature_c) FILTER (WHERE lead_hour < 72) * 9 / 5 + 32 as max_temperature_72h_f,
+    MIN(temperature_c) FILTER (WHERE lead_hour < 168) * 9 / 5 + 32 as min_temperature_7d_f,
+    MAX(temperature_c) FILTER (WHERE lead_hour < 168) * 9 / 5 + 32 as max_temperature_7d_f,
+
+    -- Wind-hold risk: hours with gusts at or above the lift-hold threshold (mph)
+    MAX(wind_gust_kmh) FILTER (WHERE lead_hour < 24) * 0.621371 as max_wind_gust_24h_mph,
+    MAX(wind_gust_kmh) FILTER (WHERE lead_hour < 168) * 0.621371 as max_wind_gust_7d_mph,
+    COUNT(*) FILTER (
+        WHERE lead_hour < 24 AND wind_gust_kmh * 0.621371 >= {{ var('wind_hold_gust_mph') }}
+    ) as wind_hold_hours_24h,
+    COUNT(*) FILTER (
+        WHERE lead_hour < 72 AND wind_gust_kmh * 0.621371 >= {{ var('wind_hold_gust_mph') }}
+    ) as wind_hold_hours_72h,
+    COUNT(*) FILTER (
+        WHERE lead_hour < 168 AND wind_gust_kmh * 0.621371 >= {{ var('wind_hold_gust_mph') }}
+    ) as wind_hold_hours_7d,
+
+    MAX(probability_of_precipitation_pct) FILTER (WHERE lead_hour < 24) as max_probability_of_precipitation_24h,
+    CURRENT_TIMESTAMP as load_date
+FROM hourly
+GROUP BY resort_key, update_time
@@ -0,0 +1,36 @@
+{{
+  config(
+    materialized='incremental',
+    unique_key=['resort_key', 'forecast_source', 'variable', 'lead_hour']
+  )
+}}
+
+-- Forecast skill by resort, source, variable and lead hour, across all runs.
+-- Only groups that received new verification pairs are recomputed.
+
+WITH touched AS (
+    SELECT DISTINCT resort_key, forecast_source, variable, lead_hour
+    FROM {{ ref('gold_forecast_verification') }}
+
+    {% if is_incremental() %}
+      WHERE load_date > (SELECT MAX(verified_through) FROM {{ this }})
+    {% endif %}
+)
+
+SELECT
+    p.resort_key,
+    p.forecast_source,
+    p.variable,
+    p.lead_hour,
+    COUNT(*) as pair_count,
+    AVG(p.error) as bias,
+    AVG(ABS(p.error)) as mae,
+    SQRT(AVG(p.error * p.error)) as rmse,
+    MAX(p.load_date) as verified_through
+FROM {{ ref('gold_forecast_verification') }} p
+INNER JOIN touched t
+    ON p.resort_key = t.resort_key
+   AND p.forecast_source = t.forecast_source
+   AND p.variable = t.variable
+   AND p.lead_hour = t.lead_hour
+GROUP BY p.resort_key, p.forecast_source, p.variable, p.lead_hour
@@ -0,0 +1,38 @@
+{{
+  config(
+    materialized='incremental',
+    unique_key=['resort_key', 'forecast_source', 'variable', 'run_time']
+  )
+}}
+
+-- Forecast skill by resort, source, variable and forecast run, across lead hours.
+-- Only groups that received new verification pairs are recomputed.
+
+WITH touched AS (
+    SELECT DISTINCT resort_key, forecast_source, variable, run_time
+    FROM {{ ref('gold_forecast_verification') }}
+
+    {% if is_incremental() %}
+      WHERE load_date > (SELECT MAX(verified_through) FROM {{ this }})
+    {% endif %}
+)
+
+SELECT
+    p.resort_key,
+    p.forecast_source,
+    p.variable,
+    p.run_time,
+    COUNT(*) as pair_count,
+    MIN(p.lead_hour) as min_lead_hour,
+    MAX(p.lead_hour) as max_lead_hour,
+    AVG(p.error) as bias,
+    AVG(ABS(p.error)) as mae,
+    SQRT(AVG(p.error * p.error)) as rmse,
+    MAX(p.load_date) as verified_through
+FROM {{ ref('gold_forecast_verification') }} p
+INNER JOIN touched t
+    ON p.resort_key = t.resort_key
+   AND p.forecast_source = t.forecast_source
+   AND p.variable = t.variable
+   AND p.run_time = t.run_time
+GROUP BY p.resort_key, p.forecast_source, p.variable, p.run_time
@@ -0,0 +1,206 @@
+{{
+  config(
+    materialized='incremental',
+    unique_key=['resort_key', 'forecast_source', 'run_time', 'valid_hour', 'variable']
+  )
+}}
+
+-- Forecast-vs-observation pairs: every forecast hour of every run matched to
+-- the nearest observation (within var verification_tolerance_minutes) from
+-- the resort's linked stations. Metric units throughout.
+--
+-- Incremental runs only re-verify valid hours touched by newly loaded
+-- observations, plus forecasts loaded since the last run.
+
+WITH observations AS (
+    SELECT
+        l.resort_key,
+        o.station_key,
+        o.observation_time,
+        o.load_date,
+        o.temperature_value,
+        o.dewpoint_value,
+        o.relative_humidity_value,
+        o.wind_speed_value,
+        o.wind_gust_value
+    FROM {{ ref('sat_observation') }} o
+    INNER JOIN {{ ref('link_resort_station') }} l
+        ON o.station_key = l.station_key
+    QUALIFY ROW_NUMBER() OVER (
+        PARTITION BY l.resort_key, o.observation_time
+        ORDER BY l.station_rank, o.load_date DESC
+    ) = 1
+),
+
+{% if is_incremental() %}
+watermarks AS (
+    SELECT
+        COALESCE(MAX(observation_load_date), TIMESTAMP '1900-01-01') as observation_load_date,
+        COALESCE(MAX(forecast_load_date), TIMESTAMP '1900-01-01') as forecast_load_date
+    FROM {{ this }}
+),
+
+new_observation_window AS (
+    SELECT
+        MIN(observation_time) - to_minutes({{ var('verification_tolerance_minutes') }}) as window_start,
+        MAX(observation_time) + to_minutes({{ var('verification_tolerance_minutes') }}) as window_end
+    FROM observations
+    WHERE load_date > (SELECT observation_load_date FROM watermarks)
+),
+{% endif %}
+
+grid_forecasts AS (
+    SELECT
+        resort_key,
+        'grid' as forecast_source,
+        update_time as run_time,
+        valid_hour,
+        lead_hour,
+        load_date as forecast_load_date,
+        temperature_c,
+        dewpoint_c,
+        relative_humidity_pct,
+        wind_speed_kmh,
+        wind_gust_kmh
+    FROM {{ ref('gold_grid_hourly') }}
+),
+
+hourly_forecasts AS (
+    SELECT
+        resort_key,
+        'hourly' as forecast_source,
+        forecast_generated_at as run_time,
+        start_time as valid_hour,
+        DATE_DIFF('hour', DATE_TRUNC('hour', forecast_generated_at), start_time) as lead_hour,
+        load_date as forecast_load_date,
+        CASE
+            WHEN temperature_unit = 'F' THEN (temperature - 32) * 5 / 9
+            ELSE temperature
+        END as temperature_c,
+        dewpoint_value as dewpoint_c,
+        relative_humidity_value as relative_humidity_pct,
+        {{ wind_speed_mph('wind_speed') }} * 1.609344 as wind_speed_kmh,
+        NULL::DOUBLE as wind_gust_kmh
+    FROM {{ ref('sat_forecast_hourly') }}
+    WHERE start_time >= DATE_TRUNC('hour', forecast_generated_at)
+    QUALIFY ROW_NUMBER() OVER (
+        PARTITION BY resort_key, forecast_generated_at, start_time
+        ORDER BY load_date
+    ) = 1
+),
+
+forecasts AS (
+    SELECT * FROM (
+        SELECT * FROM grid_forecasts
+        UNION ALL
+        SELECT * FROM hourly_forecasts
+    ) f
+
+    {% if is_incremental() %}
+      WHERE f.valid_hour BETWEEN (SELECT window_start FROM new_observation_window)
+                             AND (SELECT window_end FROM new_observation_window)
+         OR f.forecast_load_date > (SELECT forecast_load_date FROM watermarks)
+    {% endif %}
+),
+
+valid_hours AS (
+    SELECT DISTINCT resort_key, valid_hour
+    FROM forecasts
+),
+
+-- Nearest observation on either side of each valid hour (vectorized as-of joins)
+before AS (
+    SELECT v.resort_key, v.valid_hour, o.observation_time
+    FROM valid_hours v
+    ASOF LEFT JOIN observations o
+        ON v.resort_key = o.resort_key
+       AND v.valid_hour >= o.observation_time
+),
+
+after AS (
+    SELECT v.resort_key, v.valid_hour, o.observation_time
+    FROM valid_hours v
+    ASOF LEFT JOIN observations o
+        ON v.resort_key = o.resort_key
+       AND v.valid_hour <= o.observation_time
+),
+
+nearest AS (
+    SELECT
+        b.resort_key,
+        b.valid_hour,
+        CASE
+            WHEN a.observation_time IS NULL THEN b.observation_time
+            WHEN b.observation_time IS NULL THEN a.observation_time
+            WHEN b.valid_hour - b.observation_time <= a.observation_time - a.valid_hour
+                THEN b.observation_time
+            ELSE a.observation_time
+        END as observation_time
+    FROM before b
+    INNER JOIN after a
+        ON b.resort_key = a.resort_key
+       AND b.valid_hour = a.valid_hour
+),
+
+matched AS (
+    SELECT
+        n.resort_key,
+        n.valid_hour,
+        o.station_key,
+        o.observation_time,
+        o.load_date as observation_load_date,
+        o.temperature_value,
+        o.dewpoint_value,
+        o.relative_humidity_value,
+        o.wind_speed_value,
+        o.wind_gust_value
+    FROM nearest n
+    INNER JOIN observations o
+        ON n.resort_key = o.resort_key
+       AND n.observation_time = o.observation_time
+    WHERE ABS(DATE_DIFF('minute', n.valid_hour, o.observation_time))
+          <= {{ var('verification_tolerance_minutes') }}
+),
+
+pairs AS (
+    SELECT
+        f.resort_key,
+        f.forecast_source,
+        f.run_time,
+        f.valid_hour,
+        f.lead_hour,
+        m.station_key,
+        m.observation_time,
+        f.forecast_load_date,
+        m.observation_load_date,
+        v.variable,
+        CASE v.variable
+            WHEN 'temperature' THEN f.temperature_c
+            WHEN 'dewpoint' THEN f.dewpoint_c
+            WHEN 'relative_humidity' THEN f.relative_humidity_pct
+            WHEN 'wind_speed' THEN f.wind_speed_kmh
+            WHEN 'wind_gust' THEN f.wind_gust_kmh
+        END as forecast_value,
+        CASE v.variable
+            WHEN 'temperature' THEN m.temperature_value
+            WHEN 'dewpoint' THEN m.dewpoint_value
+            WHEN 'relative_humidity' THEN m.relative_humidity_value
+            WHEN 'wind_speed' THEN m.wind_speed_value
+            WHEN 'wind_gust' THEN m.wind_gust_value
+        END as observed_value
+    FROM forecasts f
+    INNER JOIN matched m
+        ON f.resort_key = m.resort_key
+       AND f.valid_hour = m.valid_hour
+    CROSS JOIN (
+        VALUES ('temperature'), ('dewpoint'), ('relative_humidity'), ('wind_speed'), ('wind_gust')
+    ) AS v(variable)
+)
+
+SELECT
+    *,
+    forecast_value - observed_value as error,
+    CURRENT_TIMESTAMP as load_date
+FROM pairs
+WHERE forecast_value IS NOT NULL
+  AND observed_value IS NOT NULL
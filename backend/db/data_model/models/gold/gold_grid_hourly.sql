@@ -0,0 +1,99 @@
+{{
+  config(
+    materialized='incremental',
+    unique_key=['resort_key', 'update_time', 'valid_hour']
+  )
+}}
+
+-- One row per resort, grid forecast run and valid hour.
+-- Accumulated layers (precipitation, snowfall) are spread evenly across the
+-- hours of their interval so they can be summed over any window.
+
+WITH runs AS (
+    SELECT
+        resort_key,
+        update_time,
+        temperature,
+        dewpoint,
+        relative_humidity,
+        wind_speed,
+        wind_gust,
+        sky_cover,
+        probability_of_precipitation,
+        quantitative_precipitation,
+        snowfall_amount
+    FROM {{ ref('sat_grid_data') }}
+
+    {% if is_incremental() %}
+      WHERE (resort_key, update_time) NOT IN (
+        SELECT DISTINCT resort_key, update_time FROM {{ this }}
+      )
+    {% endif %}
+
+    QUALIFY ROW_NUMBER() OVER (PARTITION BY resort_key, update_time ORDER BY load_date) = 1
+),
+
+layer_values AS (
+    {{ grid_layer_values('runs', 'temperature') }}
+    UNION ALL
+    {{ grid_layer_values('runs', 'dewpoint') }}
+    UNION ALL
+    {{ grid_layer_values('runs', 'relative_humidity') }}
+    UNION ALL
+    {{ grid_layer_values('runs', 'wind_speed') }}
+    UNION ALL
+    {{ grid_layer_values('runs', 'wind_gust') }}
+    UNION ALL
+    {{ grid_layer_values('runs', 'sky_cover') }}
+    UNION ALL
+    {{ grid_layer_values('runs', 'probability_of_precipitation') }}
+    UNION ALL
+    {{ grid_layer_values('runs', 'quantitative_precipitation') }}
+    UNION ALL
+    {{ grid_layer_values('runs', 'snowfall_amount') }}
+),
+
+expanded AS (
+    SELECT
+        resort_key,
+        update_time,
+        layer,
+        valid_start,
+        duration_hours,
+        value,
+        UNNEST(range(duration_hours)) as hour_offset
+    FROM layer_values
+),
+
+hourly AS (
+    SELECT
+        resort_key,
+        update_time,
+        layer,
+        valid_start + to_hours(hour_offset) as valid_hour,
+        CASE
+            WHEN layer IN ('quantitative_precipitation', 'snowfall_amount')
+                THEN value / duration_hours
+            ELSE value
+        END as value
+    FROM expanded
+)
+
+SELECT
+    resort_key,
+    update_time,
+    valid_hour,
+    DATE_DIFF('hour', DATE_TRUNC('hour', update_time), valid_hour) as lead_hour,
+    MAX(value) FILTER (WHERE layer = 'temperature') as temperature_c,
+    MAX(value) FILTER (WHERE layer = 'dewpoint') as dewpoint_c,
+    MAX(value) FILTER (WHERE layer = 'relative_humidity') as relative_humidity_pct,
+    MAX(value) FILTER (WHERE layer = 'wind_speed') as wind_speed_kmh,
+    MAX(value) FILTER (WHERE layer = 'wind_gust') as wind_gust_kmh,
+    MAX(value) FILTER (WHERE layer = 'sky_cover') as sky_cover_pct,
+    MAX(value) FILTER (WHERE layer = 'probability_of_precipitation') as probability_of_precipitation_pct,
+    SUM(value) FILTER (WHERE layer = 'quantitative_precipitation') as precipitation_mm,
+    SUM(value) FILTER (WHERE layer = 'snowfall_amount') as snowfall_mm,
+    CURRENT_TIMESTAMP as load_date
+FROM hourly
+WHERE valid_hour >= DATE_TRUNC('hour', update_time)
+GROUP BY resort_key, update_time, valid_hour
@@ -0,0 +1,46 @@
+{{
+  config(
+    materialized='table'
+  )
+}}
+
+-- One row per resort: latest forecast run rollups plus current conditions.
+-- Rebuilt on every run from the small incremental gold tables so the API and
+-- console can answer "what's it like at X" with a single-row lookup.
+
+WITH latest_run AS (
+    SELECT *
+    FROM {{ ref('gold_forecast_run_summary') }}
+    QUALIFY ROW_NUMBER() OVER (PARTITION BY resort_key ORDER BY update_time DESC) = 1
+)
+
+SELECT
+    r.resort_key,
+    r.resort_name,
+    f.update_time as forecast_updated_at,
+    f.snowfall_24h_in,
+    f.snowfall_72h_in,
+    f.snowfall_7d_in,
+    f.min_temperature_24h_f,
+    f.max_temperature_24h_f,
+    f.min_temperature_7d_f,
+    f.max_temperature_7d_f,
+    f.max_wind_gust_24h_mph,
+    f.wind_hold_hours_24h,
+    f.wind_hold_hours_72h,
+    f.wind_hold_hours_7d,
+    f.max_probability_of_precipitation_24h,
+    o.station_id as observation_station_id,
+    o.observation_time,
+    o.text_description as observed_conditions,
+    o.temperature_f as observed_temperature_f,
+    o.wind_chill_f as observed_wind_chill_f,
+    o.wind_speed_mph as observed_wind_speed_mph,
+    o.wind_gust_mph as observed_wind_gust_mph,
+    o.visibility_mi as observed_visibility_mi,
+    CURRENT_TIMESTAMP as load_date
+FROM {{ ref('hub_resort') }} r
+LEFT JOIN latest_run f
+    ON r.resort_key = f.resort_key
+LEFT JOIN {{ ref('gold_resort_latest_observation') }} o
+    ON r.resort_key = o.resort_key
@@ -0,0 +1,67 @@
+{{
+  config(
+    materialized='incremental',
+    unique_key=['resort_key', 'forecast_date']
+  )
+}}
+
+-- One row per resort and local calendar day, taken from the latest grid run.
+-- Days are rewritten whenever a newer run lands; days that have rolled out of
+-- the forecast keep the last values that were forecast for them.
+
+WITH latest_run AS (
+    SELECT
+        resort_key,
+        MAX(update_time) as update_time
+    FROM {{ ref('gold_forecast_run_summary') }}
+    GROUP BY resort_key
+),
+
+{% if is_incremental() %}
+loaded AS (
+    SELECT
+        resort_key,
+        MAX(source_update_time) as update_time
+    FROM {{ this }}
+    GROUP BY resort_key
+),
+{% endif %}
+
+new_runs AS (
+    SELECT r.resort_key, r.update_time
+    FROM latest_run r
+
+    {% if is_incremental() %}
+      LEFT JOIN loaded l ON l.resort_key = r.resort_key
+      WHERE l.update_time IS NULL OR r.update_time > l.update_time
+    {% endif %}
+),
+
+hourly AS (
+    SELECT
+        h.*,
+        CAST(timezone('{{ var("local_time_zone") }}', timezone('UTC', h.valid_hour)) AS DATE) as forecast_date
+    FROM {{ ref('gold_grid_hourly') }} h
+    INNER JOIN new_runs n
+        ON h.resort_key = n.resort_key
+       AND h.update_time = n.update_time
+)
+
+SELECT
+    resort_key,
+    forecast_date,
+    MAX(update_time) as source_update_time,
+    COUNT(*) as hours_covered,
+    COALESCE(SUM(snowfall_mm), 0) / 25.4 as snowfall_in,
+    COALESCE(SUM(precipitation_mm), 0) / 25.4 as precipitation_in,
+    MIN(temperature_c) * 9 / 5 + 32 as min_temperature_f,
+    MAX(temperature_c) * 9 / 5 + 32 as max_temperature_f,
+    MAX(wind_gust_kmh) * 0.621371 as max_wind_gust_mph,
+    COUNT(*) FILTER (
+        WHERE wind_gust_kmh * 0.621371 >= {{ var('wind_hold_gust_mph') }}
+    ) as wind_hold_hours,
+    MAX(probability_of_precipitation_pct) as max_probability_of_precipitation,
+    AVG(sky_cover_pct) as avg_sky_cover_pct,
+    CURRENT_TIMESTAMP as load_date
+FROM hourly
+GROUP BY resort_key, forecast_date
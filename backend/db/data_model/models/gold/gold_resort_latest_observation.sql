@@ -0,0 +1,69 @@
+{{
+  config(
+    materialized='incremental',
+    unique_key='resort_key'
+  )
+}}
+
+-- Most recent observation per resort across its linked stations.
+-- Ties on observation time go to the better-ranked station.
+
+WITH candidates AS (
+    SELECT
+        l.resort_key,
+        s.station_id,
+        l.station_rank,
+        o.observation_time,
+        o.load_date as source_load_date,
+        o.text_description,
+        o.temperature_value * 9 / 5 + 32 as temperature_f,
+        o.dewpoint_value * 9 / 5 + 32 as dewpoint_f,
+        o.wind_chill_value * 9 / 5 + 32 as wind_chill_f,
+        o.wind_direction_value as wind_direction_deg,
+        o.wind_speed_value * 0.621371 as wind_speed_mph,
+        o.wind_gust_value * 0.621371 as wind_gust_mph,
+        o.visibility_value / 1609.344 as visibility_mi,
+        o.relative_humidity_value as relative_humidity_pct,
+        o.precipitation_last_hour_value / 25.4 as precipitation_last_hour_in
+    FROM {{ ref('sat_observation') }} o
+    INNER JOIN {{ ref('link_resort_station') }} l
+        ON o.station_key = l.station_key
+    INNER JOIN {{ ref('hub_station') }} s
+        ON o.station_key = s.station_key
+
+    {% if is_incremental() %}
+      WHERE o.load_date > (SELECT MAX(source_load_date) FROM {{ this }})
+    {% endif %}
+
+    {% if is_incremental() %}
+    -- Re-rank against the stored row so a late, older observation
+    -- (e.g. from a backfill) never replaces a newer one.
+    UNION ALL
+    SELECT
+        resort_key,
+        station_id,
+        station_rank,
+        observation_time,
+        source_load_date,
+        text_description,
+        temperature_f,
+        dewpoint_f,
+        wind_chill_f,
+        wind_direction_deg,
+        wind_speed_mph,
+        wind_gust_mph,
+        visibility_mi,
+        relative_humidity_pct,
+        precipitation_last_hour_in
+    FROM {{ this }}
+    {% endif %}
+)
+
+SELECT
+    *,
+    CURRENT_TIMESTAMP as load_date
+FROM candidates
+QUALIFY ROW_NUMBER() OVER (
+    PARTITION BY resort_key
+    ORDER BY observation_time DESC, station_rank, source_load_date DESC
+) = 1
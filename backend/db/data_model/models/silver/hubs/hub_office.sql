@@ -10,15 +10,22 @@ WITH source AS (
         grid_id as office_id
     FROM {{ ref('bronze_points') }}
     WHERE grid_id IS NOT NULL
+),
+
+keyed AS (
+    SELECT
+        {{ hash_key(['office_id']) }} as office_key,
+        office_id
+    FROM source
 )
 
 SELECT
-    MD5(office_id) as office_key,
+    office_key,
     office_id,
     CURRENT_TIMESTAMP as load_date,
     'weather.gov' as record_source
-FROM source
+FROM keyed
 
 {% if is_incremental() %}
-  WHERE MD5(office_id) NOT IN (SELECT office_key FROM {{ this }})
+  WHERE office_key NOT IN (SELECT office_key FROM {{ this }})
 {% endif %}
@@ -9,15 +9,22 @@ WITH source AS (
     SELECT DISTINCT
         identifier as resort_name
     FROM {{ ref('bronze_points') }}
+),
+
+keyed AS (
+    SELECT
+        {{ hash_key(['resort_name']) }} as resort_key,
+        resort_name
+    FROM source
 )
 
 SELECT
-    MD5(resort_name) as resort_key,
+    resort_key,
     resort_name,
     CURRENT_TIMESTAMP as load_date,
     'resorts.yaml' as record_source
-FROM source
+FROM keyed
 
 {% if is_incremental() %}
-  WHERE MD5(resort_name) NOT IN (SELECT resort_key FROM {{ this }})
+  WHERE resort_key NOT IN (SELECT resort_key FROM {{ this }})
 {% endif %}
@@ -10,15 +10,22 @@ WITH source AS (
         station_identifier as station_id
     FROM {{ ref('bronze_stations') }}
     WHERE station_identifier IS NOT NULL
+),
+
+keyed AS (
+    SELECT
+        {{ hash_key(['station_id']) }} as station_key,
+        station_id
+    FROM source
 )
 
 SELECT
-    MD5(station_id) as station_key,
+    station_key,
     station_id,
     CURRENT_TIMESTAMP as load_date,
     'weather.gov' as record_source
-FROM source
+FROM keyed
 
 {% if is_incremental() %}
-  WHERE MD5(station_id) NOT IN (SELECT station_key FROM {{ this }})
+  WHERE station_key NOT IN (SELECT station_key FROM {{ this }})
 {% endif %}
@@ -10,15 +10,22 @@ WITH source AS (
         zone_id_code as zone_id
     FROM {{ ref('bronze_zones') }}
     WHERE zone_id_code IS NOT NULL
+),
+
+keyed AS (
+    SELECT
+        {{ hash_key(['zone_id']) }} as zone_key,
+        zone_id
+    FROM source
 )
 
 SELECT
-    MD5(zone_id) as zone_key,
+    zone_key,
     zone_id,
     CURRENT_TIMESTAMP as load_date,
     'weather.gov' as record_source
-FROM source
+FROM keyed
 
 {% if is_incremental() %}
-  WHERE MD5(zone_id) NOT IN (SELECT zone_key FROM {{ this }})
+  WHERE zone_key NOT IN (SELECT zone_key FROM {{ this }})
 {% endif %}
@@ -16,21 +16,28 @@ WITH source AS (
 
 with_keys AS (
     SELECT
-        MD5(resort_name) as resort_key,
-        MD5(station_id) as station_key,
+        {{ hash_key(['resort_name']) }} as resort_key,
+        {{ hash_key(['station_id']) }} as station_key,
         station_rank
     FROM source
+),
+
+with_link_key AS (
+    SELECT
+        {{ hash_key(['resort_key', 'station_key']) }} as link_key,
+        *
+    FROM with_keys
 )
 
 SELECT
-    MD5(resort_key || '|' || station_key) as link_key,
+    link_key,
     resort_key,
     station_key,
     station_rank,
     CURRENT_TIMESTAMP as load_date,
     'weather.gov' as record_source
-FROM with_keys
+FROM with_link_key
 
 {% if is_incremental() %}
-  WHERE MD5(resort_key || '|' || station_key) NOT IN (SELECT link_key FROM {{ this }})
+  WHERE link_key NOT IN (SELECT link_key FROM {{ this }})
 {% endif %}
@@ -15,19 +15,26 @@ WITH source AS (
 
 with_keys AS (
     SELECT
-        MD5(resort_name) as resort_key,
-        MD5(zone_id) as zone_key
+        {{ hash_key(['resort_name']) }} as resort_key,
+        {{ hash_key(['zone_id']) }} as zone_key
     FROM source
+),
+
+with_link_key AS (
+    SELECT
+        {{ hash_key(['resort_key', 'zone_key']) }} as link_key,
+        *
+    FROM with_keys
 )
 
 SELECT
-    MD5(resort_key || '|' || zone_key) as link_key,
+    link_key,
     resort_key,
     zone_key,
     CURRENT_TIMESTAMP as load_date,
     'weather.gov' as record_source
-FROM with_keys
+FROM with_link_key
 
 {% if is_incremental() %}
-  WHERE MD5(resort_key || '|' || zone_key) NOT IN (SELECT link_key FROM {{ this }})
+  WHERE link_key NOT IN (SELECT link_key FROM {{ this }})
 {% endif %}
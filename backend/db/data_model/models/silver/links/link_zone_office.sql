@@ -16,19 +16,26 @@ WITH source AS (
 
 with_keys AS (
     SELECT
-        MD5(zone_id) as zone_key,
-        MD5(office_id) as office_key
+        {{ hash_key(['zone_id']) }} as zone_key,
+        {{ hash_key(['office_id']) }} as office_key
     FROM source
+),
+
+with_link_key AS (
+    SELECT
+        {{ hash_key(['zone_key', 'office_key']) }} as link_key,
+        *
+    FROM with_keys
 )
 
 SELECT
-    MD5(zone_key || '|' || office_key) as link_key,
+    link_key,
     zone_key,
     office_key,
     CURRENT_TIMESTAMP as load_date,
     'weather.gov' as record_source
-FROM with_keys
+FROM with_link_key
 
 {% if is_incremental() %}
-  WHERE MD5(zone_key || '|' || office_key) NOT IN (SELECT link_key FROM {{ this }})
+  WHERE link_key NOT IN (SELECT link_key FROM {{ this }})
 {% endif %}
@@ -5,7 +5,9 @@
   )
 }}
 
-WITH source AS (
+-- Latest-observation snapshots plus backfilled history; the same
+-- observation can arrive from both, so keep the most recently loaded copy.
+WITH snapshots AS (
     SELECT
         station_id,
         observation_time,
@@ -30,6 +32,42 @@ WITH source AS (
         load_timestamp
     FROM {{ ref('bronze_observations') }}
     WHERE station_id IS NOT NULL
+
+    UNION ALL
+
+    SELECT
+        station_id,
+        observation_time,
+        text_description,
+        temperature_value,
+        temperature_unit,
+        dewpoint_value,
+        dewpoint_unit,
+        wind_direction_value,
+        wind_speed_value,
+        wind_speed_unit,
+        wind_gust_value,
+        barometric_pressure_value,
+        sea_level_pressure_value,
+        visibility_value,
+        relative_humidity_value,
+        wind_chill_value,
+        heat_index_value,
+        precipitation_last_hour_value,
+        precipitation_last_3hours_value,
+        precipitation_last_6hours_value,
+        load_timestamp
+    FROM {{ ref('bronze_observation_history') }}
+    WHERE station_id IS NOT NULL
+),
+
+source AS (
+    SELECT *
+    FROM snapshots
+    QUALIFY ROW_NUMBER() OVER (
+        PARTITION BY station_id, observation_time
+        ORDER BY load_timestamp DESC
+    ) = 1
 )
 
 SELECT
@@ -0,0 +1,625 @@
+"""
+Bulk loader for the Data Vault tables in db/schema.sql.
+
+Rows are collected per table in a VaultBatch, converted to Arrow tables
+(hash keys are computed column-wise with generate_hash_keys) and written
+with one ``INSERT ... SELECT FROM arrow_table`` per table instead of one
+INSERT per row.
+
+Loads are idempotent: every row carries the collection timestamp of the
+snapshot it came from as its load_date, so loading the same API response
+or lake file twice is a no-op.
+
+Usage:
+    from db.loader import VaultBatch, load_batch
+
+    batch = VaultBatch()
+    batch.add_points("Sugarloaf", points, loaded_at)
+    batch.add_forecast("Sugarloaf", hourly, loaded_at, hourly=True)
+    load_batch(batch)
+"""
+
+import json
+import re
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from .session import bump_table_versions, get_session
+from .utils import generate_hash_keys
+
+# Hash keys derived from business keys when a batch is converted to Arrow
+HASH_KEYS = {
+    "resort_key": ["resort_name"],
+    "zone_key": ["zone_id"],
+    "station_key": ["station_id"],
+    "office_key": ["office_id"],
+}
+
+# Link keys hash the hub keys they connect
+LINK_KEYS = {
+    "link_resort_zone": ["resort_key", "zone_key"],
+    "link_resort_station": ["resort_key", "station_key"],
+    "link_zone_office": ["zone_key", "office_key"],
+}
+
+# Primary key and conflict handling per table, in foreign-key load order.
+# "ignore" keeps the existing row; "latest" replaces it when the incoming
+# row was loaded later (station rankings, re-fetched observations).
+VAULT_TABLES = {
+    "hub_resort": (["resort_key"], "ignore"),
+    "hub_zone": (["zone_key"], "ignore"),
+    "hub_station": (["station_key"], "ignore"),
+    "hub_office": (["office_key"], "ignore"),
+    "link_resort_zone": (["link_key"], "ignore"),
+    "link_resort_station": (["link_key"], "latest"),
+    "link_zone_office": (["link_key"], "ignore"),
+    "sat_resort_details": (["resort_key", "load_date"], "ignore"),
+    "sat_zone_details": (["zone_key", "load_date"], "ignore"),
+    "sat_station_details": (["station_key", "load_date"], "ignore"),
+    "sat_office_details": (["office_key", "load_date"], "ignore"),
+    "sat_forecast_period": (["resort_key", "load_date", "period_number"], "ignore"),
+    "sat_forecast_hourly": (["resort_key", "load_date", "period_number"], "ignore"),
+    "sat_grid_data": (["resort_key", "load_date", "valid_time_start"], "ignore"),
+    "sat_observation": (["station_key", "observation_time"], "latest"),
+}
+
+# Lake categories the loader understands
+LAKE_CATEGORIES = [
+    "points", "zones", "stations", "forecasts", "hourly", "grid_data",
+    "observations", "observation_history",
+]
+
+# Grid data layers stored as JSON in sat_grid_data
+GRID_LAYERS = {
+    "temperature_data": "temperature",
+    "dewpoint_data": "dewpoint",
+    "wind_speed_data": "windSpeed",
+    "wind_direction_data": "windDirection",
+    "precipitation_data": "quantitativePrecipitation",
+    "snowfall_data": "snowfallAmount",
+    "sky_cover_data": "skyCover",
+}
+
+# Observation measurements: column -> (API field, unit column)
+OBSERVATION_FIELDS = {
+    "temperature": ("temperature", "temperature_unit"),
+    "dewpoint": ("dewpoint", "dewpoint_unit"),
+    "wind_direction": ("windDirection", None),
+    "wind_speed": ("windSpeed", "wind_speed_unit"),
+    "wind_gust": ("windGust", "wind_gust_unit"),
+    "barometric_pressure": ("barometricPressure", "barometric_pressure_unit"),
+    "visibility": ("visibility", "visibility_unit"),
+    "relative_humidity": ("relativeHumidity", None),
+    "wind_chill": ("windChill", "wind_chill_unit"),
+    "heat_index": ("heatIndex", "heat_index_unit"),
+    "precipitation_last_hour": ("precipitationLastHour", "precipitation_unit"),
+    "precipitation_last_3hours": ("precipitationLast3Hours", None),
+    "precipitation_last_6hours": ("precipitationLast6Hours", None),
+}
+
+_DURATION_PATTERN = re.compile(r"P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?)?")
+
+
+def _as_dict(data) -> Dict[str, Any]:
+    """Accept a pydantic API model or a raw (lake) dictionary."""
+    return data.model_dump() if hasattr(data, "model_dump") else data
+
+
+def _timestamp(value) -> Optional[datetime]:
+    """Parse an API timestamp to a naive UTC datetime (as the dbt models do)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _last_segment(url: Optional[str]) -> Optional[str]:
+    """Get the identifier at the end of an API URL (e.g. a zone or station ID)."""
+    return url.rstrip("/").split("/")[-1] if url else None
+
+
+def _quantity(data: Optional[Dict[str, Any]], field: str = "value"):
+    """Get a field of a QuantitativeValue that may be missing."""
+    return data.get(field) if data else None
+
+
+def _parse_valid_times(valid_times: str):
+    """
+    Parse an ISO 8601 interval like '2025-12-30T12:00:00+00:00/P7DT13H'.
+
+    Returns:
+        (start, end) as naive UTC datetimes
+    """
+    start_part, duration = valid_times.split("/", 1)
+    start = _timestamp(start_part)
+
+    match = _DURATION_PATTERN.fullmatch(duration)
+    if not match:
+        raise ValueError(f"Unsupported validTimes duration: {valid_times}")
+    days, hours, minutes = (int(part or 0) for part in match.groups())
+
+    return start, start + timedelta(days=days, hours=hours, minutes=minutes)
+
+
+class VaultBatch:
+    """
+    Rows for the Data Vault tables, collected before a bulk load.
+
+    Rows hold business keys (resort_name, zone_id, ...); hash keys are added
+    column-wise when the batch is converted to Arrow.
+    """
+
+    def __init__(self):
+        self.rows: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return sum(len(rows) for rows in self.rows.values())
+
+    def _add(self, table: str, **row):
+        self.rows[table].append(row)
+
+    def add_resort(self, resort, loaded_at: datetime):
+        """
+        Add a resort from config/resorts.yaml.
+
+        Args:
+            resort: ResortConfig
+            loaded_at: Collection timestamp
+        """
+        self._add("hub_resort", resort_name=resort.name, load_date=loaded_at)
+        self._add(
+            "sat_resort_details",
+            resort_name=resort.name,
+            load_date=loaded_at,
+            record_source="resorts.yaml",
+            state=resort.state,
+            latitude=resort.location.latitude,
+            longitude=resort.location.longitude,
+            full_name=resort.metadata.full_name,
+            region=resort.metadata.region,
+        )
+
+    def add_points(self, resort_name: str, points, loaded_at: datetime, resort=None):
+        """
+        Add a /points response: the resort, its forecast zone and office.
+
+        Args:
+            resort_name: Resort identifier
+            points: PointsResponse or its dictionary
+            loaded_at: Collection timestamp
+            resort: Optional ResortConfig for state, name and region
+        """
+        points = _as_dict(points)
+        properties = points["properties"]
+        longitude, latitude = points["geometry"]["coordinates"][:2]
+
+        zone_id = _last_segment(properties.get("forecastZone"))
+        office_id = properties.get("gridId")
+        state = resort.state if resort else properties.get("state")
+
+        self._add("hub_resort", resort_name=resort_name, load_date=loaded_at)
+
+        # state is required; without config or a state in the response the
+        # details row is skipped rather than failing the whole batch
+        if state:
+            self._add(
+                "sat_resort_details",
+                resort_name=resort_name,
+                load_date=loaded_at,
+                record_source="weather.gov",
+                state=state,
+                latitude=latitude,
+                longitude=longitude,
+                full_name=resort.metadata.full_name if resort else None,
+                region=resort.metadata.region if resort else None,
+                grid_id=office_id,
+                grid_x=properties.get("gridX"),
+                grid_y=properties.get("gridY"),
+            )
+
+        if zone_id:
+            self._add("hub_zone", zone_id=zone_id, load_date=loaded_at)
+            self._add("link_resort_zone", resort_name=resort_name, zone_id=zone_id, load_date=loaded_at)
+
+        if office_id:
+            self._add("hub_office", office_id=office_id, load_date=loaded_at)
+            self._add(
+                "sat_office_details",
+                office_id=office_id,
+                load_date=loaded_at,
+                url=properties.get("forecastOffice"),
+            )
+
+        if zone_id and office_id:
+            self._add("link_zone_office", zone_id=zone_id, office_id=office_id, load_date=loaded_at)
+
+    def add_zone(self, zone, loaded_at: datetime):
+        """
+        Add a forecast zone (/zones/forecast/{zoneId} response).
+
+        Args:
+            zone: Zone feature dictionary
+            loaded_at: Collection timestamp
+        """
+        properties = _as_dict(zone)["properties"]
+        zone_id = properties.get("id_code") or properties.get("id")
+        time_zones = properties.get("timeZone") or []
+
+        self._add("hub_zone", zone_id=zone_id, load_date=loaded_at)
+        self._add(
+            "sat_zone_details",
+            zone_id=zone_id,
+            load_date=loaded_at,
+            name=properties.get("name"),
+            state=properties.get("state"),
+            effective_date=_timestamp(properties.get("effectiveDate")),
+            expiration_date=_timestamp(properties.get("expirationDate")),
+            time_zone=time_zones[0] if time_zones else None,
+        )
+
+    def add_stations(self, resort_name: str, stations, loaded_at: datetime):
+        """
+        Add a resort's observation stations, ranked in API order (nearest first).
+
+        Args:
+            resort_name: Resort identifier
+            stations: StationsResponse or its dictionary
+            loaded_at: Collection timestamp
+        """
+        self._add("hub_resort", resort_name=resort_name, load_date=loaded_at)
+
+        for rank, feature in enumerate(_as_dict(stations).get("features", []), start=1):
+            properties = feature["properties"]
+            station_id = properties["stationIdentifier"]
+            longitude, latitude = feature["geometry"]["coordinates"][:2]
+
+            self._add("hub_station", station_id=station_id, load_date=loaded_at)
+            self._add(
+                "sat_station_details",
+                station_id=station_id,
+                load_date=loaded_at,
+                name=properties.get("name"),
+                latitude=latitude,
+                longitude=longitude,
+                elevation_value=_quantity(properties.get("elevation")),
+                elevation_unit=_quantity(properties.get("elevation"), "unitCode"),
+                time_zone=properties.get("timeZone"),
+            )
+            self._add(
+                "link_resort_station",
+                resort_name=resort_name,
+                station_id=station_id,
+                station_rank=rank,
+                load_date=loaded_at,
+            )
+
+    def add_forecast(self, resort_name: str, forecast, loaded_at: datetime, hourly: bool = False):
+        """
+        Add the periods of a 12-hour or hourly forecast.
+
+        Args:
+            resort_name: Resort identifier
+            forecast: GridForecastResponse / HourlyForecastResponse or dictionary
+            loaded_at: Collection timestamp
+            hourly: Load into sat_forecast_hourly instead of sat_forecast_period
+        """
+        properties = _as_dict(forecast)["properties"]
+        generated_at = _timestamp(properties["generatedAt"])
+        updated_at = _timestamp(properties["updateTime"])
+
+        self._add("hub_resort", resort_name=resort_name, load_date=loaded_at)
+
+        for period in properties.get("periods", []):
+            row = dict(
+                resort_name=resort_name,
+                load_date=loaded_at,
+                forecast_generated_at=generated_at,
+                forecast_updated_at=updated_at,
+                period_number=period["number"],
+                start_time=_timestamp(period["startTime"]),
+                end_time=_timestamp(period["endTime"]),
+                is_daytime=period["isDaytime"],
+                temperature=period.get("temperature"),
+                temperature_unit=period.get("temperatureUnit"),
+                wind_speed=period.get("windSpeed"),
+                wind_direction=period.get("windDirection"),
+                icon_url=period.get("icon"),
+                short_forecast=period.get("shortForecast"),
+                probability_of_precipitation=_quantity(period.get("probabilityOfPrecipitation")),
+                dewpoint_value=_quantity(period.get("dewpoint")),
+                dewpoint_unit=_quantity(period.get("dewpoint"), "unitCode"),
+                relative_humidity=_quantity(period.get("relativeHumidity")),
+            )
+
+            if hourly:
+                self._add("sat_forecast_hourly", **row)
+            else:
+                self._add(
+                    "sat_forecast_period",
+                    **row,
+                    period_name=period.get("name"),
+                    temperature_trend=period.get("temperatureTrend"),
+                    detailed_forecast=period.get("detailedForecast"),
+                )
+
+    def add_grid_data(self, resort_name: str, grid_data, loaded_at: datetime):
+        """
+        Add a raw grid data response (layers are kept as JSON).
+
+        Args:
+            resort_name: Resort identifier
+            grid_data: GridDataResponse or its dictionary
+            loaded_at: Collection timestamp
+        """
+        properties = _as_dict(grid_data)["properties"]
+        valid_start, valid_end = _parse_valid_times(properties["validTimes"])
+
+        self._add("hub_resort", resort_name=resort_name, load_date=loaded_at)
+        self._add(
+            "sat_grid_data",
+            resort_name=resort_name,
+            load_date=loaded_at,
+            forecast_updated_at=_timestamp(properties["updateTime"]),
+            valid_time_start=valid_start,
+            valid_time_end=valid_end,
+            **{
+                column: json.dumps(properties[layer], default=str) if properties.get(layer) else None
+                for column, layer in GRID_LAYERS.items()
+            },
+        )
+
+    def add_observation(self, observation, loaded_at: datetime):
+        """
+        Add a station observation.
+
+        Args:
+            observation: ObservationResponse or its dictionary
+            loaded_at: Collection timestamp
+        """
+        properties = _as_dict(observation)["properties"]
+        station_id = _last_segment(properties["station"])
+
+        row = dict(
+            station_id=station_id,
+            load_date=loaded_at,
+            observation_time=_timestamp(properties["timestamp"]),
+            text_description=properties.get("textDescription"),
+            icon_url=properties.get("icon"),
+            raw_message=properties.get("rawMessage"),
+        )
+        for column, (field, unit_column) in OBSERVATION_FIELDS.items():
+            row[column] = _quantity(properties.get(field))
+            if unit_column:
+                row[unit_column] = _quantity(properties.get(field), "unitCode")
+
+        self._add("hub_station", station_id=station_id, load_date=loaded_at)
+        self._add("sat_observation", **row)
+
+    def add_observation_page(self, page, loaded_at: datetime):
+        """
+        Add a page of observation history (see datalake/backfill.py).
+
+        Args:
+            page: FeatureCollection of observations
+            loaded_at: Collection timestamp
+        """
+        for feature in _as_dict(page).get("features", []):
+            self.add_observation(feature, loaded_at)
+
+    def add_lake_record(self, category: str, record: Dict[str, Any], resort=None):
+        """
+        Add a raw lake file (metadata + data wrapper from save_raw_data).
+
+        Args:
+            category: Lake category (see LAKE_CATEGORIES)
+            record: Parsed JSON file
+            resort: Optional ResortConfig matching the record's identifier
+        """
+        metadata = record["metadata"]
+        data = record["data"]
+        identifier = metadata["identifier"]
+        loaded_at = _timestamp(metadata["timestamp"])
+
+        if category == "points":
+            self.add_points(identifier, data, loaded_at, resort=resort)
+        elif category == "zones":
+            self.add_zone(data, loaded_at)
+        elif category == "stations":
+            self.add_stations(identifier, data, loaded_at)
+        elif category == "forecasts":
+            self.add_forecast(identifier, data, loaded_at)
+        elif category == "hourly":
+            self.add_forecast(identifier, data, loaded_at, hourly=True)
+        elif category == "grid_data":
+            self.add_grid_data(identifier, data, loaded_at)
+        elif category == "observations":
+            self.add_observation(data, loaded_at)
+        elif category == "observation_history":
+            self.add_observation_page(data, loaded_at)
+        else:
+            raise ValueError(f"Unknown lake category: {category}")
+
+    def to_arrow(self, table: str):
+        """
+        Convert a table's rows to Arrow, adding hash keys.
+
+        Args:
+            table: Vault table name
+
+        Returns:
+            pyarrow Table
+        """
+        import pyarrow as pa
+
+        rows = self.rows[table]
+        names = list(dict.fromkeys(name for row in rows for name in row))
+        arrow_table = pa.table({name: [row.get(name) for row in rows] for name in names})
+
+        for key, business_keys in HASH_KEYS.items():
+            if all(column in arrow_table.column_names for column in business_keys):
+                columns = [arrow_table.column(column) for column in business_keys]
+                arrow_table = arrow_table.append_column(key, generate_hash_keys(*columns))
+
+        if table in LINK_KEYS:
+            columns = [arrow_table.column(column) for column in LINK_KEYS[table]]
+            arrow_table = arrow_table.append_column("link_key", generate_hash_keys(*columns))
+
+        return arrow_table
+
+    def clear(self):
+        """Drop all collected rows."""
+        self.rows.clear()
+
+
+def _table_columns(con, table: str) -> List[str]:
+    """Get the column names of a vault table."""
+    rows = con.execute("""
+        SELECT column_name
+        FROM information_schema.columns
+        WHERE table_schema = 'main' AND table_name = ?
+        ORDER BY ordinal_position
+    """, (table,)).fetchall()
+    return [row[0] for row in rows]
+
+
+def _insert_table(con, table: str, arrow_table) -> int:
+    """Upsert one Arrow table into its vault table; returns rows written."""
+    primary_key, on_conflict = VAULT_TABLES[table]
+
+    # Business keys that aren't table columns (e.g. resort_name on a
+    # satellite) are dropped; omitted columns fall back to their defaults
+    columns = [c for c in _table_columns(con, table) if c in arrow_table.column_names]
+    column_list = ", ".join(columns)
+    key_list = ", ".join(primary_key)
+
+    if on_conflict == "latest":
+        updates = ", ".join(
+            f"{column} = EXCLUDED.{column}" for column in columns if column not in primary_key
+        )
+        conflict = f"""
+            ON CONFLICT ({key_list}) DO UPDATE SET {updates}
+            WHERE EXCLUDED.load_date > {table}.load_date
+        """
+    else:
+        conflict = "ON CONFLICT DO NOTHING"
+
+    con.register("_vault_batch", arrow_table)
+    try:
+        # Deduplicate within the batch first; a statement can't touch the
+        # same key twice
+        return con.execute(f"""
+            INSERT INTO main.{table} ({column_list})
+            SELECT {column_list}
+            FROM _vault_batch
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY {key_list} ORDER BY load_date DESC) = 1
+            {conflict}
+        """).fetchone()[0]
+    finally:
+        con.unregister("_vault_batch")
+
+
+def load_batch(batch: VaultBatch, con=None) -> Dict[str, int]:
+    """
+    Bulk load a batch into the vault tables in a single transaction.
+
+    Args:
+        batch: VaultBatch with collected rows
+        con: Optional DuckDB connection (a new session is opened otherwise)
+
+    Returns:
+        Rows written per table
+    """
+    if con is None:
+        with get_session("loader") as session:
+            return load_batch(batch, session)
+
+    written = {}
+    con.execute("BEGIN TRANSACTION")
+    try:
+        for table in VAULT_TABLES:
+            if batch.rows.get(table):
+                written[table] = _insert_table(con, table, batch.to_arrow(table))
+        bump_table_versions(con, [table for table, rows in written.items() if rows])
+        con.execute("COMMIT")
+    except Exception:
+        con.execute("ROLLBACK")
+        raise
+
+    return written
+
+
+def backfill_from_lake(
+    categories: List[str] = None,
+    start_date: datetime = None,
+    end_date: datetime = None,
+    files_per_batch: int = 500
+) -> Dict[str, int]:
+    """
+    Load raw lake files into the vault tables in bulk.
+
+    Files are read in batches of files_per_batch so memory stays bounded;
+    each batch is one transaction. Safe to re-run over the same files.
+
+    Args:
+        categories: Lake categories to load (defaults to LAKE_CATEGORIES)
+        start_date: Optional filter by file timestamp (inclusive)
+        end_date: Optional filter by file timestamp (inclusive)
+        files_per_batch: Files per load transaction
+
+    Returns:
+        Rows written per table
+    """
+    from config import load_resorts_config
+    from datalake.writer import list_raw_files
+
+    resorts = {resort.name: resort for resort in load_resorts_config().resorts}
+    totals = defaultdict(int)
+
+    with get_session("loader") as con:
+        for category in categories or LAKE_CATEGORIES:
+            files = list_raw_files(category, start_date=start_date, end_date=end_date)
+            files.reverse()  # oldest first
+            if not files:
+                print(f"  - {category}: no files")
+                continue
+
+            batch = VaultBatch()
+            skipped = 0
+            for i, filepath in enumerate(files, start=1):
+                try:
+                    with open(filepath, 'r') as f:
+                        record = json.load(f)
+                    resort = resorts.get(record["metadata"]["identifier"])
+                    batch.add_lake_record(category, record, resort=resort)
+                except (ValueError, KeyError, TypeError) as e:
+                    print(f"    ⚠ Skipping {filepath.name}: {e}")
+                    skipped += 1
+
+                if i % files_per_batch == 0 or i == len(files):
+                    for table, rows in load_batch(batch, con).items():
+                        totals[table] += rows
+                    batch.clear()
+
+            print(f"  ✓ {category}: {len(files) - skipped} files loaded")
+
+    return dict(totals)
+
+
+if __name__ == "__main__":
+    import time
+
+    from .session import init_db
+
+    init_db()
+
+    print("Backfilling vault tables from the data lake...\n")
+    started = time.perf_counter()
+    totals = backfill_from_lake()
+
+    for table, rows in totals.items():
+        print(f"  {table}: {rows} rows")
+    print(f"\n✓ Backfill finished in {time.perf_counter() - started:.1f}s")
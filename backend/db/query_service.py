@@ -0,0 +1,306 @@
+"""
+Bounded execution of generated SQL against the warehouse.
+
+Text-to-SQL output is untrusted: it may be slow, huge, or not a query at
+all. QueryService runs it with hard limits instead of through
+execute_query():
+
+- a short-lived read-only connection per query, with file access disabled
+  and its configuration locked, accepting a single SELECT statement
+- a timeout enforced by interrupting the query
+- row and byte caps; results are streamed and cut off at the cap
+- a concurrency limit with a bounded wait queue
+- a memory limit and thread count sized per concurrent query
+- a result cache keyed by normalized SQL, invalidated by table version bumps
+
+Usage:
+    service = QueryService()
+    result = service.ask("How much snow fell at Sugarloaf?")
+    result.df, result.truncated
+
+DuckDB allows one configuration per database file per process, so run the
+service in its own process (e.g. next to the API server), not in one that
+already writes to the database.
+
+Locking: any open DuckDB connection holds a lock on the database file, and
+writers (the loader, dbt, retention) need it exclusively. The service only
+holds a connection while queries run, opening one per query and closing it
+after, so writers are blocked for the length of a query rather than for the
+life of the service. Queries arriving while a writer holds the file are
+rejected with QueryRejected instead of waiting.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, NamedTuple
+
+import duckdb
+import pyarrow as pa
+
+from .analytics import GOLD_SCHEMA
+from .session import DB_PATH, QueryCache
+
+
+class QueryRejected(Exception):
+    """The SQL isn't a single read-only query, or the service is saturated."""
+
+
+class QueryTimeout(Exception):
+    """The query ran past its time limit and was interrupted."""
+
+
+class QueryResult(NamedTuple):
+    """Result of a bounded query."""
+    df: object  # pandas DataFrame
+    truncated: bool
+    cached: bool
+    elapsed_ms: float
+
+
+def stub_sql_generator(question: str) -> str:
+    """Stand-in for the text-to-SQL model: latest conditions for every resort."""
+    return f"SELECT * FROM {GOLD_SCHEMA}.gold_resort_conditions ORDER BY resort_name"
+
+
+class QueryService:
+    """
+    Runs untrusted SQL with time, size, memory and concurrency limits.
+
+    Args:
+        db_path: DuckDB database file (opened read-only, once per query)
+        max_concurrent: Queries running at once
+        max_queued: Queries allowed to wait for a slot; more are rejected
+        queue_timeout: Seconds a query waits for a slot before it's rejected
+        timeout_seconds: Seconds a query may run before it's interrupted
+        max_rows: Rows returned before the result is truncated
+        max_bytes: Result bytes (Arrow) returned before it's truncated
+        memory_limit_mb: Memory per concurrent query (DuckDB limits memory per
+            database, so the database gets max_concurrent times this)
+        threads_per_query: DuckDB threads per concurrent query
+        cache: QueryCache for results (a private one by default)
+    """
+
+    def __init__(
+        self,
+        db_path: str = DB_PATH,
+        max_concurrent: int = 4,
+        max_queued: int = 16,
+        queue_timeout: float = 10.0,
+        timeout_seconds: float = 10.0,
+        max_rows: int = 10_000,
+        max_bytes: int = 16 * 1024 * 1024,
+        memory_limit_mb: int = 512,
+        threads_per_query: int = 2,
+        cache: QueryCache = None
+    ):
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self.timeout_seconds = timeout_seconds
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+
+        self.db_path = db_path
+        # Concurrent connections share one database instance, so it is sized
+        # for every slot. Locked at open: generated SQL can't SET its way
+        # around the limits.
+        self._config = {
+            "memory_limit": f"{memory_limit_mb * max_concurrent}MB",
+            "threads": threads_per_query * max_concurrent,
+            "enable_external_access": False,
+            "lock_configuration": True,
+        }
+
+        self.cache = cache if cache is not None else QueryCache()
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._statements = OrderedDict()  # normalized SQL -> validated statement
+
+        self.stats = {"queries": 0, "rejected": 0, "timeouts": 0, "truncated": 0}
+
+    def _statement(self, sql: str) -> str:
+        """Validate SQL as a single SELECT, memoized by normalized text."""
+        key, _ = QueryCache.key(sql)
+        with self._lock:
+            statement = self._statements.get(key)
+            if statement is not None:
+                self._statements.move_to_end(key)
+                return statement
+
+        try:
+            statements = duckdb.extract_statements(sql)
+        except duckdb.Error as e:
+            raise QueryRejected(f"Invalid SQL: {e}") from None
+        if len(statements) != 1:
+            raise QueryRejected(f"Expected one statement, got {len(statements)}")
+        if statements[0].type != duckdb.StatementType.SELECT:
+            raise QueryRejected(f"Only SELECT queries are allowed, got {statements[0].type.name}")
+
+        statement = statements[0].query
+        with self._lock:
+            self._statements[key] = statement
+            if len(self._statements) > 256:
+                self._statements.popitem(last=False)
+        return statement
+
+    def _fetch_capped(self, con, statement: str, params=None):
+        """Stream a result, stopping at the row or byte cap."""
+        result = con.execute(statement, params) if params else con.execute(statement)
+        if hasattr(result, "to_arrow_reader"):
+            reader = result.to_arrow_reader(2048)
+        else:
+            reader = result.fetch_record_batch(2048)
+
+        batches, rows, size, truncated = [], 0, 0, False
+        for batch in reader:
+            if rows + batch.num_rows > self.max_rows:
+                batch = batch.slice(0, self.max_rows - rows)
+                truncated = True
+            if size + batch.nbytes > self.max_bytes:
+                # Keep the rows that fit, assuming evenly sized rows
+                fit = (self.max_bytes - size) * batch.num_rows // max(batch.nbytes, 1)
+                batch = batch.slice(0, fit)
+                truncated = True
+            batches.append(batch)
+            rows += batch.num_rows
+            size += batch.nbytes
+            if truncated:
+                break
+
+        df = pa.Table.from_batches(batches, schema=reader.schema).to_pandas()
+        df.attrs["truncated"] = truncated
+        return df
+
+    def _connect(self):
+        """
+        Open a read-only connection with the service limits.
+
+        Raises:
+            QueryRejected: If a writer holds the database file
+        """
+        try:
+            con = duckdb.connect(self.db_path, read_only=True, config=self._config)
+        except duckdb.IOException as e:
+            if "lock" not in str(e).lower():
+                raise
+            with self._lock:
+                self.stats["rejected"] += 1
+            raise QueryRejected("The database is being written, try again later") from None
+        return con
+
+    def _acquire(self):
+        with self._lock:
+            if self._waiting >= self.max_queued:
+                self.stats["rejected"] += 1
+                raise QueryRejected("Too many queries waiting, try again later")
+            self._waiting += 1
+
+        try:
+            acquired = self._slots.acquire(timeout=self.queue_timeout)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+        if not acquired:
+            with self._lock:
+                self.stats["rejected"] += 1
+            raise QueryRejected(f"No query slot free within {self.queue_timeout:g}s")
+
+    def run(self, sql: str, params=None) -> QueryResult:
+        """
+        Run one read-only query within the service limits.
+
+        Args:
+            sql: A single SELECT statement
+            params: Query parameters (optional)
+
+        Returns:
+            QueryResult with the (possibly truncated) DataFrame
+
+        Raises:
+            QueryRejected: If the SQL isn't a single SELECT, no slot frees up,
+                or a writer holds the database
+            QueryTimeout: If the query runs past timeout_seconds
+            duckdb.Error: If the query fails
+        """
+        statement = self._statement(sql)
+        self._acquire()
+
+        started = time.perf_counter()
+        executed = []
+
+        def fetch(con, query, query_params):
+            executed.append(True)
+            return self._fetch_capped(con, query, query_params)
+
+        try:
+            con = self._connect()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        timer = threading.Timer(self.timeout_seconds, con.interrupt)
+        timer.daemon = True
+        timer.start()
+        try:
+            df = self.cache.fetch_df(con, statement, params, run=fetch)
+        except duckdb.InterruptException:
+            with self._lock:
+                self.stats["timeouts"] += 1
+            raise QueryTimeout(f"Query exceeded {self.timeout_seconds:g}s") from None
+        finally:
+            timer.cancel()
+            # Releases the file lock once no other query is running
+            con.close()
+            self._slots.release()
+
+        truncated = df.attrs.get("truncated", False)
+        with self._lock:
+            self.stats["queries"] += 1
+            self.stats["truncated"] += truncated
+
+        return QueryResult(
+            df=df,
+            truncated=truncated,
+            cached=not executed,
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+        )
+
+    def ask(self, question: str, generator: Callable[[str], str] = stub_sql_generator) -> QueryResult:
+        """
+        Answer a natural-language question with generated SQL.
+
+        Args:
+            question: Question about the weather data
+            generator: Text-to-SQL function (a fixed stub by default)
+
+        Returns:
+            QueryResult for the generated query
+        """
+        return self.run(generator(question))
+
+    def close(self):
+        """Nothing to release: connections only live for one query."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a query through the bounded query service")
+    parser.add_argument("sql", help="SELECT statement")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Seconds before the query is interrupted")
+    parser.add_argument("--max-rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with QueryService(timeout_seconds=args.timeout, max_rows=args.max_rows) as service:
+        result = service.run(args.sql)
+        print(result.df.to_string(max_rows=50))
+        print(f"\n✓ {len(result.df)} rows in {result.elapsed_ms:.0f} ms"
+              + (" (truncated)" if result.truncated else ""))
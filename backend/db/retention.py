@@ -0,0 +1,375 @@
+"""
+Retention policies for Data Vault satellites.
+
+Three policies, configured per table in config/retention.yaml:
+
+- ``full_runs_days``: keep every forecast run for N days, then keep only the
+  run nearest each valid time (the latest run issued at or before it)
+- ``keep_days``: delete rows older than N days
+- ``full_resolution_days``: replace observations older than N days with
+  hourly aggregates
+
+Tables are the dbt-built ones (``main_silver`` / ``main_gold`` schemas).
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from .session import bump_table_versions, get_session
+
+# dbt prefixes custom schemas with the target schema ("main")
+SILVER_SCHEMA = "main_silver"
+GOLD_SCHEMA = "main_gold"
+
+# Marks observation rows produced by downsampling
+DOWNSAMPLED_RECORD_SOURCE = "weather.gov|hourly"
+
+# How each managed table is laid out and where its rows come from. A table's
+# source must expire no later than the table itself, otherwise the next dbt
+# run re-inserts the rows retention just removed.
+TABLE_LAYOUTS = {
+    "sat_forecast_hourly": {
+        "schema": SILVER_SCHEMA,
+        "keys": ["resort_key"],
+        "run_column": "forecast_generated_at",
+        "valid_column": "start_time",
+        "source": "raw:hourly",
+    },
+    "sat_forecast_period": {
+        "schema": SILVER_SCHEMA,
+        "keys": ["resort_key"],
+        "run_column": "forecast_generated_at",
+        "valid_column": "start_time",
+        "source": "raw:forecasts",
+    },
+    "gold_grid_hourly": {
+        "schema": GOLD_SCHEMA,
+        "keys": ["resort_key"],
+        "run_column": "update_time",
+        "valid_column": "valid_hour",
+        "source": "sat_grid_data",
+    },
+    "sat_grid_data": {
+        "schema": SILVER_SCHEMA,
+        "time_column": "update_time",
+        "source": "raw:grid_data",
+    },
+    "sat_observation": {
+        "schema": SILVER_SCHEMA,
+        "keys": ["station_key"],
+        "time_column": "observation_time",
+        "source": "raw:observations",
+    },
+    # Incremental gold tables: dbt only revisits valid hours touched by newly
+    # loaded data, so expired rows come back only with --full-refresh
+    "gold_forecast_verification": {
+        "schema": GOLD_SCHEMA,
+        "time_column": "valid_hour",
+        "source": "gold_grid_hourly",
+    },
+    "gold_forecast_revisions": {
+        "schema": GOLD_SCHEMA,
+        "time_column": "valid_hour",
+        "source": "gold_grid_hourly",
+    },
+}
+
+
+def check_policies(config) -> List[str]:
+    """
+    Check that every table's source expires no later than the table.
+
+    Args:
+        config: RetentionConfig from config.load_retention_config()
+
+    Returns:
+        List of problems (empty if the policies are consistent)
+    """
+    problems = []
+
+    for table, policy in config.satellites.items():
+        if table not in TABLE_LAYOUTS:
+            problems.append(f"{table}: no retention layout defined")
+            continue
+
+        source = TABLE_LAYOUTS[table]["source"]
+        if source.startswith("raw:"):
+            category = source.split(":", 1)[1]
+            source_days = config.raw.archive_after_days.get(category)
+        else:
+            source_policy = config.satellites.get(source)
+            source_days = source_policy.days if source_policy else None
+
+        if source_days is None or source_days > policy.days:
+            problems.append(
+                f"{table}: source {source} is kept {source_days or 'forever'} days, "
+                f"longer than the table's {policy.days} days"
+            )
+
+    return problems
+
+
+def _database_size(con) -> Dict[str, int]:
+    """Get block usage of the current database."""
+    row = con.execute(
+        "SELECT block_size, used_blocks, free_blocks FROM pragma_database_size()"
+    ).fetchone()
+    return {"block_size": row[0], "used_blocks": row[1], "free_blocks": row[2]}
+
+
+def _table_exists(con, schema: str, table: str) -> bool:
+    """Check whether a table exists."""
+    return con.execute("""
+        SELECT COUNT(*)
+        FROM information_schema.tables
+        WHERE table_schema = ? AND table_name = ?
+    """, (schema, table)).fetchone()[0] > 0
+
+
+def thin_forecast_runs(con, table: str, cutoff: datetime, dry_run: bool = False) -> int:
+    """
+    Keep only the nearest run per valid time for runs older than cutoff.
+
+    The nearest run is the latest one issued at or before the valid time
+    (shortest lead), falling back to the earliest run when every run was
+    issued after it.
+
+    Args:
+        con: DuckDB connection
+        table: Table name from TABLE_LAYOUTS
+        cutoff: Runs issued before this are thinned
+        dry_run: Only count the rows that would be deleted
+
+    Returns:
+        Number of rows deleted (or that would be deleted)
+    """
+    layout = TABLE_LAYOUTS[table]
+    relation = f"{layout['schema']}.{table}"
+    keys = ", ".join(layout["keys"])
+    run = layout["run_column"]
+    valid = layout["valid_column"]
+    key_match = " AND ".join(f"t.{k} = k.{k}" for k in layout["keys"])
+
+    kept_runs = f"""
+        WITH ranked AS (
+            SELECT
+                {keys},
+                {valid},
+                {run},
+                ROW_NUMBER() OVER (
+                    PARTITION BY {keys}, {valid}
+                    ORDER BY
+                        {run} <= {valid} DESC,
+                        CASE WHEN {run} <= {valid} THEN {run} END DESC NULLS LAST,
+                        {run}
+                ) as rn
+            FROM {relation}
+            WHERE ({keys}, {valid}) IN (
+                SELECT {keys}, {valid} FROM {relation} WHERE {run} < $cutoff
+            )
+        ),
+        kept AS (
+            SELECT {keys}, {valid}, {run} as kept_run
+            FROM ranked
+            WHERE rn = 1
+        )
+    """
+    condition = f"""
+        {key_match}
+        AND t.{valid} = k.{valid}
+        AND t.{run} < $cutoff
+        AND t.{run} <> k.kept_run
+    """
+
+    if dry_run:
+        return con.execute(f"""
+            {kept_runs}
+            SELECT COUNT(*) FROM {relation} t INNER JOIN kept k ON {condition}
+        """, {"cutoff": cutoff}).fetchone()[0]
+
+    return con.execute(f"""
+        {kept_runs}
+        DELETE FROM {relation} t USING kept k WHERE {condition}
+    """, {"cutoff": cutoff}).fetchone()[0]
+
+
+def expire_rows(con, table: str, cutoff: datetime, dry_run: bool = False) -> int:
+    """
+    Delete rows older than cutoff.
+
+    Args:
+        con: DuckDB connection
+        table: Table name from TABLE_LAYOUTS
+        cutoff: Rows with time_column before this are deleted
+        dry_run: Only count the rows that would be deleted
+
+    Returns:
+        Number of rows deleted (or that would be deleted)
+    """
+    layout = TABLE_LAYOUTS[table]
+    relation = f"{layout['schema']}.{table}"
+    where = f"{layout['time_column']} < ?"
+
+    if dry_run:
+        return con.execute(
+            f"SELECT COUNT(*) FROM {relation} WHERE {where}", (cutoff,)
+        ).fetchone()[0]
+
+    return con.execute(f"DELETE FROM {relation} WHERE {where}", (cutoff,)).fetchone()[0]
+
+
+def downsample_observations(
+    con,
+    table: str,
+    cutoff: datetime,
+    dry_run: bool = False
+) -> int:
+    """
+    Replace observations older than cutoff with hourly aggregates.
+
+    Numeric measurements are averaged, except gusts and precipitation
+    accumulations which keep the hourly maximum. Everything else takes the
+    value of the last observation in the hour. Hours that were already
+    downsampled are left as they are; late raw rows for them are dropped.
+
+    Args:
+        con: DuckDB connection
+        table: Table name from TABLE_LAYOUTS
+        cutoff: Observations before this are downsampled
+        dry_run: Only count the rows that would be removed
+
+    Returns:
+        Net number of rows removed (or that would be removed)
+    """
+    layout = TABLE_LAYOUTS[table]
+    relation = f"{layout['schema']}.{table}"
+    keys = layout["keys"]
+    time_column = layout["time_column"]
+
+    columns = con.execute("""
+        SELECT column_name, data_type
+        FROM information_schema.columns
+        WHERE table_schema = ? AND table_name = ?
+        ORDER BY ordinal_position
+    """, (layout["schema"], table)).fetchall()
+
+    select_list = []
+    for name, data_type in columns:
+        if name in keys:
+            select_list.append(name)
+        elif name == time_column:
+            select_list.append(f"DATE_TRUNC('hour', {name}) as {name}")
+        elif name == "record_source":
+            select_list.append(f"'{DOWNSAMPLED_RECORD_SOURCE}' as {name}")
+        elif name == "load_date":
+            select_list.append(f"MAX({name}) as {name}")
+        elif data_type in ("DOUBLE", "FLOAT", "INTEGER", "BIGINT", "DECIMAL"):
+            if "gust" in name or "precipitation" in name:
+                select_list.append(f"MAX({name}) as {name}")
+            else:
+                select_list.append(f"AVG({name}) as {name}")
+        else:
+            select_list.append(f"arg_max({name}, {time_column}) as {name}")
+
+    key_list = ", ".join(keys)
+    raw_rows = f"""
+        {time_column} < $cutoff
+        AND record_source IS DISTINCT FROM '{DOWNSAMPLED_RECORD_SOURCE}'
+    """
+
+    if dry_run:
+        return con.execute(f"""
+            SELECT
+                COUNT(*) - COUNT(DISTINCT ({key_list}, DATE_TRUNC('hour', {time_column})))
+            FROM {relation}
+            WHERE {raw_rows}
+        """, {"cutoff": cutoff}).fetchone()[0]
+
+    before = con.execute(f"SELECT COUNT(*) FROM {relation}").fetchone()[0]
+
+    con.execute(f"""
+        CREATE OR REPLACE TEMP TABLE _downsampled AS
+        SELECT {", ".join(select_list)}
+        FROM {relation}
+        WHERE {raw_rows}
+        GROUP BY {key_list}, DATE_TRUNC('hour', {time_column})
+    """, {"cutoff": cutoff})
+    con.execute(f"DELETE FROM {relation} WHERE {raw_rows}", {"cutoff": cutoff})
+
+    key_match = " AND ".join(f"t.{k} = d.{k}" for k in keys)
+    con.execute(f"""
+        INSERT INTO {relation} BY NAME
+        SELECT d.*
+        FROM _downsampled d
+        WHERE NOT EXISTS (
+            SELECT 1 FROM {relation} t
+            WHERE {key_match} AND t.{time_column} = d.{time_column}
+        )
+    """)
+    con.execute("DROP TABLE _downsampled")
+
+    after = con.execute(f"SELECT COUNT(*) FROM {relation}").fetchone()[0]
+    return before - after
+
+
+def apply_satellite_retention(config, now: datetime = None, dry_run: bool = False) -> dict:
+    """
+    Apply every satellite policy in the retention config.
+
+    Each table is processed in its own transaction; the database is
+    checkpointed afterwards so freed blocks show up in the report.
+
+    Args:
+        config: RetentionConfig from config.load_retention_config()
+        now: Reference time for cutoffs (defaults to now)
+        dry_run: Only report what would be removed
+
+    Returns:
+        Report with rows removed per table and bytes freed in the database
+    """
+    if now is None:
+        now = datetime.now()
+
+    report = {"tables": {}, "bytes_reclaimed": 0}
+
+    with get_session("loader") as con:
+        size_before = _database_size(con)
+
+        for table, policy in config.satellites.items():
+            layout = TABLE_LAYOUTS[table]
+            if not _table_exists(con, layout["schema"], table):
+                print(f"  - {table}: not built yet, skipping")
+                continue
+
+            cutoff = now - timedelta(days=policy.days)
+            if policy.full_runs_days is not None:
+                action = thin_forecast_runs
+            elif policy.keep_days is not None:
+                action = expire_rows
+            else:
+                action = downsample_observations
+
+            con.execute("BEGIN TRANSACTION")
+            try:
+                rows = action(con, table, cutoff, dry_run=dry_run)
+                if rows and not dry_run:
+                    bump_table_versions(con, [f"{layout['schema']}.{table}"])
+                con.execute("COMMIT")
+            except Exception:
+                con.execute("ROLLBACK")
+                raise
+
+            report["tables"][table] = {
+                "policy": action.__name__,
+                "cutoff": cutoff.isoformat(),
+                "rows_removed": rows,
+            }
+            print(f"  ✓ {table}: {action.__name__} before {cutoff:%Y-%m-%d} → {rows} rows")
+
+        if not dry_run:
+            con.execute("CHECKPOINT")
+            size_after = _database_size(con)
+            freed_blocks = size_after["free_blocks"] - size_before["free_blocks"]
+            report["bytes_reclaimed"] = max(freed_blocks, 0) * size_after["block_size"]
+
+    return report
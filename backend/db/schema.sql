@@ -266,6 +266,16 @@ CREATE TABLE IF NOT EXISTS sat_observation (
     PRIMARY KEY (station_key, observation_time)
 );
 
+-- ============================================================================
+-- TABLE VERSIONS - Bumped by every writer to invalidate cached reads
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name VARCHAR PRIMARY KEY,      -- "table" in main, else "schema.table"
+    version BIGINT NOT NULL,
+    updated_at TIMESTAMP NOT NULL
+);
+
 -- ============================================================================
 -- INDEXES for Performance
 -- ============================================================================
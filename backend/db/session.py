@@ -3,34 +3,116 @@ Database session management for DuckDB.
 
 Uses raw DuckDB Python API instead of SQLAlchemy for better compatibility
 and performance with analytical workloads.
+
+Read results can be cached in memory with QueryCache. Every writer (the
+loader, retention and dbt's on-run-end hook) bumps a per-table counter in
+main.table_versions, and a cached result is only served while the versions
+of the tables it read are unchanged.
+
+Set DB_PROFILE=1 to time queries and log slow ones (see db.profiling).
+
+Connections are opened for a role (loader, transform or reader), whose
+memory limit, threads, spill directory and insertion-order setting come
+from config/duckdb.yaml. DuckDB applies them to the whole database instance,
+which every connection to the file in a process shares, so the role opened
+last governs the process; long-running processes use a single role.
 """
 
 import os
+import re
+import threading
 import duckdb
+from collections import OrderedDict
 from pathlib import Path
 from contextlib import contextmanager
-from typing import Generator
+from typing import Callable, Dict, Generator, Iterable
+
+from .profiling import profiler
 
 # Get database path from environment or use default
 DB_PATH = os.getenv("DATABASE_URL", "data/weather.duckdb")
 
-# Ensure data directory exists
-data_dir = Path(DB_PATH).parent
-data_dir.mkdir(parents=True, exist_ok=True)
+# Resource limits per connection role
+DUCKDB_CONFIG = os.getenv(
+    "DUCKDB_CONFIG", str(Path(__file__).resolve().parent.parent / "config" / "duckdb.yaml")
+)
+DEFAULT_ROLE = "reader"
+
+_role_settings: Dict[str, dict] = {}
+
+
+def role_settings(role: str) -> dict:
+    """
+    DuckDB settings for a connection role, read once per process.
+
+    Args:
+        role: Role name in config/duckdb.yaml (loader, transform, reader)
+
+    Returns:
+        Setting name -> value, with DUCKDB_<ROLE>_<SETTING> overrides applied
+
+    Raises:
+        ValueError: If the role isn't configured
+    """
+    settings = _role_settings.get(role)
+    if settings is None:
+        from config import load_duckdb_config
+        settings = _role_settings[role] = load_duckdb_config(DUCKDB_CONFIG).role(role).settings()
+    return settings
+
+
+def role_env(role: str) -> Dict[str, str]:
+    """
+    A role's settings as DUCKDB_<ROLE>_<SETTING> environment variables.
+
+    This is how dbt gets the transform limits (see db/data_model/profiles.yml).
+    Paths are made absolute, since dbt runs from the project directory.
 
+    Args:
+        role: Role name in config/duckdb.yaml
 
-def get_connection() -> duckdb.DuckDBPyConnection:
+    Returns:
+        Variable name -> value
     """
-    Get DuckDB connection.
+    env = {}
+    for setting, value in role_settings(role).items():
+        if setting == "temp_directory":
+            value = Path(value).resolve()
+        elif isinstance(value, bool):
+            value = str(value).lower()
+        env[f"DUCKDB_{role.upper()}_{setting.upper()}"] = str(value)
+    return env
+
+
+def get_connection(role: str = DEFAULT_ROLE) -> duckdb.DuckDBPyConnection:
+    """
+    Get DuckDB connection, creating the database directory if needed.
+
+    Args:
+        role: Resource profile to apply (loader, transform, reader)
 
     Returns:
         DuckDB connection instance
     """
-    return duckdb.connect(DB_PATH)
+    settings = role_settings(role)
+
+    # Created here rather than at import, so importing db touches nothing
+    Path(DB_PATH).parent.mkdir(parents=True, exist_ok=True)
+    con = duckdb.connect(DB_PATH)
+
+    # SET rather than connect(config=...): DuckDB refuses a second connection
+    # to the same file with a different config
+    try:
+        for setting, value in settings.items():
+            con.execute(f"SET {setting} = ?", [value])
+    except duckdb.Error:
+        con.close()
+        raise
+    return con
 
 
 @contextmanager
-def get_session() -> Generator[duckdb.DuckDBPyConnection, None, None]:
+def get_session(role: str = DEFAULT_ROLE) -> Generator[duckdb.DuckDBPyConnection, None, None]:
     """
     Context manager for database connections.
 
@@ -39,10 +121,13 @@ def get_session() -> Generator[duckdb.DuckDBPyConnection, None, None]:
             con.execute("INSERT INTO ...")
             result = con.execute("SELECT ...").fetchall()
 
+    Args:
+        role: Resource profile to apply (loader, transform, reader)
+
     Yields:
         DuckDB connection
     """
-    con = get_connection()
+    con = get_connection(role)
     try:
         yield con
     finally:
@@ -65,7 +150,7 @@ def init_db():
         schema_sql = f.read()
 
     # Execute schema
-    with get_session() as con:
+    with get_session("loader") as con:
         con.execute(schema_sql)
 
     print(f"✓ Database initialized at {DB_PATH}")
@@ -99,7 +184,7 @@ def drop_all_tables():
         'hub_resort',
     ]
 
-    with get_session() as con:
+    with get_session("loader") as con:
         for table in tables:
             con.execute(f"DROP TABLE IF EXISTS {table}")
 
@@ -136,28 +221,209 @@ def execute_query(query: str, params: tuple = None):
         Query results
     """
     with get_session() as con:
-        if params:
-            return con.execute(query, params).fetchall()
-        else:
-            return con.execute(query).fetchall()
+        return profiler.fetchall(con, query, params)
+
 
+# ============================================================================
+# Table versions and query cache
+# ============================================================================
+
+TABLE_VERSIONS_DDL = """
+    CREATE TABLE IF NOT EXISTS main.table_versions (
+        table_name VARCHAR PRIMARY KEY,
+        version BIGINT NOT NULL,
+        updated_at TIMESTAMP NOT NULL
+    )
+"""
+
+
+def _table_key(name: str) -> str:
+    """Normalize a table name to "table" (main schema) or "schema.table"."""
+    name = name.lower()
+    return name[len("main."):] if name.startswith("main.") else name
+
+
+def bump_table_versions(con, tables: Iterable[str]):
+    """
+    Record that tables changed, invalidating cached results that read them.
+
+    Call inside the writer's transaction so the bump commits with the data.
+
+    Args:
+        con: Open connection
+        tables: Table names, schema-qualified outside main
+    """
+    keys = sorted({_table_key(table) for table in tables})
+    if not keys:
+        return
+
+    con.execute(TABLE_VERSIONS_DDL)
+    con.executemany("""
+        INSERT INTO main.table_versions (table_name, version, updated_at)
+        VALUES (?, 1, now())
+        ON CONFLICT (table_name) DO UPDATE SET
+            version = table_versions.version + 1,
+            updated_at = excluded.updated_at
+    """, [(key,) for key in keys])
+
+
+def get_table_versions(con) -> Dict[str, int]:
+    """
+    Get the current version of every table that has been written.
+
+    Returns:
+        Dictionary of table name to version (tables never bumped are absent)
+    """
+    try:
+        return dict(con.execute("SELECT table_name, version FROM main.table_versions").fetchall())
+    except duckdb.CatalogException:
+        return {}
+
+
+# String literals and quoted identifiers are kept as-is; whitespace elsewhere
+# is collapsed so reformatted queries share a cache entry
+_SQL_TOKENS = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*")|\s+""")
+
+
+# Prepared-statement placeholders (?, $1, $name) outside literals. The parser
+# behind get_table_names rejects them, so they are bound to NULL first.
+_SQL_PARAMS = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*")|\?|\$(?:\d+|[A-Za-z_]\w*)""")
+
+
+def _bind_nulls(query: str) -> str:
+    """Replace the placeholders of a parameterized query with NULL literals."""
+    return _SQL_PARAMS.sub(lambda m: m.group(1) or "NULL", query)
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class QueryCache:
+    """
+    LRU cache of query results, invalidated by table version bumps.
+
+    Entries are keyed by normalized SQL plus parameters and remember the
+    versions of the tables the query read (views are resolved to their
+    underlying tables; parameterized queries are resolved with their
+    placeholders bound to NULL). Queries that read no tables, such as
+    read_json over the lake, are never cached.
+
+    Args:
+        max_entries: Results kept before the least recently used is evicted
+        max_bytes: Total DataFrame memory kept (larger results aren't cached)
+    """
 
-def execute_query_df(query: str, params: tuple = None):
+    def __init__(self, max_entries: int = 128, max_bytes: int = 256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries = OrderedDict()  # key -> (table versions, DataFrame, bytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def key(query: str, params=None) -> tuple:
+        """Cache key for a query: whitespace-normalized SQL plus parameters."""
+        sql = _SQL_TOKENS.sub(lambda m: m.group(1) or " ", query).strip()
+        return sql, _freeze(params) if params else ()
+
+    def fetch_df(self, con, query: str, params=None, run: Callable = None):
+        """
+        Run a query through the cache.
+
+        Args:
+            con: Open connection
+            query: SQL query string
+            params: Query parameters (optional)
+            run: Called as run(con, query, params) on a miss to produce the
+                DataFrame (defaults to executing it through the profiler)
+
+        Returns:
+            pandas DataFrame (a copy; callers may modify it)
+        """
+        key = self.key(query, params)
+        current = get_table_versions(con)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                versions, df, _ = entry
+                if all(current.get(table, 0) == version for table, version in versions):
+                    self._entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return df.copy()
+            self.stats["misses"] += 1
+
+        df = (run or profiler.fetch_df)(con, query, params)
+
+        try:
+            tables = con.get_table_names(_bind_nulls(query), qualified=True)
+        except duckdb.Error:
+            tables = set()
+        if tables:
+            # Versions read before the query ran: a load committing meanwhile
+            # just makes the next read a miss
+            versions = tuple(sorted((_table_key(t), current.get(_table_key(t), 0)) for t in tables))
+            self._store(key, versions, df)
+
+        return df.copy()
+
+    def _store(self, key: tuple, versions: tuple, df):
+        size = int(df.memory_usage(deep=True).sum())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+
+            self._entries[key] = (versions, df, size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.stats["evictions"] += 1
+
+    def clear(self):
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide cache used by execute_query_df(cache=True) and the console
+query_cache = QueryCache()
+
+
+def execute_query_df(query: str, params: tuple = None, cache: bool = False):
     """
     Execute a query and return results as pandas DataFrame.
 
     Args:
         query: SQL query string
         params: Query parameters (optional)
+        cache: Serve repeat reads from query_cache until a table they read
+            is bumped
 
     Returns:
         pandas DataFrame
     """
     with get_session() as con:
-        if params:
-            return con.execute(query, params).df()
-        else:
-            return con.execute(query).df()
+        if cache:
+            return query_cache.fetch_df(con, query, params)
+        return profiler.fetch_df(con, query, params)
 
 
 if __name__ == "__main__":
@@ -26,3 +26,96 @@ def generate_hash_key(*values) -> str:
 
     # Generate MD5 hash
     return hashlib.md5(combined.encode()).hexdigest()
+
+
+def fetch_arrow(result):
+    """
+    Fetch a DuckDB result as a pyarrow Table.
+
+    ``.arrow()`` returns a Table on older DuckDB releases and a
+    RecordBatchReader on newer ones; this accepts either.
+
+    Args:
+        result: DuckDB connection/relation after execute()
+
+    Returns:
+        pyarrow Table
+    """
+    table = result.arrow()
+    return table.read_all() if hasattr(table, "read_all") else table
+
+
+def _to_string_array(column):
+    """Convert a key column to a pyarrow string array, matching str(v)."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if isinstance(column, pa.ChunkedArray):
+        array = column.combine_chunks()
+    elif isinstance(column, pa.Array):
+        array = column
+    else:
+        array = pa.array(column)
+
+    if array.null_count:
+        raise ValueError("Hash key columns must not contain nulls")
+
+    if pa.types.is_dictionary(array.type):
+        array = array.dictionary_decode()
+
+    if pa.types.is_string(array.type) or pa.types.is_large_string(array.type):
+        return array.cast(pa.string())
+    if pa.types.is_integer(array.type):
+        return pc.cast(array, pa.string())
+
+    # Floats, booleans, dates, ...: Arrow's formatting differs from Python's
+    # (e.g. 1.0 -> "1", True -> "true"), so fall back to str() for exactness
+    return pa.array([str(v) for v in array.to_pylist()], type=pa.string())
+
+
+def generate_hash_keys(*columns):
+    """
+    Generate MD5 hash keys for many rows at once.
+
+    Columnar counterpart of generate_hash_key(): row i of the result equals
+    generate_hash_key(columns[0][i], columns[1][i], ...), which is also what
+    the dbt models compute with MD5(a || '|' || b) (see macros/hash_key.sql).
+    Hashing runs inside DuckDB's vectorized md5(), not a Python loop.
+
+    Args:
+        *columns: Equal-length key columns (pyarrow arrays, pandas Series,
+            numpy arrays or lists). Nulls are not allowed.
+
+    Returns:
+        pyarrow string array of 32-character MD5 hashes (lowercase hex)
+
+    Example:
+        >>> generate_hash_keys(["Sugarloaf", "Stratton"], ["ME", "VT"])
+        <pyarrow.lib.StringArray ...>
+    """
+    import duckdb
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if not columns:
+        raise ValueError("At least one key column is required")
+
+    arrays = [_to_string_array(column) for column in columns]
+    if len({len(array) for array in arrays}) > 1:
+        raise ValueError("Hash key columns must have the same length")
+
+    if len(arrays) == 1:
+        combined = arrays[0]
+    else:
+        combined = pc.binary_join_element_wise(*arrays, "|")
+
+    keys_input = pa.table({"combined": combined})
+
+    con = duckdb.connect()
+    try:
+        con.register("keys_input", keys_input)
+        result = fetch_arrow(con.execute("SELECT md5(combined) AS key FROM keys_input"))
+    finally:
+        con.close()
+
+    return result.column("key").combine_chunks()
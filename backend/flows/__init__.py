@@ -1,3 +1,5 @@
-"""Prefect workflows for data collection and processing."""
+"""Workflows for data collection and processing.
 
-# Flows will be added here later
+- scheduler: long-running per-category collection daemon (no extra dependencies)
+- collect, transform, maintenance, pipeline: Prefect flows (``prefect`` extra)
+"""
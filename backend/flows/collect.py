@@ -0,0 +1,128 @@
+"""
+Prefect collection flow.
+
+Fetches every (category, resort) pair as its own mapped task. Points are
+fetched first because every other category is derived from them. Each
+category's fetch task caches its result on the task inputs for one cadence
+from config/schedule.yaml, so rerunning the flow inside that window doesn't
+request unchanged upstream resources again:
+
+    python -m flows.collect
+
+Fetch tasks are tagged ``weather-api``; cap concurrent API requests across
+runs with ``prefect concurrency-limit create weather-api 4``.
+"""
+
+import threading
+import time
+from datetime import timedelta
+from typing import List, Optional
+
+from prefect import flow, task, unmapped
+from prefect.task_runners import ThreadPoolTaskRunner
+from prefect.tasks import task_input_hash
+
+from config import load_resort_registry, load_schedule_config
+from datalake.writer import fetch_resort_category
+from telemetry import CycleLog, metrics
+
+API_TAG = "weather-api"
+
+_local = threading.local()
+
+
+def _client():
+    """WeatherClient for the current task runner thread."""
+    client = getattr(_local, "client", None)
+    if client is None:
+        from clients import WeatherClient
+        client = _local.client = WeatherClient()
+    return client
+
+
+@task(
+    name="fetch-category",
+    tags=[API_TAG],
+    retries=2,
+    retry_delay_seconds=30,
+    cache_key_fn=task_input_hash,
+    persist_result=True,
+)
+def fetch_category(category: str, resort_name: str, latitude: float, longitude: float) -> dict:
+    """
+    Fetch and land one category for one resort.
+
+    Returns:
+        Dictionary with the saved path and when it was fetched
+    """
+    filepath, _ = fetch_resort_category(category, resort_name, latitude, longitude, _client())
+    return {
+        "category": category,
+        "resort": resort_name,
+        "path": str(filepath),
+        "fetched_at": time.time(),
+    }
+
+
+@flow(name="collect", task_runner=ThreadPoolTaskRunner(max_workers=4))
+def collect_flow(
+    resorts: Optional[List[str]] = None,
+    categories: Optional[List[str]] = None
+) -> dict:
+    """
+    Collect weather data for resorts.
+
+    Args:
+        resorts: Resort names (defaults to every resort in resorts.yaml)
+        categories: Categories to fetch (defaults to those in schedule.yaml)
+
+    Returns:
+        Counts of fetched, cached (not re-requested) and failed tasks
+    """
+    started = time.time()
+    registry = load_resort_registry()
+    schedule = load_schedule_config()
+
+    selected = [registry.get(name) for name in resorts] if resorts else list(registry)
+    categories = categories or list(schedule.resources)
+
+    names = [resort.name for resort in selected]
+    latitudes = [resort.location.latitude for resort in selected]
+    longitudes = [resort.location.longitude for resort in selected]
+
+    # Points first: the other categories read them from the lake
+    stages = [
+        [c for c in categories if c == "points"],
+        [c for c in categories if c != "points"],
+    ]
+
+    report = {"fetched": 0, "cached": 0, "failed": 0}
+    with CycleLog("collect-flow", resorts=len(names)) as cycle_log:
+        for stage in stages:
+            futures = []
+            for category in stage:
+                fetch = fetch_category.with_options(
+                    name=f"fetch-{category}",
+                    cache_expiration=timedelta(minutes=schedule.resources[category].every_minutes),
+                )
+                futures.extend(fetch.map(unmapped(category), names, latitudes, longitudes))
+
+            for future in futures:
+                result = future.result(raise_on_failure=False)
+                if isinstance(result, BaseException):
+                    report["failed"] += 1
+                elif result["fetched_at"] >= started:
+                    report["fetched"] += 1
+                else:
+                    report["cached"] += 1
+                    metrics.inc("collection_cache_hits_total", category=result["category"], source="prefect")
+
+        cycle_log.fields.update(report)
+
+    print(f"✓ Fetched {report['fetched']}, cached {report['cached']}, failed {report['failed']}")
+    print(f"✓ Cycle took {cycle_log.summary()}")
+    return report
+
+
+if __name__ == "__main__":
+    collect_flow()
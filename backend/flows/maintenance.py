@@ -0,0 +1,43 @@
+"""
+Prefect retention flow.
+
+Wraps the retention job (see retention.py) so it can run alongside the
+other flows:
+
+    python -m flows.maintenance --dry-run
+"""
+
+from prefect import flow, task
+
+from retention import run_retention
+
+
+@task(name="apply-retention")
+def apply_retention(config_path: str, dry_run: bool) -> dict:
+    """Archive old raw files and thin old satellite rows."""
+    return run_retention(config_path, dry_run=dry_run)
+
+
+@flow(name="retention")
+def retention_flow(config_path: str = "config/retention.yaml", dry_run: bool = False) -> dict:
+    """
+    Apply all retention policies.
+
+    Args:
+        config_path: Path to retention.yaml
+        dry_run: Only report what would be removed
+
+    Returns:
+        Retention report
+    """
+    return apply_retention(config_path, dry_run)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Apply data retention policies")
+    parser.add_argument("--dry-run", action="store_true", help="Report without deleting")
+    args = parser.parse_args()
+
+    retention_flow(dry_run=args.dry_run)
@@ -0,0 +1,40 @@
+"""
+End-to-end Prefect pipeline: collect, then build the data model if new
+data landed.
+
+    python -m flows.pipeline
+
+Runs against a temporary local Prefect server when PREFECT_API_URL isn't
+set, so no server has to be started first.
+"""
+
+from typing import List, Optional
+
+from prefect import flow
+
+from flows.collect import collect_flow
+from flows.transform import transform_flow
+
+
+@flow(name="weather-pipeline")
+def pipeline_flow(resorts: Optional[List[str]] = None) -> dict:
+    """
+    Collect resort data and transform it.
+
+    Args:
+        resorts: Resort names (defaults to every resort in resorts.yaml)
+
+    Returns:
+        Collection report and whether dbt ran
+    """
+    collected = collect_flow(resorts=resorts)
+
+    # Cached fetches land nothing. The lake check also catches backfilled
+    # files, so dbt runs exactly when there is something new to build
+    built = transform_flow()
+
+    return {"collected": collected, "dbt_ran": built}
+
+
+if __name__ == "__main__":
+    pipeline_flow()
@@ -0,0 +1,342 @@
+"""
+Collection scheduler daemon.
+
+Keeps a next-due time per (category, resort) and dispatches only the work
+that is due to a worker pool, instead of fetching every category on every
+run:
+
+    python -m flows.scheduler             # run until interrupted
+    python -m flows.scheduler --once      # fetch what is due now, then exit
+
+Cadences come from config/schedule.yaml. After each fetch the next due time
+is derived from the response: one cadence after its ``updateTime`` (or the
+observation ``timestamp``), never before its ``Expires`` header, and clamped
+to the category's [min_minutes, max_minutes].
+
+On start, due times are seeded from the newest landed file of each category,
+so a restart doesn't refetch everything. resorts.yaml is re-checked on every
+loop, so added or removed resorts are picked up without a restart.
+"""
+
+import heapq
+import itertools
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from config import ResourceSchedule, ScheduleConfig, load_resort_registry, load_schedule_config
+from datalake.writer import RESORT_CATEGORIES, fetch_resort_category, get_file_timestamp, get_latest_raw_file
+from telemetry import CycleLog, metrics, serve_metrics
+
+# Response field holding the time the data was last updated upstream
+UPDATE_TIME_FIELDS = {
+    "forecasts": "updateTime",
+    "hourly": "updateTime",
+    "grid_data": "updateTime",
+    "observations": "timestamp",
+}
+
+# Longest sleep between checks for new resorts
+POLL_SECONDS = 30
+
+# Minimum time between Prometheus file refreshes while running as a daemon
+METRICS_WRITE_SECONDS = 15
+
+Job = Tuple[str, str]  # (category, resort name)
+
+
+def _epoch(value) -> Optional[float]:
+    """Convert a datetime or ISO string to epoch seconds (naive values are UTC)."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _expires(headers) -> Optional[float]:
+    """Get the Expires header as epoch seconds."""
+    value = (headers or {}).get("Expires")
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def next_due(
+    category: str,
+    resource: ResourceSchedule,
+    now: float,
+    data: dict = None,
+    headers=None,
+    grace_seconds: float = 0
+) -> float:
+    """
+    Work out when a category should next be fetched.
+
+    Args:
+        category: Lake category
+        resource: Cadence for the category
+        now: Current time (epoch seconds)
+        data: Response just saved
+        headers: Response headers
+        grace_seconds: Allowance for an expected update to be published
+
+    Returns:
+        Next due time (epoch seconds)
+    """
+    every = resource.every_minutes * 60
+    due = now + every
+
+    field = UPDATE_TIME_FIELDS.get(category)
+    if field and data:
+        updated = _epoch((data.get("properties") or {}).get(field))
+        if updated is not None:
+            due = min(due, updated + every + grace_seconds)
+
+    expires = _expires(headers)
+    if expires is not None:
+        due = max(due, expires)
+
+    return min(max(due, now + resource.min_minutes * 60), now + resource.max_minutes * 60)
+
+
+class CollectionScheduler:
+    """
+    Long-running collector driven by per-(category, resort) due times.
+
+    Args:
+        schedule: ScheduleConfig (defaults to config/schedule.yaml)
+        client_factory: Callable returning a WeatherClient (one per worker thread)
+        resorts_path: Path to resorts.yaml
+        max_workers: Concurrent fetches (defaults to schedule.workers)
+    """
+
+    def __init__(
+        self,
+        schedule: ScheduleConfig = None,
+        client_factory: Callable = None,
+        resorts_path: str = "config/resorts.yaml",
+        max_workers: int = None
+    ):
+        self.schedule = schedule or load_schedule_config()
+        unknown = set(self.schedule.resources) - set(RESORT_CATEGORIES)
+        if unknown:
+            raise ValueError(f"Unknown categories in schedule: {sorted(unknown)}")
+
+        self.client_factory = client_factory
+        self.resorts_path = resorts_path
+        self.max_workers = max_workers or self.schedule.workers
+
+        self._heap = []  # (due, seq, category, resort name)
+        self._seq = itertools.count()
+        self._scheduled: Dict[Job, float] = {}
+        self._in_flight = set()
+        self._failures: Dict[Job, int] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._local = threading.local()
+        self._resorts = None
+
+        self.stats = {"fetched": 0, "failed": 0}
+
+    def _push(self, job: Job, due: float):
+        self._scheduled[job] = due
+        heapq.heappush(self._heap, (due, next(self._seq), *job))
+
+    def _seed_due(self, job: Job, now: float) -> float:
+        """Due time for a job not seen yet: one cadence after its newest file."""
+        category, resort_name = job
+        filepath = get_latest_raw_file(category, resort_name)
+        collected = get_file_timestamp(filepath) if filepath else None
+        if collected is None:
+            return now
+
+        # File timestamps are local wall-clock times
+        every = self.schedule.resources[category].every_minutes * 60
+        return min(collected.timestamp() + every, now + every)
+
+    def sync_resorts(self):
+        """Schedule jobs for new resorts (removed ones are dropped when due)."""
+        registry = load_resort_registry(self.resorts_path)
+        if registry is self._resorts:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._resorts = registry
+            for resort in registry:
+                for category in self.schedule.resources:
+                    job = (category, resort.name)
+                    if job not in self._scheduled and job not in self._in_flight:
+                        self._push(job, self._seed_due(job, now))
+
+    def _client(self):
+        """WeatherClient for the current worker thread."""
+        client = getattr(self._local, "client", None)
+        if client is None:
+            if self.client_factory is None:
+                # Deferred so a cycle with nothing due never imports requests
+                from clients import WeatherClient
+                self.client_factory = WeatherClient
+            client = self._local.client = self.client_factory()
+        return client
+
+    def _run_job(self, job: Job) -> Tuple[dict, dict]:
+        category, resort_name = job
+        if job in self._failures:
+            metrics.inc("collection_retries_total", category=category)
+
+        resort = self._resorts.get(resort_name)
+        client = self._client()
+        _, data = fetch_resort_category(
+            category,
+            resort.name,
+            resort.location.latitude,
+            resort.location.longitude,
+            client
+        )
+        return data, client.last_response_headers
+
+    def _finish(self, job: Job, future):
+        """Reschedule a job once its fetch completes."""
+        category, resort_name = job
+        resource = self.schedule.resources[category]
+        now = time.time()
+
+        try:
+            data, headers = future.result()
+        except Exception as e:
+            failures = self._failures.get(job, 0) + 1
+            self._failures[job] = failures
+            delay = min(
+                self.schedule.retry_minutes * 2 ** (failures - 1),
+                self.schedule.max_retry_minutes
+            ) * 60
+            due = now + delay
+            outcome = "failed"
+            print(f"  ✗ {category} {resort_name}: {e} (retry in {delay / 60:.0f}m)")
+        else:
+            self._failures.pop(job, None)
+            due = next_due(category, resource, now, data, headers, self.schedule.grace_seconds)
+            outcome = "fetched"
+            print(f"  ✓ {category} {resort_name} (next in {(due - now) / 60:.0f}m)")
+
+        with self._lock:
+            self.stats[outcome] += 1
+            self._in_flight.discard(job)
+            if resort_name in self._resorts:
+                self._push(job, due)
+
+        self._wake.set()
+
+    def _pop_due(self, now: float):
+        """Remove and return the jobs due at now."""
+        due_jobs = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                due, _, category, resort_name = heapq.heappop(self._heap)
+                job = (category, resort_name)
+
+                # Stale entry, or resort removed from resorts.yaml
+                if self._scheduled.get(job) != due:
+                    continue
+                del self._scheduled[job]
+                if resort_name not in self._resorts:
+                    continue
+
+                self._in_flight.add(job)
+                due_jobs.append(job)
+
+        return due_jobs
+
+    def seconds_until_next(self) -> Optional[float]:
+        """Time until the earliest scheduled job, or None if nothing is scheduled."""
+        with self._lock:
+            if not self._heap:
+                return None
+            return max(self._heap[0][0] - time.time(), 0)
+
+    def run(self, once: bool = False):
+        """
+        Dispatch due jobs until stopped.
+
+        Args:
+            once: Only dispatch the jobs due now, wait for them, and return
+        """
+        self._stop.clear()
+        metrics_written = 0.0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while not self._stop.is_set():
+                try:
+                    self.sync_resorts()
+                except Exception as e:
+                    # Keep the last good resorts on a bad edit
+                    print(f"  ⚠ Resort config reload failed: {e}")
+
+                jobs = self._pop_due(time.time())
+                for job in jobs:
+                    future = executor.submit(self._run_job, job)
+                    future.add_done_callback(lambda f, job=job: self._finish(job, f))
+
+                if once:
+                    break
+
+                if time.time() - metrics_written >= METRICS_WRITE_SECONDS:
+                    try:
+                        metrics.write_prometheus()
+                    except OSError as e:
+                        print(f"  ⚠ Could not write metrics: {e}")
+                    metrics_written = time.time()
+
+                wait = self.seconds_until_next()
+                self._wake.clear()
+                self._wake.wait(POLL_SECONDS if wait is None else min(wait, POLL_SECONDS))
+
+    def stop(self):
+        """Stop dispatching; fetches already running finish first."""
+        self._stop.set()
+        self._wake.set()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Collect weather data on a per-endpoint schedule")
+    parser.add_argument("--once", action="store_true", help="Fetch what is due now, then exit")
+    parser.add_argument("--workers", type=int, help="Concurrent fetches")
+    parser.add_argument("--metrics-port", type=int, help="Serve Prometheus metrics on this port")
+    args = parser.parse_args()
+
+    scheduler = CollectionScheduler(max_workers=args.workers)
+    signal.signal(signal.SIGTERM, lambda *_: scheduler.stop())
+    if args.metrics_port:
+        serve_metrics(args.metrics_port)
+
+    print(f"Scheduling {', '.join(scheduler.schedule.resources)}...\n")
+    try:
+        if args.once:
+            with CycleLog("scheduler") as cycle_log:
+                scheduler.run(once=True)
+                cycle_log.fields.update(scheduler.stats)
+            print(f"\n✓ Cycle took {cycle_log.summary()}")
+        else:
+            scheduler.run()
+    except KeyboardInterrupt:
+        scheduler.stop()
+
+    print(f"\n✓ Fetched {scheduler.stats['fetched']} resources"
+          + (f" ({scheduler.stats['failed']} failed)" if scheduler.stats['failed'] else ""))
@@ -0,0 +1,154 @@
+"""
+Prefect transform flow.
+
+Runs ``dbt build`` over the data model, but only when raw data has landed
+since the last successful build, then refreshes the API snapshots. Partial
+raw files are quarantined first so one bad file can't fail the build:
+
+    python -m flows.transform            # skip if nothing new landed
+    python -m flows.transform --force
+
+The newest raw file's modification time at the last successful build is kept
+in DBT_STATE_PATH.
+"""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+from prefect import flow, task
+
+from api.snapshots import build_snapshots
+from datalake.recovery import recover_lake
+from datalake.writer import DATALAKE_ROOT
+from db import role_env
+
+DBT_PROJECT_DIR = Path(__file__).resolve().parent.parent / "db" / "data_model"
+
+# Lake watermark of the last successful dbt build
+DBT_STATE_PATH = os.getenv("DBT_STATE_PATH", "datalake/state/dbt_last_build.json")
+
+
+def newest_raw_mtime(root: str = DATALAKE_ROOT) -> Optional[float]:
+    """
+    Get the modification time of the newest raw file.
+
+    Args:
+        root: Raw data lake root
+
+    Returns:
+        Epoch seconds, or None if the lake is empty
+    """
+    newest = None
+    root = Path(root)
+    if not root.exists():
+        return None
+
+    for category_dir in root.iterdir():
+        if not category_dir.is_dir():
+            continue
+        with os.scandir(category_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json"):
+                    mtime = entry.stat().st_mtime
+                    if newest is None or mtime > newest:
+                        newest = mtime
+
+    return newest
+
+
+def _load_watermark(path: str = DBT_STATE_PATH) -> Optional[float]:
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)["newest_raw_mtime"]
+    except (FileNotFoundError, KeyError, ValueError):
+        return None
+
+
+def _save_watermark(mtime: float, path: str = DBT_STATE_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump({"newest_raw_mtime": mtime}, f)
+    os.replace(tmp_path, path)
+
+
+@task(name="recover-lake")
+def recover_raw_files() -> dict:
+    """Quarantine partial raw files landed since the last scan."""
+    return recover_lake()
+
+
+@task(name="dbt-build", tags=["dbt"], retries=1, retry_delay_seconds=60)
+def dbt_build(select: Optional[str] = None):
+    """
+    Run ``dbt build`` in the data model project.
+
+    Args:
+        select: Optional dbt node selection
+
+    Raises:
+        RuntimeError: If dbt exits with an error
+    """
+    command = ["dbt", "build", "--profiles-dir", "."]
+    if select:
+        command += ["--select", select]
+
+    # profiles.yml and dbt_project.yml use paths relative to the project;
+    # profiles.yml reads the transform role's DuckDB limits from the environment
+    env = {**os.environ, **role_env("transform")}
+    result = subprocess.run(command, cwd=DBT_PROJECT_DIR, env=env, capture_output=True, text=True)
+    print(result.stdout[-4000:])
+    if result.returncode != 0:
+        raise RuntimeError(f"dbt build failed:\n{result.stderr[-4000:] or result.stdout[-4000:]}")
+
+
+@task(name="api-snapshots")
+def build_api_snapshots() -> dict:
+    """Rebuild the resort API snapshots from the gold tables."""
+    return build_snapshots()
+
+
+@flow(name="transform")
+def transform_flow(force: bool = False, select: Optional[str] = None) -> bool:
+    """
+    Build the data model if new raw data landed.
+
+    Args:
+        force: Build even if nothing new landed
+        select: Optional dbt node selection
+
+    Returns:
+        True if dbt ran
+    """
+    newest = newest_raw_mtime()
+    last = _load_watermark()
+
+    if not force and newest is not None and last is not None and newest <= last:
+        print("  - No new raw data since the last build, skipping dbt")
+        return False
+
+    recover_raw_files()
+    dbt_build(select)
+    build_api_snapshots()
+
+    if newest is not None:
+        _save_watermark(newest)
+
+    print("✓ dbt build complete")
+    return True
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the data model when new raw data landed")
+    parser.add_argument("--force", action="store_true", help="Build even if nothing new landed")
+    parser.add_argument("--select", help="dbt node selection")
+    args = parser.parse_args()
+
+    transform_flow(force=args.force, select=args.select)
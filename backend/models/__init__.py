@@ -1,6 +1,10 @@
-"""Data models for weather data pipeline."""
+"""Data models for weather data pipeline.
 
-from .api import *
+The API models are imported on first use, so loading models.config doesn't
+build every response model.
+"""
+
+import importlib
 
 __all__ = [
     # API Models (Pydantic)
@@ -16,4 +20,20 @@ __all__ = [
     "ResortForecastSnapshot",
 ]
 
+
+def __getattr__(name):
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        value = getattr(importlib.import_module(".api", __name__), name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 # Note: Database schema is defined in db/schema.sql (raw SQL)
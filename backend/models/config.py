@@ -0,0 +1,132 @@
+"""
+Pydantic models for the YAML configuration files (see config.py).
+
+Kept apart from the loaders so reading a config doesn't import pydantic
+until something asks for a validated model.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, model_validator
+
+
+class Location(BaseModel):
+    """Geographic location."""
+    latitude: float
+    longitude: float
+
+
+class ResortMetadata(BaseModel):
+    """Additional resort metadata."""
+    full_name: str
+    region: str
+
+
+class ResortConfig(BaseModel):
+    """Single resort configuration."""
+    name: str
+    state: str
+    location: Location
+    metadata: ResortMetadata
+
+
+class ResortsConfig(BaseModel):
+    """Complete resorts configuration."""
+    resorts: List[ResortConfig]
+
+
+class RawRetention(BaseModel):
+    """Archiving policy for raw data lake files."""
+    archive_path: str = "datalake/archive"
+    archive_after_days: Dict[str, int]
+
+
+class TableRetention(BaseModel):
+    """Retention policy for a single satellite table (set exactly one field)."""
+    full_runs_days: Optional[int] = None
+    keep_days: Optional[int] = None
+    full_resolution_days: Optional[int] = None
+
+    @model_validator(mode="after")
+    def check_single_policy(self):
+        policies = [
+            self.full_runs_days,
+            self.keep_days,
+            self.full_resolution_days,
+        ]
+        if sum(p is not None for p in policies) != 1:
+            raise ValueError(
+                "Set exactly one of full_runs_days, keep_days or full_resolution_days"
+            )
+        return self
+
+    @property
+    def days(self) -> int:
+        """Age in days after which the policy applies."""
+        return next(
+            p for p in (self.full_runs_days, self.keep_days, self.full_resolution_days)
+            if p is not None
+        )
+
+
+class RetentionConfig(BaseModel):
+    """Complete retention configuration."""
+    raw: RawRetention
+    satellites: Dict[str, TableRetention]
+
+
+class DuckDBRole(BaseModel):
+    """DuckDB resource limits for one connection role."""
+    memory_limit: str
+    threads: int
+    temp_directory: Optional[str] = None
+    preserve_insertion_order: bool = True
+
+    @model_validator(mode="after")
+    def check_threads(self):
+        if self.threads < 1:
+            raise ValueError("threads must be at least 1")
+        return self
+
+    def settings(self) -> Dict[str, Any]:
+        """DuckDB settings, as passed to SET or duckdb.connect(config=...)."""
+        return self.model_dump(exclude_none=True)
+
+
+class DuckDBConfig(BaseModel):
+    """DuckDB resource limits per connection role."""
+    temp_directory: str = "data/duckdb_tmp"
+    roles: Dict[str, DuckDBRole]
+
+    def role(self, name: str) -> DuckDBRole:
+        """
+        Limits for a role, with environment overrides applied.
+
+        Any setting can be overridden with DUCKDB_<ROLE>_<SETTING>, e.g.
+        DUCKDB_TRANSFORM_MEMORY_LIMIT=8GB. A role without its own
+        temp_directory spills to <temp_directory>/<role>.
+
+        Args:
+            name: Role name (loader, transform, reader)
+
+        Returns:
+            Validated DuckDBRole
+
+        Raises:
+            ValueError: If the role isn't configured
+        """
+        if name not in self.roles:
+            raise ValueError(f"Unknown DuckDB role '{name}', expected one of: {', '.join(self.roles)}")
+
+        values = self.roles[name].model_dump()
+        if values["temp_directory"] is None:
+            values["temp_directory"] = str(Path(self.temp_directory) / name)
+
+        for setting in DuckDBRole.model_fields:
+            override = os.getenv(f"DUCKDB_{name.upper()}_{setting.upper()}")
+            if override:
+                values[setting] = override
+
+        return DuckDBRole(**values)
@@ -0,0 +1,67 @@
+"""
+Retention job: archive old raw files and thin old satellite rows.
+
+Run on a schedule (e.g. nightly cron) from the backend directory:
+
+    python retention.py             # apply policies
+    python retention.py --dry-run   # report what would be removed
+
+Policies live in config/retention.yaml. Raw files are archived first so the
+next dbt run can't re-insert satellite rows that were just thinned.
+"""
+
+import argparse
+import json
+
+from config import load_retention_config
+from datalake.retention import apply_raw_retention
+from db.retention import apply_satellite_retention, check_policies
+
+
+def run_retention(config_path: str = "config/retention.yaml", dry_run: bool = False) -> dict:
+    """
+    Apply all retention policies.
+
+    Args:
+        config_path: Path to retention.yaml
+        dry_run: Only report what would be removed
+
+    Returns:
+        Combined report with bytes reclaimed from the lake and the database
+    """
+    config = load_retention_config(config_path)
+
+    problems = check_policies(config)
+    if problems:
+        raise ValueError("Inconsistent retention policies:\n  " + "\n  ".join(problems))
+
+    print("Archiving raw files...")
+    raw_report = apply_raw_retention(config, dry_run=dry_run)
+
+    print("\nApplying satellite policies...")
+    db_report = apply_satellite_retention(config, dry_run=dry_run)
+
+    total = raw_report["bytes_reclaimed"] + db_report["bytes_reclaimed"]
+    print(f"\n✓ Reclaimed {total / 1e6:.1f} MB "
+          f"(lake {raw_report['bytes_reclaimed'] / 1e6:.1f} MB, "
+          f"database {db_report['bytes_reclaimed'] / 1e6:.1f} MB)")
+
+    return {
+        "dry_run": dry_run,
+        "raw": raw_report,
+        "database": db_report,
+        "bytes_reclaimed": total,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply data retention policies")
+    parser.add_argument("--config", default="config/retention.yaml")
+    parser.add_argument("--dry-run", action="store_true", help="Report without deleting")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = run_retention(args.config, dry_run=args.dry_run)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
@@ -0,0 +1,13 @@
+"""Local spatial lookups (stations, zones) without API calls."""
+
+from .stations import StationIndex, StationMatch, load_lake_station_index, load_station_index
+from .zones import ZoneIndex, load_zone_index
+
+__all__ = [
+    "StationIndex",
+    "StationMatch",
+    "load_lake_station_index",
+    "load_station_index",
+    "ZoneIndex",
+    "load_zone_index",
+]
@@ -0,0 +1,469 @@
+"""
+Nearest-station index over the station CSVs.
+
+Ranks stations around any point locally instead of calling /points and
+then /observationStations. Station coordinates are kept as unit vectors in
+NumPy arrays, so a query is one vectorized distance computation over the
+~870 unique stations (tens of microseconds) with no network.
+
+The CSVs list GHCND stations (ids like ``GHCND:US1MEAN0011``). NWS
+observation stations (``KPWM``), the ids /stations/{id}/observations takes,
+are indexed from the landed ``stations`` data with load_lake_station_index()
+(or from any /stations response with StationIndex.from_features()).
+
+Usage:
+    from spatial import load_lake_station_index, load_station_index
+
+    index = load_station_index()
+    index.nearest(45.0317, -70.3139, k=5)
+    index.within_radius(45.0317, -70.3139, radius_km=25, elevation_m=1200)
+
+    load_lake_station_index().nearest(45.0317, -70.3139, k=3)  # NWS ids
+"""
+
+import csv
+import json
+import math
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Backend-relative station lists; active stations win on duplicate ids
+STATION_CSVS = ["ne_weather_stations.csv", "active_stations_2023.csv"]
+ACTIVE_STATIONS_CSV = "active_stations_2023.csv"
+
+# Built index, rebuilt whenever a source CSV changes
+CACHE_PATH = os.getenv("STATION_INDEX_CACHE", "data/station_index.npz")
+
+
+class StationMatch(NamedTuple):
+    """A station returned by a query."""
+    station_id: str
+    name: str
+    state: str
+    latitude: float
+    longitude: float
+    elevation_m: float  # NaN when unknown
+    distance_km: float
+    score_km: float  # distance plus elevation penalty (ranking key)
+
+
+def _unit_vectors(latitudes, longitudes) -> np.ndarray:
+    """Convert degrees to unit vectors on the sphere, shape (n, 3)."""
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def _chord_to_km(chord) -> np.ndarray:
+    """Great-circle distance from straight-line distance between unit vectors."""
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(chord / 2, 1.0))
+
+
+class StationIndex:
+    """
+    In-memory spatial index of stations.
+
+    Args:
+        station_ids: Station identifiers
+        names: Station names
+        states: State codes
+        latitudes: Latitudes in decimal degrees
+        longitudes: Longitudes in decimal degrees
+        elevations: Elevations in meters (NaN when unknown)
+        active: Whether each station is currently reporting
+    """
+
+    def __init__(
+        self,
+        station_ids: Sequence[str],
+        names: Sequence[str],
+        states: Sequence[str],
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        elevations: Sequence[float],
+        active: Sequence[bool] = None
+    ):
+        self.station_ids = np.asarray(station_ids, dtype=str)
+        self.names = np.asarray(names, dtype=str)
+        self.states = np.asarray(states, dtype=str)
+        self.latitudes = np.asarray(latitudes, dtype=np.float64)
+        self.longitudes = np.asarray(longitudes, dtype=np.float64)
+        self.elevations = np.asarray(elevations, dtype=np.float64)
+        self.active = (
+            np.ones(len(self.station_ids), dtype=bool) if active is None
+            else np.asarray(active, dtype=bool)
+        )
+        self.vectors = _unit_vectors(self.latitudes, self.longitudes)
+
+    def __len__(self) -> int:
+        return len(self.station_ids)
+
+    # ========================================================================
+    # Construction
+    # ========================================================================
+
+    @classmethod
+    def from_csv(cls, paths: Sequence[str], active_path: Optional[str] = ACTIVE_STATIONS_CSV) -> "StationIndex":
+        """
+        Build an index from NCEI station CSVs.
+
+        Later files win when a station id appears more than once.
+
+        Args:
+            paths: CSV files with id, name, state, latitude, longitude, elevation
+            active_path: CSV whose stations are flagged active (None: all active)
+
+        Returns:
+            StationIndex
+        """
+        stations = {}
+        for path in paths:
+            with open(path, newline='') as f:
+                for row in csv.DictReader(f):
+                    stations[row["id"]] = row
+
+        active_ids = None
+        if active_path:
+            with open(active_path, newline='') as f:
+                active_ids = {row["id"] for row in csv.DictReader(f)}
+
+        rows = list(stations.values())
+        return cls(
+            station_ids=[row["id"] for row in rows],
+            names=[row["name"] for row in rows],
+            states=[row["state"] for row in rows],
+            latitudes=[float(row["latitude"]) for row in rows],
+            longitudes=[float(row["longitude"]) for row in rows],
+            elevations=[float(row["elevation"]) if row["elevation"] else np.nan for row in rows],
+            active=[active_ids is None or row["id"] in active_ids for row in rows],
+        )
+
+    @classmethod
+    def from_features(cls, features: List[dict]) -> "StationIndex":
+        """
+        Build an index from GeoJSON station features (a /stations response).
+
+        Args:
+            features: Station features with stationIdentifier and Point geometry
+
+        Returns:
+            StationIndex
+        """
+        def elevation(properties):
+            value = (properties.get("elevation") or {}).get("value")
+            return np.nan if value is None else value
+
+        return cls(
+            station_ids=[f["properties"]["stationIdentifier"] for f in features],
+            names=[f["properties"].get("name") or "" for f in features],
+            states=["" for _ in features],
+            latitudes=[f["geometry"]["coordinates"][1] for f in features],
+            longitudes=[f["geometry"]["coordinates"][0] for f in features],
+            elevations=[elevation(f["properties"]) for f in features],
+        )
+
+    @classmethod
+    def from_lake(cls) -> "StationIndex":
+        """
+        Build an index of NWS observation stations from the landed stations data.
+
+        Uses the newest file of each resort; stations listed by several
+        resorts are indexed once.
+
+        Returns:
+            StationIndex
+        """
+        from datalake.writer import _split_name, list_raw_files, load_raw_data
+
+        features, resorts = {}, set()
+        for filepath in list_raw_files("stations"):  # newest first
+            resort = _split_name(filepath)[0]
+            if resort in resorts:
+                continue
+            resorts.add(resort)
+            for feature in load_raw_data(filepath).get("features", []):
+                station_id = (feature.get("properties") or {}).get("stationIdentifier")
+                if station_id and (feature.get("geometry") or {}).get("coordinates"):
+                    features.setdefault(station_id, feature)
+
+        return cls.from_features(list(features.values()))
+
+    def save(self, path: str, signature: str = ""):
+        """
+        Save the index as a NumPy archive.
+
+        Args:
+            path: Destination .npz file
+            signature: Source fingerprint stored alongside the arrays
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            path,
+            station_ids=self.station_ids,
+            names=self.names,
+            states=self.states,
+            latitudes=self.latitudes,
+            longitudes=self.longitudes,
+            elevations=self.elevations,
+            active=self.active,
+            signature=np.array(signature),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> Tuple["StationIndex", str]:
+        """
+        Load an index saved with save().
+
+        Args:
+            path: .npz file
+
+        Returns:
+            (StationIndex, signature)
+        """
+        with np.load(path) as data:
+            index = cls(
+                station_ids=data["station_ids"],
+                names=data["names"],
+                states=data["states"],
+                latitudes=data["latitudes"],
+                longitudes=data["longitudes"],
+                elevations=data["elevations"],
+                active=data["active"],
+            )
+            return index, str(data["signature"])
+
+    # ========================================================================
+    # Queries
+    # ========================================================================
+
+    def distances_km(self, latitude: float, longitude: float) -> np.ndarray:
+        """
+        Great-circle distance from a point to every station.
+
+        Args:
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+
+        Returns:
+            Array of distances in km, aligned with station_ids
+        """
+        lat, lon = math.radians(latitude), math.radians(longitude)
+        point = np.array([math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon), math.sin(lat)])
+
+        # |a - b|^2 = 2 - 2 a.b for unit vectors
+        chord = np.sqrt(np.maximum(2 - 2 * (self.vectors @ point), 0.0))
+        return _chord_to_km(chord)
+
+    def _scores(
+        self,
+        distances: np.ndarray,
+        elevation_m: Optional[float],
+        elevation_penalty_km: float,
+        active_only: bool
+    ) -> np.ndarray:
+        """Ranking score: distance plus elevation penalty; excluded stations get inf."""
+        scores = distances
+        if elevation_m is not None and elevation_penalty_km:
+            # Stations without a known elevation are not penalized
+            difference = np.nan_to_num(np.abs(self.elevations - elevation_m))
+            scores = distances + elevation_penalty_km * difference / 100
+        if active_only:
+            scores = np.where(self.active, scores, np.inf)
+        return scores
+
+    def _matches(self, order: np.ndarray, distances: np.ndarray, scores: np.ndarray) -> List[StationMatch]:
+        """Convert station positions to StationMatch results."""
+        return [
+            StationMatch(
+                station_id=str(self.station_ids[i]),
+                name=str(self.names[i]),
+                state=str(self.states[i]),
+                latitude=float(self.latitudes[i]),
+                longitude=float(self.longitudes[i]),
+                elevation_m=float(self.elevations[i]),
+                distance_km=float(distances[i]),
+                score_km=float(scores[i]),
+            )
+            for i in order
+        ]
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 5,
+        elevation_m: Optional[float] = None,
+        elevation_penalty_km: float = 0.0,
+        active_only: bool = False
+    ) -> List[StationMatch]:
+        """
+        Get the k nearest stations to a point.
+
+        Args:
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+            k: Number of stations
+            elevation_m: Elevation of the point (enables the penalty)
+            elevation_penalty_km: Extra km of distance per 100 m of elevation difference
+            active_only: Only stations from the active stations list
+
+        Returns:
+            Stations ordered by score (nearest first)
+        """
+        distances = self.distances_km(latitude, longitude)
+        scores = self._scores(distances, elevation_m, elevation_penalty_km, active_only)
+
+        k = min(k, int(np.isfinite(scores).sum()))
+        if k <= 0:
+            return []
+
+        candidates = np.argpartition(scores, k - 1)[:k]
+        order = candidates[np.argsort(scores[candidates], kind="stable")]
+        return self._matches(order, distances, scores)
+
+    def within_radius(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        elevation_m: Optional[float] = None,
+        elevation_penalty_km: float = 0.0,
+        active_only: bool = False
+    ) -> List[StationMatch]:
+        """
+        Get every station within a radius of a point.
+
+        The radius applies to the true distance; the elevation penalty only
+        affects the order.
+
+        Args:
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+            radius_km: Search radius in km
+            elevation_m: Elevation of the point (enables the penalty)
+            elevation_penalty_km: Extra km of distance per 100 m of elevation difference
+            active_only: Only stations from the active stations list
+
+        Returns:
+            Stations ordered by score (nearest first)
+        """
+        distances = self.distances_km(latitude, longitude)
+        scores = self._scores(distances, elevation_m, elevation_penalty_km, active_only)
+
+        inside = np.flatnonzero((distances <= radius_km) & np.isfinite(scores))
+        order = inside[np.argsort(scores[inside], kind="stable")]
+        return self._matches(order, distances, scores)
+
+    def nearest_many(
+        self,
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        k: int = 5
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        k nearest stations for many points in one vectorized call.
+
+        Args:
+            latitudes: Point latitudes
+            longitudes: Point longitudes
+            k: Stations per point
+
+        Returns:
+            (positions, distances_km), both shaped (points, k); positions
+            index into station_ids
+        """
+        k = min(k, len(self))
+        points = _unit_vectors(latitudes, longitudes)
+
+        # |a - b|^2 = 2 - 2 a.b for unit vectors
+        chord = np.sqrt(np.maximum(2 - 2 * points @ self.vectors.T, 0.0))
+        distances = _chord_to_km(chord)
+
+        candidates = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        candidate_distances = np.take_along_axis(distances, candidates, axis=1)
+        order = np.argsort(candidate_distances, axis=1, kind="stable")
+
+        return (
+            np.take_along_axis(candidates, order, axis=1),
+            np.take_along_axis(candidate_distances, order, axis=1),
+        )
+
+
+def _source_signature(paths: Sequence[str]) -> str:
+    """Fingerprint of the source files (path, size, mtime)."""
+    return json.dumps([
+        [str(path), os.path.getsize(path), os.path.getmtime(path)] for path in paths
+    ])
+
+
+@lru_cache(maxsize=4)
+def _load_cached(paths: Tuple[str, ...], cache_path: str) -> StationIndex:
+    signature = _source_signature(paths)
+
+    if cache_path and Path(cache_path).exists():
+        try:
+            index, cached_signature = StationIndex.load(cache_path)
+            if cached_signature == signature:
+                return index
+        except (OSError, ValueError, KeyError):
+            pass  # Unreadable cache: rebuild
+
+    active_path = ACTIVE_STATIONS_CSV if ACTIVE_STATIONS_CSV in paths else None
+    index = StationIndex.from_csv(paths, active_path=active_path)
+    if cache_path:
+        index.save(cache_path, signature)
+    return index
+
+
+def load_station_index(
+    paths: Sequence[str] = None,
+    cache_path: str = CACHE_PATH
+) -> StationIndex:
+    """
+    Get the station index, building it from the CSVs only when they change.
+
+    The index is cached on disk (cache_path) and in memory, so repeated calls
+    are free.
+
+    Args:
+        paths: Station CSVs (defaults to STATION_CSVS)
+        cache_path: .npz cache file ("" disables the disk cache)
+
+    Returns:
+        StationIndex
+    """
+    return _load_cached(tuple(paths or STATION_CSVS), cache_path)
+
+
+_lake_index: Optional[StationIndex] = None
+_lake_signature = None
+
+
+def load_lake_station_index() -> StationIndex:
+    """
+    Get the NWS station index for the landed stations data.
+
+    Built once and reused until new stations files land.
+
+    Returns:
+        StationIndex
+    """
+    global _lake_index, _lake_signature
+    from datalake.writer import list_raw_files
+
+    files = list_raw_files("stations")
+    signature = (len(files), files[0].name if files else None)
+
+    if _lake_index is None or signature != _lake_signature:
+        _lake_index = StationIndex.from_lake()
+        _lake_signature = signature
+
+    return _lake_index
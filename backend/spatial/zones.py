@@ -0,0 +1,260 @@
+"""
+Point-in-polygon forecast zone resolver.
+
+Loads zone polygons once from landed ``zones`` data (or any GeoJSON zone
+features) and resolves lat/lon to a zone locally, instead of calling
+/points and /zones/forecast/{id}.
+
+Each zone keeps its bounding box and its polygon edges as NumPy arrays.
+Queries prefilter zones by bounding box, then run an exact even-odd ray
+casting test against the candidate zones' edges, vectorized over points:
+
+    from spatial import load_zone_index
+
+    index = load_zone_index()
+    index.resolve(45.0317, -70.3139)                  # "MEZ008"
+    index.resolve_many(latitudes, longitudes)         # one call, thousands of points
+
+Only zones present in the lake (or passed to from_features) are indexed;
+points outside every indexed zone resolve to None. The collector uses the
+index to skip /points and /zones/forecast/{id} while a resort's landed zone
+is current (see datalake.writer).
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Points tested against a zone's edges at once (bounds the points x edges matrix)
+CHUNK_SIZE = 256
+
+
+def _polygon_rings(geometry: Optional[dict]) -> List[List[List[float]]]:
+    """Get every ring (outer and holes) of a Polygon or MultiPolygon."""
+    if not geometry:
+        return []
+    if geometry["type"] == "Polygon":
+        return list(geometry["coordinates"])
+    if geometry["type"] == "MultiPolygon":
+        return [ring for polygon in geometry["coordinates"] for ring in polygon]
+    return []
+
+
+class ZoneIndex:
+    """
+    In-memory polygon index of forecast zones.
+
+    Args:
+        zones: List of (zone_id, name, geometry) with GeoJSON Polygon or
+            MultiPolygon geometries ([longitude, latitude] coordinates)
+    """
+
+    def __init__(self, zones: Sequence[Tuple[str, str, dict]]):
+        self.zone_ids: List[str] = []
+        self.names: List[str] = []
+        # Source features by zone ID (set by from_features)
+        self.features: Dict[str, dict] = {}
+        self._edges: List[Tuple[np.ndarray, ...]] = []
+        bounds = []
+
+        for zone_id, name, geometry in zones:
+            rings = [np.asarray(ring, dtype=np.float64)[:, :2] for ring in _polygon_rings(geometry)]
+            rings = [ring for ring in rings if len(ring) >= 3]
+            if not rings:
+                continue
+
+            # Edges of all rings together: the even-odd rule handles holes
+            # and multipolygon parts without tracking which ring is which
+            starts = np.concatenate(rings)
+            ends = np.concatenate([np.roll(ring, -1, axis=0) for ring in rings])
+            x1, y1 = starts[:, 0], starts[:, 1]
+            x2, y2 = ends[:, 0], ends[:, 1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                slope = (x2 - x1) / (y2 - y1)
+
+            self.zone_ids.append(zone_id)
+            self.names.append(name)
+            self._edges.append((x1, y1, y2, slope, np.minimum(y1, y2), np.maximum(y1, y2)))
+            bounds.append((starts[:, 0].min(), starts[:, 1].min(), starts[:, 0].max(), starts[:, 1].max()))
+
+        # min_lon, min_lat, max_lon, max_lat per zone
+        self.bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 4)
+
+    def __len__(self) -> int:
+        return len(self.zone_ids)
+
+    @classmethod
+    def from_features(cls, features: List[dict]) -> "ZoneIndex":
+        """
+        Build an index from GeoJSON zone features.
+
+        Args:
+            features: Zone features (e.g. /zones/forecast/{id} responses)
+
+        Returns:
+            ZoneIndex
+        """
+        index = cls([
+            (
+                feature["properties"]["id"],
+                feature["properties"].get("name") or "",
+                feature.get("geometry"),
+            )
+            for feature in features
+        ])
+        index.features = {
+            feature["properties"]["id"]: feature
+            for feature in features
+            if feature["properties"]["id"] in index.zone_ids
+        }
+        return index
+
+    @classmethod
+    def from_lake(cls) -> "ZoneIndex":
+        """
+        Build an index from the newest landed file of each zone.
+
+        Returns:
+            ZoneIndex
+        """
+        from datalake.writer import list_raw_files, load_raw_data
+
+        features = {}
+        for filepath in list_raw_files("zones"):  # newest first
+            feature = load_raw_data(filepath)
+            zone_id = feature.get("properties", {}).get("id")
+            if zone_id and zone_id not in features:
+                features[zone_id] = feature
+
+        return cls.from_features(list(features.values()))
+
+    def _contains(self, position: int, lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+        """Exact even-odd test of points against one zone."""
+        x1, y1, y2, slope, y_min, y_max = self._edges[position]
+        inside = np.zeros(len(lons), dtype=bool)
+
+        # Points sorted by latitude so each chunk covers a narrow band and
+        # only meets the edges spanning that band
+        order = np.argsort(lats, kind="stable")
+
+        for start in range(0, len(order), CHUNK_SIZE):
+            chunk = order[start:start + CHUNK_SIZE]
+            px = lons[chunk, None]
+            py = lats[chunk, None]
+
+            band = np.flatnonzero((y_max >= py[0, 0]) & (y_min <= py[-1, 0]))
+            if not len(band):
+                continue
+
+            # Edge straddles the point's latitude and crosses to its east
+            straddles = (y1[band] > py) != (y2[band] > py)
+            with np.errstate(invalid="ignore"):
+                crossing_x = x1[band] + (py - y1[band]) * slope[band]
+            crossings = np.count_nonzero(straddles & (px < crossing_x), axis=1)
+
+            inside[chunk] = crossings % 2 == 1
+
+        return inside
+
+    def resolve_many(
+        self,
+        latitudes: Sequence[float],
+        longitudes: Sequence[float]
+    ) -> List[Optional[str]]:
+        """
+        Resolve many points to zones in one vectorized call.
+
+        Args:
+            latitudes: Point latitudes
+            longitudes: Point longitudes
+
+        Returns:
+            Zone ID per point (None when outside every indexed zone; the
+            first indexed zone wins where zones overlap)
+        """
+        lats = np.asarray(latitudes, dtype=np.float64).ravel()
+        lons = np.asarray(longitudes, dtype=np.float64).ravel()
+        result = np.full(len(lats), -1, dtype=np.int64)
+
+        for position, (min_lon, min_lat, max_lon, max_lat) in enumerate(self.bounds):
+            # Bounding-box prefilter, skipping points already resolved
+            candidates = np.flatnonzero(
+                (result < 0)
+                & (lons >= min_lon) & (lons <= max_lon)
+                & (lats >= min_lat) & (lats <= max_lat)
+            )
+            if len(candidates):
+                inside = self._contains(position, lons[candidates], lats[candidates])
+                result[candidates[inside]] = position
+
+        return [self.zone_ids[i] if i >= 0 else None for i in result]
+
+    def resolve(self, latitude: float, longitude: float) -> Optional[str]:
+        """
+        Resolve a point to its zone.
+
+        Args:
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+
+        Returns:
+            Zone ID (e.g. "MEZ008"), or None when outside every indexed zone
+        """
+        return self.resolve_many([latitude], [longitude])[0]
+
+    def is_current(self, zone_id: str, now: datetime = None) -> bool:
+        """
+        Whether a zone is indexed and its geometry hasn't expired.
+
+        Args:
+            zone_id: Zone ID
+            now: Reference time (defaults to now, UTC)
+
+        Returns:
+            True if the zone's expirationDate is unset or in the future
+        """
+        feature = self.features.get(zone_id)
+        if feature is None:
+            return False
+
+        expiration = (feature.get("properties") or {}).get("expirationDate")
+        if not expiration:
+            return True
+        try:
+            expires = datetime.fromisoformat(str(expiration))
+        except ValueError:
+            return False
+        if expires.tzinfo is None:
+            expires = expires.replace(tzinfo=timezone.utc)
+        return expires > (now or datetime.now(timezone.utc))
+
+    def names_by_id(self) -> Dict[str, str]:
+        """Get zone names keyed by zone ID."""
+        return dict(zip(self.zone_ids, self.names))
+
+
+_lake_index: Optional[ZoneIndex] = None
+_lake_signature = None
+
+
+def load_zone_index() -> ZoneIndex:
+    """
+    Get the zone index for the landed zones data.
+
+    Built once and reused until new zone files land.
+
+    Returns:
+        ZoneIndex
+    """
+    global _lake_index, _lake_signature
+    from datalake.writer import list_raw_files
+
+    files = list_raw_files("zones")
+    signature = (len(files), files[0].name if files else None)
+
+    if _lake_index is None or signature != _lake_signature:
+        _lake_index = ZoneIndex.from_lake()
+        _lake_signature = signature
+
+    return _lake_index
@@ -0,0 +1,13 @@
+"""Pipeline metrics: Prometheus text output and structured per-cycle logs."""
+
+from .metrics import METRICS, Registry, endpoint_label, metrics, serve_metrics
+from .cycle import CycleLog
+
+__all__ = [
+    "METRICS",
+    "Registry",
+    "endpoint_label",
+    "metrics",
+    "serve_metrics",
+    "CycleLog",
+]
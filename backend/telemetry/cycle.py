@@ -0,0 +1,166 @@
+"""
+Structured per-cycle logs.
+
+CycleLog diffs the metrics registry across one collection cycle, appends the
+result as one JSON line to ``METRICS_PATH/cycles.jsonl`` and refreshes the
+Prometheus file:
+
+    with CycleLog("collect", shard="0/4") as cycle:
+        ...
+        cycle.fields["resorts"] = 12
+    print(cycle.summary())   # 41.2s: network 30.1s, decode 0.4s, ...
+
+A record holds the cycle's fields, its time per stage, and every counter
+and histogram that moved during it:
+
+    {"event": "cycle", "pipeline": "collect", "started_at": "...",
+     "seconds": 41.2, "outcome": "ok", "shard": "0/4", "resorts": 12,
+     "stages": {"network": 30.1, "decode": 0.4, ...},
+     "counters": {"weather_api_requests_total{endpoint=\"points\",status=\"200\"}": 12, ...},
+     "timings": {"lake_write_seconds{category=\"forecasts\"}": {"count": 12, "seconds": 0.41}, ...}}
+
+The registry is process-wide, so work done by other threads during the
+cycle (e.g. a concurrent scheduler) is included, and stage times are summed
+across threads: with several workers they can add up to more than the
+cycle's wall time.
+"""
+
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from .metrics import METRICS_PATH, Registry, metrics, series_name
+
+# Histograms summed into each stage of a cycle
+STAGES = {
+    "network": ("weather_api_request_seconds",),
+    "decode": ("weather_api_decode_seconds",),
+    "validation": ("weather_api_validate_seconds",),
+    "serialization": ("lake_dump_seconds", "lake_serialize_seconds"),
+    "disk": ("lake_write_seconds", "lake_commit_seconds", "lake_flush_seconds"),
+}
+
+
+def metrics_delta(registry: Registry, before: dict, after: dict) -> dict:
+    """
+    Counter increments and histogram observations between two snapshots.
+
+    Args:
+        registry: Registry the snapshots came from
+        before: Registry.snapshot() at the start
+        after: Registry.snapshot() at the end
+
+    Returns:
+        Dict with "counters" (series -> increment), "timings"
+        (series -> count and seconds) and "stages" (stage -> seconds)
+    """
+    counters, timings = {}, {}
+    stages = dict.fromkeys(STAGES, 0.0)
+    stage_of = {name: stage for stage, names in STAGES.items() for name in names}
+
+    for (name, labels), value in after.items():
+        kind = registry.definitions[name][0]
+        previous = before.get((name, labels))
+
+        if kind == "counter":
+            increment = value - (previous or 0)
+            if increment:
+                counters[series_name(name, labels)] = increment
+
+        elif kind == "histogram":
+            count, seconds = value
+            if previous:
+                count, seconds = count - previous[0], seconds - previous[1]
+            if not count:
+                continue
+            timings[series_name(name, labels)] = {"count": count, "seconds": round(seconds, 6)}
+            if name in stage_of:
+                stages[stage_of[name]] += seconds
+
+    return {
+        "counters": counters,
+        "timings": timings,
+        "stages": {stage: round(seconds, 3) for stage, seconds in stages.items()},
+    }
+
+
+class CycleLog:
+    """
+    Context manager recording one collection cycle.
+
+    Args:
+        pipeline: Pipeline name ("collect", "scheduler", ...)
+        registry: Registry to diff (the process-wide one by default)
+        log_path: JSON lines file (defaults to METRICS_PATH/cycles.jsonl)
+        prom_path: Prometheus file to refresh (defaults to METRICS_PATH/pipeline.prom)
+        **fields: Extra fields for the record; more can be added to
+            ``fields`` inside the with block
+    """
+
+    def __init__(
+        self,
+        pipeline: str,
+        registry: Registry = metrics,
+        log_path: Optional[str] = None,
+        prom_path: Optional[str] = None,
+        **fields
+    ):
+        self.pipeline = pipeline
+        self.registry = registry
+        self.log_path = Path(log_path or Path(METRICS_PATH) / "cycles.jsonl")
+        self.prom_path = prom_path
+        self.fields = fields
+        self.record = None
+
+    def __enter__(self):
+        self._before = self.registry.snapshot()
+        self._started_at = datetime.now(timezone.utc)
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self._started
+        outcome = "failed" if exc_type else "ok"
+
+        self.registry.inc("collection_cycles_total", pipeline=self.pipeline, outcome=outcome)
+        self.registry.set("collection_last_cycle_seconds", seconds, pipeline=self.pipeline)
+        self.registry.set("collection_last_cycle_timestamp_seconds", time.time(), pipeline=self.pipeline)
+
+        self.record = {
+            "event": "cycle",
+            "pipeline": self.pipeline,
+            "started_at": self._started_at.isoformat(),
+            "seconds": round(seconds, 3),
+            "outcome": outcome,
+            **({"error": str(exc)} if exc else {}),
+            **self.fields,
+            **metrics_delta(self.registry, self._before, self.registry.snapshot()),
+        }
+
+        # Losing metrics must not fail the collection
+        try:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_path, 'a') as f:
+                f.write(json.dumps(self.record, default=str) + "\n")
+            self.registry.write_prometheus(self.prom_path)
+        except OSError as e:
+            print(f"  ⚠ Could not write cycle metrics: {e}")
+
+        return False
+
+    def summary(self) -> str:
+        """One-line summary of the finished cycle: total time and time per stage."""
+        if self.record is None:
+            return f"{self.pipeline} cycle still running"
+
+        stages = ", ".join(f"{stage} {seconds:.1f}s" for stage, seconds in self.record["stages"].items())
+        counters = self.record["counters"]
+        requests = sum(value for series, value in counters.items()
+                       if series.startswith("weather_api_requests_total"))
+        failed = sum(value for series, value in counters.items()
+                     if series.startswith("collection_fetches_total") and 'outcome="failed"' in series)
+
+        return (f"{self.record['seconds']:.1f}s: {stages}; {requests:g} requests"
+                + (f", {failed:g} failed fetches" if failed else ""))
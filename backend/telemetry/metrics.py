@@ -0,0 +1,279 @@
+"""
+In-process pipeline metrics.
+
+Counters, gauges and histograms keyed by metric name and labels. Every
+metric is declared in METRICS, so a typo fails loudly instead of quietly
+starting a new series. The process-wide ``metrics`` registry is updated by
+the client, the lake writer and the collectors, and can be exposed as
+Prometheus text:
+
+    metrics.write_prometheus()         # data/metrics/pipeline.prom
+    serve_metrics(9108)                # GET /metrics
+
+The .prom file is meant for node_exporter's textfile collector; the endpoint
+for long-running processes like the scheduler daemon.
+"""
+
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+METRICS_PATH = os.getenv("METRICS_PATH", "data/metrics")
+
+# Seconds, from a local write (~1 ms) to a slow API request
+TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# name: (type, help, histogram buckets)
+METRICS = {
+    # Weather API (clients/weather.py)
+    "weather_api_requests_total": (
+        "counter", "Weather API requests by endpoint and HTTP status ('error' if no response)", None),
+    "weather_api_request_seconds": (
+        "histogram", "Weather API request time, network and download", TIME_BUCKETS),
+    "weather_api_response_bytes_total": (
+        "counter", "Weather API response body bytes", None),
+    "weather_api_decode_seconds": (
+        "histogram", "Weather API JSON decode time", TIME_BUCKETS),
+    "weather_api_validate_seconds": (
+        "histogram", "Pydantic validation time by response model", TIME_BUCKETS),
+    "weather_api_validation_failures_total": (
+        "counter", "Responses failing Pydantic validation by response model", None),
+
+    # Lake writes (datalake/writer.py, datalake/buffer.py)
+    "lake_dump_seconds": (
+        "histogram", "Pydantic model_dump time before a response is landed", TIME_BUCKETS),
+    "lake_serialize_seconds": (
+        "histogram", "JSON serialization time of raw lake records", TIME_BUCKETS),
+    "lake_write_seconds": (
+        "histogram", "Temp file write time of raw lake records, including fsync if not buffered", TIME_BUCKETS),
+    "lake_commit_seconds": (
+        "histogram", "Time moving raw lake files into place, including the directory fsync", TIME_BUCKETS),
+    "lake_flush_seconds": (
+        "histogram", "BufferedLakeWriter flush time: temp file syncs, moves and directory syncs", TIME_BUCKETS),
+    "lake_written_bytes_total": (
+        "counter", "Bytes written to the raw lake", None),
+    "lake_files_total": (
+        "counter", "Raw lake files by outcome (landed, or duplicate of a landed record)", None),
+
+    # Collection (datalake/writer.py, flows/)
+    "collection_fetches_total": (
+        "counter", "Category fetches by outcome (ok, failed)", None),
+    "collection_fetch_seconds": (
+        "histogram", "End-to-end time fetching and landing one category for one resort", TIME_BUCKETS),
+    "collection_cache_hits_total": (
+        "counter", "Fetches skipped because the data was reused (source: lake, index, prefect)", None),
+    "collection_retries_total": (
+        "counter", "Fetches retried after a failure", None),
+    "collection_cycles_total": (
+        "counter", "Completed collection cycles by outcome (ok, failed)", None),
+    "collection_last_cycle_seconds": (
+        "gauge", "Duration of the last collection cycle", None),
+    "collection_last_cycle_timestamp_seconds": (
+        "gauge", "Unix time the last collection cycle finished", None),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+_LABEL_ESCAPES = str.maketrans({"\\": r"\\", '"': r"\"", "\n": r"\n"})
+
+
+def _labels(labels: dict) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def series_name(name: str, labels: Labels) -> str:
+    """Prometheus series name, e.g. ``lake_files_total{category="points"}``."""
+    if not labels:
+        return name
+    pairs = ",".join(f'{key}="{value.translate(_LABEL_ESCAPES)}"' for key, value in labels)
+    return f"{name}{{{pairs}}}"
+
+
+def _format(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(int(value)) if float(value).is_integer() else repr(value)
+
+
+class Registry:
+    """
+    Thread-safe store of metric series.
+
+    Args:
+        definitions: Declared metrics, name -> (type, help, buckets)
+    """
+
+    def __init__(self, definitions: dict = METRICS):
+        self.definitions = definitions
+        self._lock = threading.Lock()
+        self._series: Dict[str, Dict[Labels, object]] = {name: {} for name in definitions}
+
+    def _check(self, name: str, kind: str):
+        declared = self.definitions.get(name)
+        if declared is None:
+            raise KeyError(f"Undeclared metric: {name}")
+        if declared[0] != kind:
+            raise TypeError(f"{name} is a {declared[0]}, not a {kind}")
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """Add to a counter."""
+        self._check(name, "counter")
+        key = _labels(labels)
+        with self._lock:
+            series = self._series[name]
+            series[key] = series.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels):
+        """Set a gauge."""
+        self._check(name, "gauge")
+        with self._lock:
+            self._series[name][_labels(labels)] = value
+
+    def observe(self, name: str, value: float, **labels):
+        """Record one histogram observation."""
+        self._check(name, "histogram")
+        buckets = self.definitions[name][2]
+        key = _labels(labels)
+        with self._lock:
+            series = self._series[name]
+            state = series.get(key)
+            if state is None:
+                # Per-bucket counts (the last is +Inf), then sum and count
+                state = series[key] = [0] * (len(buckets) + 1) + [0.0, 0]
+            state[bisect_left(buckets, value)] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """Observe the wall time of the with block, in seconds (also when it raises)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def snapshot(self) -> Dict[Tuple[str, Labels], object]:
+        """
+        Current values, for diffing (see telemetry.cycle).
+
+        Returns:
+            (name, labels) -> value for counters and gauges, and
+            (name, labels) -> (count, sum) for histograms
+        """
+        values = {}
+        with self._lock:
+            for name, series in self._series.items():
+                histogram = self.definitions[name][0] == "histogram"
+                for labels, value in series.items():
+                    values[name, labels] = (value[-1], value[-2]) if histogram else value
+        return values
+
+    def render(self) -> str:
+        """Render every series in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, (kind, help_text, buckets) in self.definitions.items():
+                series = self._series[name]
+                if not series:
+                    continue
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+
+                for labels, value in sorted(series.items()):
+                    if kind != "histogram":
+                        lines.append(f"{series_name(name, labels)} {_format(value)}")
+                        continue
+
+                    cumulative = 0
+                    for bound, count in zip(buckets + (float("inf"),), value[:-2]):
+                        cumulative += count
+                        bucket_labels = labels + (("le", _format(bound)),)
+                        lines.append(f"{series_name(name + '_bucket', bucket_labels)} {cumulative}")
+                    lines.append(f"{series_name(name + '_sum', labels)} {_format(value[-2])}")
+                    lines.append(f"{series_name(name + '_count', labels)} {value[-1]}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Optional[str] = None) -> Path:
+        """
+        Write the Prometheus text atomically, for node_exporter's textfile collector.
+
+        Args:
+            path: Output file (defaults to METRICS_PATH/pipeline.prom)
+
+        Returns:
+            Path written
+        """
+        path = Path(path or Path(METRICS_PATH) / "pipeline.prom")
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+        return path
+
+    def reset(self):
+        """Drop every series."""
+        with self._lock:
+            for series in self._series.values():
+                series.clear()
+
+
+# Process-wide registry
+metrics = Registry()
+
+
+def endpoint_label(endpoint: str) -> str:
+    """
+    Collapse an API path to a low-cardinality label.
+
+    IDs, offices and coordinates are dropped, so
+    ``/gridpoints/GYX/35,60/forecast/hourly`` becomes
+    ``gridpoints/forecast/hourly``.
+    """
+    segments = endpoint.split("?", 1)[0].strip("/").split("/")
+    return "/".join(segment for segment in segments if re.fullmatch(r"[a-z]+", segment)) or "other"
+
+
+def serve_metrics(port: int, host: str = "0.0.0.0", registry: Registry = metrics):
+    """
+    Serve ``GET /metrics`` from a background thread.
+
+    Args:
+        port: Port to listen on
+        host: Interface to bind
+        registry: Registry to expose
+
+    Returns:
+        The running ThreadingHTTPServer (call shutdown() to stop it)
+    """
+    # Only processes serving metrics pay for importing http.server
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+
+            body = registry.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
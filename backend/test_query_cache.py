@@ -0,0 +1,84 @@
+"""
+Test the query result cache (db.session.QueryCache).
+
+Runs console-style page reads against an in-memory database and checks
+that parameterized queries are cached until a table they read is bumped.
+
+Run with pytest, or directly: python test_query_cache.py
+"""
+
+import duckdb
+
+from db.browse import fetch_page
+from db.session import QueryCache, bump_table_versions
+
+
+def _connection():
+    con = duckdb.connect()
+    con.execute("CREATE TABLE resorts AS SELECT range AS id, 'resort ' || range AS name FROM range(500)")
+    return con
+
+
+def test_parameterized_page_is_cached():
+    """A repeated LIMIT ? OFFSET ? page is a hit until the table is bumped."""
+    con = _connection()
+    cache = QueryCache()
+
+    first = fetch_page(con, "main", "resorts", limit=100, offset=200, cache=cache)
+    assert cache.stats == {"hits": 0, "misses": 1, "evictions": 0}
+    assert len(cache) == 1
+
+    again = fetch_page(con, "main", "resorts", limit=100, offset=200, cache=cache)
+    assert cache.stats["hits"] == 1
+    assert again.equals(first)
+
+    # Different parameters are a different entry
+    fetch_page(con, "main", "resorts", limit=100, offset=300, cache=cache)
+    assert cache.stats["misses"] == 2
+
+    con.execute("DELETE FROM resorts WHERE id >= 250")
+    bump_table_versions(con, ["resorts"])
+
+    after = fetch_page(con, "main", "resorts", limit=100, offset=200, cache=cache)
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 3
+    assert len(after) == 50
+
+
+def test_literals_are_not_bound():
+    """Placeholders inside string literals are left alone."""
+    con = _connection()
+    cache = QueryCache()
+
+    query = "SELECT count(*) AS n FROM resorts WHERE name <> '?' AND id < $1"
+    assert cache.fetch_df(con, query, [10])["n"][0] == 10
+    assert cache.fetch_df(con, query, [10])["n"][0] == 10
+    assert cache.stats["hits"] == 1
+
+
+def main():
+    print("=" * 60)
+    print("Query Cache Test")
+    print("=" * 60)
+
+    tests = [
+        ("Parameterized page cached until bumped", test_parameterized_page_is_cached),
+        ("Literals left unbound", test_literals_are_not_bound),
+    ]
+
+    results = []
+    for name, test in tests:
+        try:
+            test()
+            print(f"✓ {name}")
+            results.append(True)
+        except AssertionError as e:
+            print(f"✗ {name}: {e}")
+            results.append(False)
+
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    return all(results)
+
+
+if __name__ == "__main__":
+    raise SystemExit(0 if main() else 1)
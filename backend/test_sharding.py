@@ -0,0 +1,211 @@
+"""
+Multi-process test of lease-based collection (datalake.sharding).
+
+Spawns collector processes against a temporary lake and lease table, with
+a stub client serving synthetic payloads instead of weather.gov, and checks:
+1. N workers sharing a cycle fetch each resort exactly once
+2. A killed worker's leases are reclaimed by another worker after the TTL
+
+Run with pytest, or directly: python test_sharding.py
+"""
+
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+CYCLE = "2025-12-30T12:00"
+
+
+class StubClient:
+    """
+    Stand-in WeatherClient answering from benchmarks.payloads.
+
+    Points and forecasts are served; stations, zones and observations fail,
+    which collection tolerates. Each completed forecast fetch is appended
+    to log_path as the resort's name, after waiting delay seconds.
+    """
+
+    BASE_URL = "https://api.weather.gov"
+
+    def __init__(self, log_path: str, delay: float = 0.0):
+        from benchmarks.payloads import points_payload
+        from config import load_resort_registry
+
+        self.log_path = log_path
+        self.delay = delay
+        self.last_response_headers = {}
+
+        self._points = {}  # (latitude, longitude) -> /points payload
+        self._resorts = {}  # forecast URL -> resort
+        for resort in load_resort_registry():
+            latitude, longitude = resort.location.latitude, resort.location.longitude
+            payload = points_payload(resort.name, latitude, longitude, resort.state)
+            self._points[(latitude, longitude)] = payload
+            self._resorts[payload["properties"]["forecast"]] = resort
+
+    def _forecast(self, points, category: str):
+        import random
+        from benchmarks.payloads import LANDED_MODELS, category_payload
+
+        resort = self._resorts[points.properties.forecast]
+        payload = category_payload(
+            category, random.Random(0), resort.name, resort.state,
+            resort.location.latitude, resort.location.longitude, datetime(2025, 12, 30, 12)
+        )
+        if category == "forecasts":
+            time.sleep(self.delay)
+            with open(self.log_path, "a") as log:
+                log.write(f"{resort.name}\n")
+        return LANDED_MODELS[category](**payload)
+
+    def get_points(self, latitude: float, longitude: float):
+        from benchmarks.payloads import LANDED_MODELS
+
+        return LANDED_MODELS["points"](**self._points[(latitude, longitude)])
+
+    def get_forecast_from_points(self, points):
+        return self._forecast(points, "forecasts")
+
+    def get_hourly_forecast_from_points(self, points):
+        return self._forecast(points, "hourly")
+
+    def get_grid_data_from_points(self, points):
+        return self._forecast(points, "grid_data")
+
+    def get_station_observation(self, station_id: str):
+        raise RuntimeError("observations are not stubbed")
+
+    def _get(self, endpoint: str, params: dict = None) -> dict:
+        raise RuntimeError(f"{endpoint} is not stubbed")
+
+
+def _collect(workdir: str, worker_id: str, ttl_seconds: float, delay: float):
+    """Run one lease-based collection cycle (in a spawned process)."""
+    # Before datalake and telemetry read them at import
+    os.environ["DATALAKE_PATH"] = str(Path(workdir) / "raw")
+    os.environ["METRICS_PATH"] = str(Path(workdir) / "metrics")
+
+    from datalake.sharding import LeaseTable
+    from datalake.writer import collect_all_resorts
+
+    client = StubClient(str(Path(workdir) / "fetches.log"), delay)
+    with LeaseTable(str(Path(workdir) / "leases.db"), worker_id=worker_id, ttl_seconds=ttl_seconds) as leases:
+        collect_all_resorts(client, leases=leases, cycle=CYCLE)
+
+
+def _spawn(workdir: str, worker_id: str, ttl_seconds: float, delay: float):
+    process = multiprocessing.get_context("spawn").Process(
+        target=_collect, args=(workdir, worker_id, ttl_seconds, delay)
+    )
+    process.start()
+    return process
+
+
+def _fetches(workdir: str) -> Counter:
+    log = Path(workdir) / "fetches.log"
+    return Counter(log.read_text().split("\n")[:-1]) if log.exists() else Counter()
+
+
+def _leases(workdir: str) -> list:
+    """(resource, owner, status, expires_at) for every lease of the cycle."""
+    path = Path(workdir) / "leases.db"
+    if not path.exists():
+        return []
+    with sqlite3.connect(str(path)) as con:
+        try:
+            return con.execute(
+                "SELECT resource, owner, status, expires_at FROM leases WHERE cycle = ?", (CYCLE,)
+            ).fetchall()
+        except sqlite3.OperationalError:
+            return []  # Worker hasn't created the table yet
+
+
+def _run(workdir: str, worker_id: str, ttl_seconds: float, delay: float = 0.0):
+    """Run one worker to completion."""
+    process = _spawn(workdir, worker_id, ttl_seconds, delay)
+    process.join(timeout=120)
+    assert process.exitcode == 0
+
+
+def _resort_names() -> list:
+    from config import load_resort_registry
+
+    return [resort.name for resort in load_resort_registry()]
+
+
+def test_workers_fetch_each_resort_once(workers: int = 3):
+    """Workers sharing a cycle split the resorts without fetching any twice."""
+    with tempfile.TemporaryDirectory() as workdir:
+        processes = [_spawn(workdir, f"worker-{i}", 30, 0.2) for i in range(workers)]
+        for process in processes:
+            process.join(timeout=120)
+            assert process.exitcode == 0
+
+        names = _resort_names()
+        assert _fetches(workdir) == Counter(names)
+
+        leases = _leases(workdir)
+        assert sorted(resource for resource, *_ in leases) == sorted(names)
+        assert {status for _, _, status, _ in leases} == {"done"}
+        # Nothing to gain from the test if one worker took everything
+        assert len({owner for _, owner, _, _ in leases}) > 1
+
+
+def test_killed_worker_leases_are_reclaimed(ttl_seconds: float = 5.0):
+    """A killed worker's lease blocks its resort until the TTL, then is reclaimed."""
+    with tempfile.TemporaryDirectory() as workdir:
+        # Hangs in its first forecast fetch, holding one lease
+        stuck = _spawn(workdir, "stuck", ttl_seconds, 600)
+        deadline = time.monotonic() + 60
+        while not _leases(workdir) and time.monotonic() < deadline:
+            time.sleep(0.1)
+        stuck.kill()
+        stuck.join()
+
+        [(held, owner, status, expires_at)] = _leases(workdir)
+        assert (owner, status) == ("stuck", "leased")
+
+        # Until it expires, the lease keeps its resort from the others
+        _run(workdir, "survivor", ttl_seconds)
+        if time.time() < expires_at:
+            assert held not in _fetches(workdir)
+            assert (held, "stuck", "leased", expires_at) in _leases(workdir)
+
+        time.sleep(max(0.0, expires_at - time.time()) + 0.1)
+        _run(workdir, "survivor", ttl_seconds)
+
+        assert _fetches(workdir) == Counter(_resort_names())
+        assert {(owner, status) for _, owner, status, _ in _leases(workdir)} == {("survivor", "done")}
+
+
+def main():
+    print("=" * 60)
+    print("Lease-Based Collection Test")
+    print("=" * 60)
+
+    tests = [
+        ("Workers fetch each resort once", test_workers_fetch_each_resort_once),
+        ("Killed worker's leases reclaimed", test_killed_worker_leases_are_reclaimed),
+    ]
+
+    results = []
+    for name, test in tests:
+        try:
+            test()
+            print(f"✓ {name}")
+            results.append(True)
+        except AssertionError as e:
+            print(f"✗ {name}: {e}")
+            results.append(False)
+
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    return all(results)
+
+
+if __name__ == "__main__":
+    raise SystemExit(0 if main() else 1)